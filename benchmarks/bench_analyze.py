@@ -0,0 +1,53 @@
+"""Five separate per-save calls vs one ``analyze`` walk.
+
+Usage: python benchmarks/bench_analyze.py [n_agents ...]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from bench_validation import synth
+
+from agent_compose_kit.compose import (
+    analyze,
+    build_system_graph,
+    get_quick_fixes,
+    lint,
+    list_dependencies,
+    load_config,
+    validate_aliases,
+)
+
+
+def best_of(fn, repeat: int = 15) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(argv: list[str]) -> None:
+    sizes = [int(a) for a in argv] or [100, 1000, 10000]
+    print(f"{'agents':>8} {'separate ms':>12} {'analyze ms':>12} {'saved':>8}")
+    for n in sizes:
+        raw = synth(n)
+        cfg = load_config(raw)
+
+        def separate() -> None:
+            list_dependencies(raw)
+            validate_aliases(raw)
+            lint(raw)
+            get_quick_fixes(raw_cfg=raw)
+            build_system_graph(cfg)
+
+        old = best_of(separate)
+        new = best_of(lambda: analyze(raw, cfg=cfg))
+        print(f"{n:>8} {old * 1000:>12.2f} {new * 1000:>12.2f} {1 - new / old:>8.0%}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,156 @@
+"""Time the public ``compose`` functions on synthetic configs of growing size.
+
+Writes machine-readable results (JSON) for tracking regressions over time and
+can compare a run against an earlier one.
+
+Usage: python benchmarks/bench_compose.py [n_agents ...] [--json PATH] [--compare BASELINE.json] [--threshold 1.25]
+
+``--json -`` writes the JSON to stdout (the table goes to stderr). With
+``--compare``, functions slower than ``threshold`` x the baseline are listed
+and the exit status is 1.
+
+The concurrent/incremental lock planners and ``apply_patch`` have dedicated
+benchmarks (``bench_lock.py``, ``bench_incremental.py``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from synth import synth_config
+
+from agent_compose_kit.compose import (
+    analyze,
+    build_system_graph,
+    export_app_config_schema,
+    fingerprint,
+    fingerprint_tree,
+    get_quick_fixes,
+    lint,
+    list_dependencies,
+    load_config,
+    load_config_file,
+    load_config_json,
+    plan_lock,
+    validate_aliases,
+)
+
+SIZES = [10, 100, 1000, 10000]
+
+
+def measure(fn: Callable[[], Any], *, budget: float = 0.5, min_repeat: int = 3, max_repeat: int = 200) -> Dict[str, Any]:
+    """Run ``fn`` repeatedly (within ``budget`` seconds, bounded by the repeat limits)."""
+    times: List[float] = []
+    start = time.perf_counter()
+    while len(times) < max_repeat and (len(times) < min_repeat or time.perf_counter() - start < budget):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return {"best_ms": min(times) * 1000, "median_ms": statistics.median(times) * 1000, "repeats": len(times)}
+
+
+def _registry(kind: str, key: str, rng: str) -> Dict[str, Any]:
+    return {"version": "1.2.3", "digest": f"sha256:{kind}-{key}"}
+
+
+def _alias(alias: str) -> Dict[str, Any]:
+    return {"model": f"provider/{alias}"}
+
+
+def cases(raw: Dict[str, Any], tmp: Path) -> List[Tuple[str, Callable[[], Any]]]:
+    import yaml
+
+    cfg = load_config(raw)
+    yaml_path = tmp / "system.yaml"
+    yaml_path.write_text(yaml.safe_dump(raw, sort_keys=False), encoding="utf-8")
+    text = json.dumps(raw)
+    return [
+        ("load_config", lambda: load_config(raw)),
+        ("load_config_file", lambda: load_config_file(yaml_path)),
+        ("load_config_json", lambda: load_config_json(text)),
+        ("build_system_graph", lambda: build_system_graph(cfg)),
+        ("get_quick_fixes", lambda: get_quick_fixes(raw_cfg=raw)),
+        ("lint", lambda: lint(raw)),
+        ("list_dependencies", lambda: list_dependencies(raw)),
+        ("validate_aliases", lambda: validate_aliases(raw)),
+        ("analyze", lambda: analyze(raw, cfg=cfg)),
+        ("fingerprint", lambda: fingerprint(raw)),
+        ("fingerprint_tree", lambda: fingerprint_tree(raw)),
+        ("plan_lock", lambda: plan_lock(raw, _registry, _alias)),
+    ]
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def run(sizes: List[int]) -> Dict[str, Any]:
+    results: List[Dict[str, Any]] = [{"function": "export_app_config_schema", "agents": None, **measure(export_app_config_schema)}]
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            raw = synth_config(n)
+            for name, fn in cases(raw, Path(tmp)):
+                results.append({"function": name, "agents": n, **measure(fn)})
+    return {
+        "suite": "compose",
+        "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Return one line per function/size at least ``threshold`` x slower than the baseline (best times)."""
+    old = {(r["function"], r["agents"]): r["best_ms"] for r in baseline.get("results", [])}
+    out = []
+    for r in report["results"]:
+        prev = old.get((r["function"], r["agents"]))
+        if prev and r["best_ms"] >= prev * threshold:
+            out.append(f"{r['function']} @ {r['agents']}: {prev:.3f} ms -> {r['best_ms']:.3f} ms ({r['best_ms'] / prev:.2f}x)")
+    return out
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("sizes", nargs="*", type=int, default=SIZES)
+    parser.add_argument("--json", dest="json_path", help="write results as JSON to PATH ('-' for stdout)")
+    parser.add_argument("--compare", help="baseline JSON from an earlier run")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    args = parser.parse_args(argv)
+
+    report = run(args.sizes)
+    table = sys.stderr if args.json_path == "-" else sys.stdout
+    print(f"{'function':<26} {'agents':>7} {'best ms':>10} {'median ms':>10} {'runs':>5}", file=table)
+    for r in report["results"]:
+        agents = "-" if r["agents"] is None else r["agents"]
+        print(f"{r['function']:<26} {agents:>7} {r['best_ms']:>10.3f} {r['median_ms']:>10.3f} {r['repeats']:>5}", file=table)
+    if args.json_path == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    elif args.json_path:
+        Path(args.json_path).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    if args.compare:
+        slower = compare(report, json.loads(Path(args.compare).read_text(encoding="utf-8")), args.threshold)
+        for line in slower:
+            print(f"REGRESSION {line}", file=table)
+        return 1 if slower else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
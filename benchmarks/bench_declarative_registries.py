@@ -0,0 +1,97 @@
+"""Declarative registries: eager vs lazy construction and indexed queries at catalog scale.
+
+Usage: python benchmarks/bench_declarative_registries.py [n_agents] [n_gets]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from agent_compose_kit.registries.agents import DeclarativeAgentRegistry
+
+
+def make_spec(n: int) -> dict:
+    agents = [
+        {
+            "id": f"agent{i}",
+            "type": "llm",
+            "name": f"agent{i}",
+            "model": "alias://fast-chat" if i % 3 else f"gpt-4o-{i % 7}",
+            "instruction": f"You are agent {i}.",
+            "output_key": f"out{i % 50}",
+            "tools": [{"kind": "mcp", "server": {"ref": {"value": f"registry://mcp/srv{i % 20}@latest"}}, "tool": "t"}],
+        }
+        for i in range(n)
+    ]
+    groups = [{"id": f"g{j}", "include": [f"agent{i}" for i in range(j, n, 100)]} for j in range(100)]
+    return {"agents": agents, "groups": groups}
+
+
+def _best(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(argv: list[str]) -> None:
+    n = int(argv[0]) if argv else 5000
+    gets = int(argv[1]) if len(argv) > 1 else 5
+    spec = make_spec(n)
+    ids = [f"agent{i}" for i in range(0, n, max(1, n // gets))][:gets]
+
+    def request(lazy: bool) -> None:
+        reg = DeclarativeAgentRegistry(spec, lazy=lazy)
+        for aid in ids:
+            reg.get(aid)
+
+    eager = _best(lambda: request(False))
+    lazy = _best(lambda: request(True))
+    full = _best(lambda: DeclarativeAgentRegistry(spec, lazy=True).validate_all())
+    print(f"{n} agents, {gets} get() calls per request")
+    print(f"  eager construct + gets  {eager * 1000:>9.1f} ms")
+    print(f"  lazy construct + gets   {lazy * 1000:>9.1f} ms  ({eager / lazy:.0f}x)")
+    print(f"  lazy validate_all       {full * 1000:>9.1f} ms")
+
+    reg = DeclarativeAgentRegistry(spec, lazy=True)
+    questions = [{"model": "alias://fast-chat"}, {"ref": "registry://mcp/srv3"}, {"output_key": "out7"}, {"group": "g5"}]
+
+    def scan() -> None:
+        for q in questions:
+            for aid in reg.list_ids():
+                a = reg._raw[aid]
+                if (
+                    a.get("model") == q.get("model")
+                    or any(t["server"]["ref"]["value"].startswith(q.get("ref", "-")) for t in a["tools"])
+                    or a.get("output_key") == q.get("output_key")
+                ):
+                    pass
+
+    build = _best(lambda: (setattr(reg, "_index", None), reg.find()), repeat=1)
+    indexed = _best(lambda: [reg.find(**q) for q in questions])
+    scanned = _best(scan)
+    print(f"  index build (1st find)  {build * 1000:>9.1f} ms")
+    print(f"  {len(questions)} queries: full scan {scanned * 1000:>9.2f} ms, indexed {indexed * 1000:.3f} ms")
+
+    # six layers of nested groups over the 100 flat groups
+    layered = dict(spec)
+    layered["groups"] = list(spec["groups"])
+    width = 100
+    for layer in range(1, 7):
+        width = max(1, width // 2)
+        layered["groups"] += [
+            {"id": f"L{layer}_{j}", "include": [{"group": f"{'g' if layer == 1 else f'L{layer - 1}_'}{k}"} for k in (2 * j, 2 * j + 1)]}
+            for j in range(width)
+        ]
+    top = f"L6_{0}"
+    nested = DeclarativeAgentRegistry(layered, lazy=True)
+    first = _best(lambda: (nested._flat.clear(), nested.get_group(top)), repeat=1)
+    again = _best(lambda: [nested.get_group(top) for _ in range(100)]) / 100
+    print(f"  6-layer get_group ({len(nested.get_group(top))} agents): first call incl. lazy validation {first * 1000:.2f} ms, later calls {again * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,43 @@
+"""fingerprint() vs fingerprint_tree() vs update_fingerprint_tree() after a one-field edit.
+
+Usage: python benchmarks/bench_fingerprint.py [n_agents ...]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from typing import Callable
+
+from bench_validation import synth
+
+from agent_compose_kit.quickfix import PatchOp, apply_ops
+from agent_compose_kit.quickfix.fingerprints import fingerprint_tree, update_fingerprint_tree
+from agent_compose_kit.quickfix.fixes import fingerprint
+
+
+def best_of(fn: Callable[[], object], repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(argv: list[str]) -> None:
+    sizes = [int(a) for a in argv] or [100, 1000, 10000]
+    print(f"{'agents':>8} {'fingerprint ms':>15} {'tree ms':>10} {'update ms':>10}")
+    for n in sizes:
+        raw = synth(n)
+        tree = fingerprint_tree(raw)
+        ops = [PatchOp(op="replace", path=f"/agents/{n // 2 + 1}/model", value="other")]
+        raw2 = apply_ops(raw, ops)
+        fp = best_of(lambda: fingerprint(raw))
+        full = best_of(lambda: fingerprint_tree(raw))
+        upd = best_of(lambda: update_fingerprint_tree(tree, raw2, ops))
+        print(f"{n:>8} {fp * 1000:>15.2f} {full * 1000:>10.2f} {upd * 1000:>10.3f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,52 @@
+"""difflib.get_close_matches vs a prebuilt FuzzyIndex for operationId suggestions.
+
+Usage: python benchmarks/bench_fuzzy.py [n_names ...]
+"""
+
+from __future__ import annotations
+
+import difflib
+import random
+import sys
+import time
+
+from agent_compose_kit.quickfix.fuzzy import FuzzyIndex
+
+VERBS = ["get", "list", "create", "update", "delete", "patch", "search", "export"]
+NOUNS = ["Pet", "Order", "User", "Invoice", "Store", "Tag", "Account", "Report", "Item", "Ticket"]
+
+
+def synth(n: int, rng: random.Random) -> list[str]:
+    out = set()
+    while len(out) < n:
+        out.add(f"{rng.choice(VERBS)}{rng.choice(NOUNS)}{rng.choice(NOUNS)}V{rng.randint(1, n)}")
+    return sorted(out)
+
+
+def typo(s: str, rng: random.Random) -> str:
+    i = rng.randrange(len(s))
+    return s[:i] + s[i + 1 :]
+
+
+def main(argv: list[str]) -> None:
+    sizes = [int(a) for a in argv] or [1000, 10000, 50000]
+    rng = random.Random(0)
+    print(f"{'names':>8} {'build ms':>9} {'difflib ms/q':>13} {'index ms/q':>11} {'speedup':>8}")
+    for n in sizes:
+        names = synth(n, rng)
+        queries = [typo(rng.choice(names), rng) for _ in range(20)]
+        t0 = time.perf_counter()
+        idx = FuzzyIndex(names)
+        build = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        expected = [difflib.get_close_matches(q, names, n=1, cutoff=0.6) for q in queries]
+        old = (time.perf_counter() - t0) / len(queries)
+        t0 = time.perf_counter()
+        got = [idx.closest(q) for q in queries]
+        new = (time.perf_counter() - t0) / len(queries)
+        assert got == [e[0] if e else None for e in expected]
+        print(f"{n:>8} {build * 1000:>9.1f} {old * 1000:>13.2f} {new * 1000:>11.2f} {old / new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
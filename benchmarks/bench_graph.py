@@ -0,0 +1,43 @@
+"""build_system_graph scaling: time per agent should stay flat as systems grow.
+
+Usage: python benchmarks/bench_graph.py [n_agents ...]
+
+Output parity with the 0.5.0 builder (apart from the shared registry nodes) is
+asserted on these configs in ``tests/test_graph_parity_v7.py``.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from agent_compose_kit.config.models import load_config
+from agent_compose_kit.graph.build import build_system_graph
+
+
+def synth(n: int) -> dict:
+    """One long sequential chain over all LLM agents, each sharing a registry sub-agent."""
+    ref = {"value": "registry://agent/helper@1.0.0"}
+    llms = [
+        {"type": "llm", "name": f"a{i}", "instruction": "i", "sub_agents": [ref], "tools": [{"kind": "builtin", "name": "google_search"}]}
+        for i in range(n)
+    ]
+    seq = {"type": "workflow.sequential", "name": "pipeline", "sub_agents": [a["name"] for a in llms] + [ref]}
+    return {"schema_version": "0.1.0", "metadata": {"name": "bench"}, "agents": llms + [seq]}
+
+
+def main(argv: list[str]) -> None:
+    sizes = [int(a) for a in argv] or [100, 1000, 10000]
+    print(f"{'agents':>8} {'ms':>10} {'us/agent':>10} {'nodes':>8} {'edges':>8}")
+    for n in sizes:
+        cfg = load_config(synth(n), discriminated=True)
+        best = float("inf")
+        for _ in range(3):
+            t0 = time.perf_counter()
+            g = build_system_graph(cfg)
+            best = min(best, time.perf_counter() - t0)
+        print(f"{n:>8} {best * 1000:>10.2f} {best * 1e6 / n:>10.2f} {len(g['nodes']):>8} {len(g['edges']):>8}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,47 @@
+"""Hot reload: rebuild after editing one shard vs a full cold load, and reader cost.
+
+Usage: python benchmarks/bench_hot_reload.py [n_shards] [agents_per_shard]
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from bench_registry_loader import write_catalog
+
+from agent_compose_kit.registries.loader import load_registry_dir
+from agent_compose_kit.registries.reload import HotReloader, ShardSource
+
+
+def main(argv: list[str]) -> None:
+    shards = int(argv[0]) if argv else 300
+    per_shard = int(argv[1]) if len(argv) > 1 else 20
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        write_catalog(root, shards, per_shard)
+        t0 = time.perf_counter()
+        load_registry_dir(root, "agents", max_workers=1)
+        cold = time.perf_counter() - t0
+        hot = HotReloader(ShardSource(root))
+        edited = root / "shard0007.yaml"
+        edited.write_text(edited.read_text().replace("agent 1 of shard 7", "agent 1 of shard 7 (edited)"))
+        t0 = time.perf_counter()
+        hot.reload()
+        reload_total = time.perf_counter() - t0
+        m = hot.metrics()
+        n = 1_000_000
+        t0 = time.perf_counter()
+        for _ in range(n):
+            hot.current
+        read = (time.perf_counter() - t0) / n
+    print(f"{shards} shards x {per_shard} agents")
+    print(f"  cold load                    {cold * 1000:>8.1f} ms")
+    print(f"  reload after 1 shard edit    {reload_total * 1000:>8.1f} ms  (rebuild {m.last_rebuild_seconds * 1000:.1f} ms, publish {m.last_publish_seconds * 1e6:.2f} us)")
+    print(f"  reader: hot.current          {read * 1e9:>8.1f} ns")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,37 @@
+"""Single-field edit: full re-validation vs IncrementalConfig.apply.
+
+Usage: python benchmarks/bench_incremental.py [n_agents ...]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from bench_validation import synth
+
+from agent_compose_kit.config.incremental import IncrementalConfig
+from agent_compose_kit.config.models import load_config
+from agent_compose_kit.quickfix import PatchOp, apply_ops
+
+
+def main(argv: list[str]) -> None:
+    sizes = [int(a) for a in argv] or [100, 2000]
+    print(f"{'agents':>8} {'full ms':>10} {'incremental ms':>15}")
+    for n in sizes:
+        raw = synth(n)
+        inc = IncrementalConfig(load_config(raw))
+        full = incr = float("inf")
+        for k in range(20):
+            ops = [PatchOp(op="replace", path=f"/agents/{n // 2 + 1}/model", value=f"m{k}")]
+            t0 = time.perf_counter()
+            load_config(apply_ops(raw, ops))
+            full = min(full, time.perf_counter() - t0)
+            t0 = time.perf_counter()
+            inc.apply(ops)
+            incr = min(incr, time.perf_counter() - t0)
+        print(f"{n:>8} {full * 1000:>10.2f} {incr * 1000:>15.3f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
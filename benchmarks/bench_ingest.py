@@ -0,0 +1,48 @@
+"""Parse + validate timings for the YAML and JSON ingestion paths.
+
+Usage: python benchmarks/bench_ingest.py [n_agents ...]
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+from typing import Callable
+
+import yaml
+from bench_validation import synth
+
+from agent_compose_kit.config.models import AppConfig, load_config, load_config_json
+
+
+def best_of(fn: Callable[[], object], repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(argv: list[str]) -> None:
+    sizes = [int(a) for a in argv] or [100, 1000]
+    for n in sizes:
+        raw = synth(n)
+        y = yaml.safe_dump(raw, sort_keys=False)
+        j = json.dumps(raw).encode("utf-8")
+        rows = {
+            "yaml SafeLoader + validate": lambda: AppConfig.model_validate(yaml.load(y, Loader=yaml.SafeLoader)),
+            "yaml load_config (libyaml)": lambda: load_config(y),
+            "json.loads + validate": lambda: AppConfig.model_validate(json.loads(j)),
+            "json model_validate_json": lambda: AppConfig.model_validate_json(j),
+            "json load_config_json": lambda: load_config_json(j),
+            "json load_config_json (tagged)": lambda: load_config_json(j, discriminated=True),
+        }
+        print(f"n={n} yaml={len(y)}B json={len(j)}B")
+        for label, fn in rows.items():
+            print(f"  {label:<30} {best_of(fn) * 1000:>9.2f} ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
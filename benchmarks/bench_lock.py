@@ -0,0 +1,59 @@
+"""plan_lock against a slow resolver: sequential vs thread pool vs asyncio.
+
+Usage: python benchmarks/bench_lock.py [n_refs] [latency_ms]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+
+from agent_compose_kit.lock import plan_lock, plan_lock_async, plan_lock_threaded
+
+
+def synth(n: int) -> dict:
+    tools = [{"kind": "mcp", "server": {"ref": {"value": f"registry://mcp/s{i}@^1"}}, "tool": "t"} for i in range(n)]
+    return {
+        "schema_version": "0.1.0",
+        "metadata": {"name": "bench"},
+        "defaults": {"model_alias": "chat"},
+        "agents": [{"type": "llm", "name": "a", "instruction": "i", "tools": tools}],
+    }
+
+
+def main(argv: list[str]) -> None:
+    n = int(argv[0]) if argv else 300
+    latency = (float(argv[1]) if len(argv) > 1 else 10.0) / 1000
+
+    def reg(kind, key, rng):
+        time.sleep(latency)
+        return {"version": "1.0.0"}
+
+    async def areg(kind, key, rng):
+        await asyncio.sleep(latency)
+        return {"version": "1.0.0"}
+
+    def alias(a):
+        return {"model": "m"}
+
+    raw = synth(n)
+    rows = []
+    t0 = time.perf_counter()
+    base = plan_lock(raw, reg, alias)
+    rows.append(("sequential", time.perf_counter() - t0))
+    for workers in (8, 32):
+        t0 = time.perf_counter()
+        assert plan_lock_threaded(raw, reg, alias, max_workers=workers) == base
+        rows.append((f"threaded x{workers}", time.perf_counter() - t0))
+    for conc in (32, 128):
+        t0 = time.perf_counter()
+        assert asyncio.run(plan_lock_async(raw, areg, alias, concurrency=conc)) == base
+        rows.append((f"async x{conc}", time.perf_counter() - t0))
+    print(f"{n} refs, {latency * 1000:g} ms per resolver call")
+    for name, sec in rows:
+        print(f"  {name:<14} {sec * 1000:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
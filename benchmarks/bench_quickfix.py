@@ -0,0 +1,39 @@
+"""get_quick_fixes scaling on a long sequential chain (per-rule timings included).
+
+Usage: python benchmarks/bench_quickfix.py [n_agents ...]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from agent_compose_kit.quickfix import get_quick_fixes
+from agent_compose_kit.quickfix.engine import default_engine
+
+
+def synth(n: int) -> dict:
+    llms = [{"type": "llm", "name": f"a{i}", "instruction": "i"} for i in range(n)]
+    seq = {"type": "workflow.sequential", "name": "pipeline", "sub_agents": [a["name"] for a in llms]}
+    return {"schema_version": "0.1.0", "metadata": {"name": "bench"}, "defaults": {"model_alias": "chat"}, "agents": llms + [seq]}
+
+
+def main(argv: list[str]) -> None:
+    sizes = [int(a) for a in argv] or [100, 1000, 10000]
+    print(f"{'agents':>8} {'ms':>10} {'us/agent':>10} {'fixes':>8}")
+    for n in sizes:
+        raw = synth(n)
+        best = float("inf")
+        for _ in range(3):
+            t0 = time.perf_counter()
+            fixes = get_quick_fixes(raw_cfg=raw)
+            best = min(best, time.perf_counter() - t0)
+        print(f"{n:>8} {best * 1000:>10.2f} {best * 1e6 / n:>10.2f} {len(fixes):>8}")
+    timings: dict = {}
+    default_engine.run(synth(sizes[-1]), timings=timings)
+    for rule, sec in sorted(timings.items(), key=lambda kv: -kv[1]):
+        print(f"  {rule:<28} {sec * 1000:>8.2f} ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,58 @@
+"""Registry disk usage: per-version config.yaml (older layout) vs content-addressed blobs.
+
+Usage: python benchmarks/bench_registry_blobs.py [n_versions] [n_distinct] [n_agents]
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from agent_compose_kit.config.models import load_config
+from agent_compose_kit.registry.blobs import BLOBS_DIR, migrate_to_blobs
+from agent_compose_kit.registry.fs import save_system
+
+
+def _cfg(label: str, n_agents: int):
+    agents = [{"name": f"a{i}", "model": "gpt-4o-mini", "instruction": f"agent {i}"} for i in range(n_agents)]
+    return load_config({"schema_version": "0.1.0", "metadata": {"name": label}, "agents": agents})
+
+
+def _usage(root: Path) -> tuple[int, int]:
+    files = [p for p in root.rglob("*") if p.is_file() and not p.name.startswith(".index")]
+    return len(files), sum(p.stat().st_size for p in files)
+
+
+def main(argv: list[str]) -> None:
+    n = int(argv[0]) if argv else 2000
+    distinct = int(argv[1]) if len(argv) > 1 else 20
+    n_agents = int(argv[2]) if len(argv) > 2 else 20
+    cfgs = [_cfg(f"label-{i}", n_agents) for i in range(distinct)]
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "reg"
+        for i in range(n):
+            save_system(cfgs[i % distinct], name="demo", version=f"1.0.{i}", root=root)
+        blob_files, blob_bytes = _usage(root)
+        # older layout: every version holds its own copy of the config
+        legacy = Path(tmp) / "legacy"
+        shutil.copytree(root, legacy)
+        for manifest in (legacy / "demo").glob("*/manifest.json"):
+            blob = json.loads(manifest.read_text())["blob"]
+            shutil.copy(legacy / BLOBS_DIR / blob[:2] / f"{blob}.yaml", manifest.parent / "config.yaml")
+        shutil.rmtree(legacy / BLOBS_DIR)
+        legacy_files, legacy_bytes = _usage(legacy)
+        t0 = time.perf_counter()
+        migrate_to_blobs(legacy)
+        migrate = time.perf_counter() - t0
+    print(f"{n} versions, {distinct} distinct configs, {n_agents} agents each")
+    print(f"  per-version copies  {legacy_files:>6} files {legacy_bytes / 1e6:>8.2f} MB")
+    print(f"  blobs               {blob_files:>6} files {blob_bytes / 1e6:>8.2f} MB  ({legacy_bytes / blob_bytes:.1f}x smaller)")
+    print(f"  migrate_to_blobs    {migrate:>8.2f}s")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
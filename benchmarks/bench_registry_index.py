@@ -0,0 +1,48 @@
+"""list_systems/list_versions: directory scan vs registry index.
+
+Usage: python benchmarks/bench_registry_index.py [n_versions] [n_systems]
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from agent_compose_kit.config.models import load_config
+from agent_compose_kit.registry.fs import list_systems, list_versions, save_system
+from agent_compose_kit.registry.index import INDEX_FILE, rebuild_index
+
+
+def listing(root: Path) -> float:
+    t0 = time.perf_counter()
+    for name in list_systems(root=root):
+        list_versions(name, root=root)
+    return time.perf_counter() - t0
+
+
+def main(argv: list[str]) -> None:
+    n = int(argv[0]) if argv else 5000
+    systems = int(argv[1]) if len(argv) > 1 else 50
+    cfg = load_config({"schema_version": "0.1.0", "metadata": {"name": "bench"}, "agents": []})
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        t0 = time.perf_counter()
+        for i in range(n):
+            save_system(cfg, name=f"sys{i % systems}", version=f"1.{i // systems}.0", root=root)
+        print(f"saved {n} versions in {systems} systems: {time.perf_counter() - t0:.2f}s (index appends included)")
+        indexed = min(listing(root) for _ in range(3))
+        (root / INDEX_FILE).rename(root / "index.bak")
+        scanned = min(listing(root) for _ in range(3))
+        (root / "index.bak").rename(root / INDEX_FILE)
+        t0 = time.perf_counter()
+        rebuild_index(root)
+        rebuild = time.perf_counter() - t0
+    print(f"  scan listing   {scanned * 1000:>9.1f} ms")
+    print(f"  index listing  {indexed * 1000:>9.1f} ms  ({scanned / indexed:.0f}x)")
+    print(f"  rebuild_index  {rebuild * 1000:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
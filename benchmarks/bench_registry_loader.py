@@ -0,0 +1,59 @@
+"""Cold start of a sharded agent catalog: one process vs a process pool.
+
+Usage: python benchmarks/bench_registry_loader.py [n_shards] [agents_per_shard] [workers]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from agent_compose_kit.registries.loader import load_registry_dir
+
+
+def write_catalog(root: Path, shards: int, per_shard: int) -> None:
+    for s in range(shards):
+        agents = [
+            {
+                "id": f"s{s}_a{i}",
+                "type": "llm",
+                "name": f"s{s}_a{i}",
+                "instruction": f"agent {i} of shard {s}",
+                "model": "alias://fast-chat",
+                "tools": [{"kind": "mcp", "server": {"ref": {"value": f"registry://mcp/srv{i % 9}@latest"}}, "tool": "t"}],
+            }
+            for i in range(per_shard)
+        ]
+        groups = [{"id": f"shard{s}", "include": [a["id"] for a in agents]}]
+        (root / f"shard{s:04d}.yaml").write_text(yaml.safe_dump({"agents": agents, "groups": groups}))
+
+
+def main(argv: list[str]) -> None:
+    shards = int(argv[0]) if argv else 300
+    per_shard = int(argv[1]) if len(argv) > 1 else 20
+    workers = int(argv[2]) if len(argv) > 2 else (os.cpu_count() or 1)
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        write_catalog(root, shards, per_shard)
+        t0 = time.perf_counter()
+        load_registry_dir(root, "agents", max_workers=1)
+        single = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        load_registry_dir(root, "agents", max_workers=max(2, workers))
+        pooled = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        load_registry_dir(root, "agents", lazy=True, max_workers=1)
+        lazy = time.perf_counter() - t0
+    print(f"{shards} shards x {per_shard} agents, {os.cpu_count()} CPU(s)")
+    print(f"  single process          {single * 1000:>8.0f} ms")
+    print(f"  process pool ({max(2, workers)} workers) {pooled * 1000:>8.0f} ms  ({single / pooled:.1f}x)")
+    print(f"  single process, lazy    {lazy * 1000:>8.0f} ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
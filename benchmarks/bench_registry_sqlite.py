@@ -0,0 +1,61 @@
+"""System registry: filesystem backend vs SQLite backend (YAML and JSON storage).
+
+Usage: python benchmarks/bench_registry_sqlite.py [n_versions] [n_systems] [n_agents]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from agent_compose_kit.config.models import load_config
+from agent_compose_kit.registry import fs
+from agent_compose_kit.registry.sqlite import SqliteRegistry
+
+
+def _cfg(n_agents: int):
+    agents = [{"name": f"a{i}", "model": "gpt-4o-mini", "instruction": f"agent {i}"} for i in range(n_agents)]
+    return load_config({"schema_version": "0.1.0", "metadata": {"name": "bench"}, "agents": agents})
+
+
+def _timed(fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def main(argv: list[str]) -> None:
+    n = int(argv[0]) if argv else 10000
+    systems = int(argv[1]) if len(argv) > 1 else 100
+    n_agents = int(argv[2]) if len(argv) > 2 else 10
+    cfg = _cfg(n_agents)
+    keys = [(f"sys{i % systems}", f"1.{i // systems}.0") for i in range(n)]
+    sample = random.Random(0).sample(keys, min(500, n))
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "fs"
+        yaml_db = SqliteRegistry(Path(tmp) / "yaml.db")
+        json_db = SqliteRegistry(Path(tmp) / "json.db", store_json=True)
+        rows = []
+        save = _timed(lambda: [fs.save_system(cfg, name=s, version=v, root=root) for s, v in keys])
+        lst = min(_timed(lambda: [fs.list_versions(s, root=root) for s in fs.list_systems(root=root)]) for _ in range(3))
+        load = min(_timed(lambda: [fs.load_system(s, v, root=root) for s, v in sample]) for _ in range(3))
+        rows.append(("fs", save, lst, load))
+        for label, reg in (("sqlite/yaml", yaml_db), ("sqlite/json", json_db)):
+            save = _timed(lambda: [reg.save_system(cfg, name=s, version=v) for s, v in keys])
+            lst = min(_timed(lambda: [reg.list_versions(s) for s in reg.list_systems()]) for _ in range(3))
+            load = min(_timed(lambda: [reg.load_system(s, v) for s, v in sample]) for _ in range(3))
+            rows.append((label, save, lst, load))
+        imported = SqliteRegistry(Path(tmp) / "imported.db")
+        imp = _timed(lambda: imported.import_fs(root))
+    print(f"{n} versions in {systems} systems, {n_agents} agents per config; load = {len(sample)} random versions")
+    print(f"  {'backend':<12} {'save':>9} {'list all':>10} {'load':>9}")
+    for label, save, lst, load in rows:
+        print(f"  {label:<12} {save:>8.2f}s {lst * 1000:>8.1f}ms {load * 1000:>7.1f}ms")
+    print(f"  import_fs    {imp:>8.2f}s")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,99 @@
+"""Overhead of the tracing hooks: disabled (default) vs undecorated vs a StatsSink.
+
+Usage: python benchmarks/bench_tracing.py [n_agents] [calls]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from synth import synth_config
+
+from agent_compose_kit import tracing
+from agent_compose_kit.compose import (
+    build_system_graph,
+    get_quick_fixes,
+    lint,
+    load_config,
+    plan_lock,
+)
+
+
+def per_call_ns(fn, calls: int) -> float:
+    best = float("inf")
+    for _ in range(5):
+        t0 = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        best = min(best, time.perf_counter() - t0)
+    return best / calls * 1e9
+
+
+def best_of(fn, repeat: int = 7) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(argv: list[str]) -> None:
+    n = int(argv[0]) if argv else 1000
+    calls = int(argv[1]) if len(argv) > 1 else 200_000
+
+    def bare() -> None:
+        pass
+
+    wrapped = tracing.traced("bench.noop")(bare)
+
+    def with_span() -> None:
+        with tracing.span("bench.noop"):
+            pass
+
+    print(f"per call, tracing disabled ({calls} calls)")
+    base = per_call_ns(bare, calls)
+    print(f"  plain call           {base:>8.1f} ns")
+    print(f"  @traced wrapper      {per_call_ns(wrapped, calls):>8.1f} ns")
+    print(f"  with span(...)       {per_call_ns(with_span, calls):>8.1f} ns")
+
+    raw = synth_config(n)
+    resolve = (lambda kind, key, rng: {"version": "1.0.0"}, lambda alias: {"model": "m"})
+
+    def pipeline(load=load_config, graph=build_system_graph, fixes=get_quick_fixes, lint_=lint, lock=plan_lock) -> None:
+        cfg = load(raw)
+        graph(cfg)
+        fixes(raw_cfg=raw)
+        lint_(raw)
+        lock(raw, *resolve)
+
+    def undecorated() -> None:
+        # top-level calls only; nested facade calls (e.g. lint -> analyze) still pass their wrappers
+        pipeline(*(f.__wrapped__ for f in (load_config, build_system_graph, get_quick_fixes, lint, plan_lock)))
+
+    plain = best_of(undecorated, 15)
+    disabled = best_of(pipeline, 15)
+    spans: list = []
+    with tracing.use_sink(tracing.CallbackSink(spans.append)):
+        pipeline()
+    wrapper_ns = per_call_ns(wrapped, calls) - base
+    stats = tracing.StatsSink()
+    with tracing.use_sink(stats):
+        enabled = best_of(pipeline)
+    print(f"\nload -> graph -> quick fixes -> lint -> lock, {n} agents")
+    print(f"  undecorated          {plain * 1000:>8.2f} ms")
+    print(f"  tracing disabled     {disabled * 1000:>8.2f} ms  ({disabled / plain - 1:+.2%})")
+    print(f"  StatsSink enabled    {enabled * 1000:>8.2f} ms  ({enabled / plain - 1:+.2%})")
+    bound = len(spans) * wrapper_ns / 1e9
+    print(f"  disabled overhead bound: {len(spans)} wrapped calls x {wrapper_ns:.0f} ns = {bound * 1e6:.1f} us ({bound / disabled:.4%})")
+    print("\nwhere the time goes (StatsSink, all runs)")
+    for name, s in stats.spans().items():
+        print(f"  {name:<28} {s.calls:>4} calls {s.total_seconds * 1000:>10.2f} ms")
+    rules = {dict(attrs)["rule"]: v for (name, attrs), v in stats.counters().items() if name == "quickfix.rule.seconds"}
+    for rule, sec in sorted(rules.items(), key=lambda kv: -kv[1])[:5]:
+        print(f"  rule {rule:<23} {sec * 1000:>20.2f} ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
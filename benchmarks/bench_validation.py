@@ -0,0 +1,56 @@
+"""Compare AppConfig validation throughput: plain unions vs discriminated mode.
+
+Usage: python benchmarks/bench_validation.py [n_agents ...]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from agent_compose_kit.config.models import load_config
+
+
+def synth(n: int) -> dict:
+    agents = []
+    for i in range(n):
+        if i % 5 == 4:
+            agents.append({"type": "workflow.sequential", "name": f"seq{i}", "sub_agents": [f"a{i - 2}", f"a{i - 1}"]})
+            continue
+        agents.append(
+            {
+                "type": "llm",
+                "name": f"a{i}",
+                "instruction": "do the thing",
+                "model": "alias://chat-default",
+                "tools": [
+                    {"kind": "function", "function": {"import": "pkg.mod:fn"}},
+                    {"kind": "openapi", "spec": {"ref": {"value": "registry://openapi/petstore@1"}}, "operationId": "getPet"},
+                    {"kind": "builtin", "name": "google_search"},
+                ],
+            }
+        )
+    return {"schema_version": "0.1.0", "metadata": {"name": "bench"}, "agents": agents}
+
+
+def bench(n: int, *, discriminated: bool, repeat: int = 5) -> float:
+    raw = synth(n)
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        load_config(raw, discriminated=discriminated)
+        best = min(best, time.perf_counter() - t0)
+    return n / best
+
+
+def main(argv: list[str]) -> None:
+    sizes = [int(a) for a in argv] or [100, 2000]
+    print(f"{'agents':>8} {'union agents/s':>16} {'tagged agents/s':>16} {'speedup':>8}")
+    for n in sizes:
+        old = bench(n, discriminated=False)
+        new = bench(n, discriminated=True)
+        print(f"{n:>8} {old:>16.0f} {new:>16.0f} {new / old:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
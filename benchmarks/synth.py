@@ -0,0 +1,145 @@
+"""Synthetic, realistic ``AppConfig`` generator for benchmarks.
+
+``synth_config(n)`` returns a raw config dict with exactly ``n`` agents: mostly
+LLM agents with a mix of tools (function, MCP, OpenAPI, built-in, agent tools
+and toolsets), model aliases and ``registry://`` refs, grouped into nested
+sequential/parallel/loop workflow trees. Output is deterministic for a given
+``seed``.
+
+Usage: python benchmarks/synth.py [n_agents] [seed] > system.yaml
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+from typing import Any, Dict, List
+
+WORKFLOWS = ("workflow.sequential", "workflow.parallel", "workflow.loop")
+BUILTINS = ("google_search", "url_context", "code_execution", "vertex_ai_search")
+# (tool kind, weight)
+TOOL_MIX = (("function", 4), ("mcp", 3), ("openapi", 3), ("builtin", 2), ("agent", 1), ("mcp_toolset", 1), ("openapi_toolset", 1))
+RANGES = ("^1", "~1.2", ">=2.0", "1.4.0", "latest")
+
+
+def _ref(rng: random.Random, kind: str, keys: int) -> Dict[str, str]:
+    return {"value": f"registry://{kind}/{kind}-{rng.randrange(keys)}@{rng.choice(RANGES)}"}
+
+
+def _tool(rng: random.Random, kind: str, keys: int, earlier: List[str]) -> Dict[str, Any]:
+    if kind == "function":
+        if rng.random() < 0.3:
+            return {"kind": "function", "function": {"ref": _ref(rng, "function", keys)}}
+        return {"kind": "function", "function": {"import": f"tools.mod{rng.randrange(keys)}:run"}}
+    if kind == "mcp":
+        return {"kind": "mcp", "server": {"ref": _ref(rng, "mcp", keys)}, "tool": f"tool_{rng.randrange(20)}"}
+    if kind == "openapi":
+        return {"kind": "openapi", "spec": {"ref": _ref(rng, "openapi", keys)}, "operationId": f"op{rng.randrange(50)}"}
+    if kind == "builtin":
+        return {"kind": "builtin", "name": rng.choice(BUILTINS)}
+    if kind == "agent" and earlier:
+        return {"kind": "agent", "agent": rng.choice(earlier)}
+    if kind == "mcp_toolset":
+        return {"kind": "mcp_toolset", "server": {"inline": {"command": "npx", "args": ["-y", "server"]}}, "tool_filter": ["read", "list"]}
+    return {"kind": "openapi_toolset", "spec": {"ref": _ref(rng, "openapi", keys)}}
+
+
+def synth_config(
+    n_agents: int,
+    *,
+    seed: int = 0,
+    fanout: int = 4,
+    max_depth: int = 3,
+    n_aliases: int = 8,
+    registry_keys: int = 0,
+) -> Dict[str, Any]:
+    """Generate a raw config dict with exactly ``n_agents`` agents.
+
+    Every ``fanout`` agents of one tree level are wrapped in a workflow agent
+    of the next level (sequential, parallel and loop in turn) up to
+    ``max_depth`` levels, so about 1/``fanout`` of the agents are workflows.
+
+    Args:
+        n_agents: Number of agents (LLM plus workflow).
+        seed: Random seed; equal seeds give equal configs.
+        fanout: Sub-agents per workflow agent.
+        max_depth: Workflow nesting depth.
+        n_aliases: Declared model aliases (``alias://chat-<i>``).
+        registry_keys: Distinct registry keys per kind (default ``n_agents // 10``,
+            at least 4) so refs repeat the way shared servers/specs do.
+
+    Raises:
+        ValueError: If ``fanout < 2`` or ``n_aliases < 1``.
+    """
+    if fanout < 2 or n_aliases < 1:
+        raise ValueError("fanout must be >= 2 and n_aliases >= 1")
+    rng = random.Random(seed)
+    keys = registry_keys or max(4, n_agents // 10)
+    kinds = [k for k, _ in TOOL_MIX]
+    weights = [w for _, w in TOOL_MIX]
+    agents: List[Dict[str, Any]] = []
+    llm_names: List[str] = []
+    pending: List[List[str]] = [[] for _ in range(max_depth + 1)]  # names waiting for a parent, per level
+
+    def add_llm() -> None:
+        i = len(agents)
+        name = f"agent_{i}"
+        agent: Dict[str, Any] = {"type": "llm", "name": name, "instruction": f"You are agent {i}. Use your tools to answer."}
+        roll = rng.random()
+        if roll < 0.7:
+            agent["model"] = f"alias://chat-{rng.randrange(n_aliases)}"
+        elif roll < 0.9:
+            agent["model"] = rng.choice(("gemini-2.5-flash", "gpt-4o-mini", "claude-3-5-sonnet"))
+        # else: falls back to defaults.model_alias
+        agent["tools"] = [_tool(rng, k, keys, llm_names) for k in rng.choices(kinds, weights, k=rng.randrange(5))]
+        if rng.random() < 0.3:
+            agent["output_key"] = f"out_{i}"
+        if rng.random() < 0.05:
+            agent["sub_agents"] = [_ref(rng, "agent", keys)]
+        agents.append(agent)
+        llm_names.append(name)
+        pending[0].append(name)
+
+    def add_workflow(level: int) -> None:
+        i = len(agents)
+        wtype = WORKFLOWS[i % len(WORKFLOWS)]
+        agent: Dict[str, Any] = {"type": wtype, "name": f"{wtype.split('.')[1]}_{i}", "sub_agents": pending[level - 1]}
+        if wtype == "workflow.loop":
+            agent["max_iterations"] = 3
+        agents.append(agent)
+        pending[level - 1] = []
+        pending[level].append(agent["name"])
+
+    while len(agents) < n_agents:
+        level = next((lv for lv in range(1, max_depth + 1) if len(pending[lv - 1]) >= fanout), 0)
+        if level:
+            add_workflow(level)
+        else:
+            add_llm()
+
+    aliases = [
+        {"id": f"chat-{i}", "resolver": "litellm" if i % 2 else "direct", "model": f"provider/model-{i}"} for i in range(n_aliases)
+    ]
+    return {
+        "schema_version": "0.1.0",
+        "metadata": {"name": f"synthetic-{n_agents}", "labels": {"seed": str(seed)}},
+        "defaults": {"model_alias": "chat-0"},
+        "registries": {
+            "mcp": [{"ref": {"value": f"registry://mcp/mcp-{k}@^1"}} for k in range(min(keys, 8))],
+            "openapi": [{"ref": {"value": f"registry://openapi/openapi-{k}@^1"}} for k in range(min(keys, 8))],
+        },
+        "model_aliases": {"aliases": aliases},
+        "agents": agents,
+    }
+
+
+def _main(argv: List[str]) -> None:
+    import yaml
+
+    n = int(argv[0]) if argv else 100
+    seed = int(argv[1]) if len(argv) > 1 else 0
+    yaml.safe_dump(synth_config(n, seed=seed), sys.stdout, sort_keys=False)
+
+
+if __name__ == "__main__":
+    _main(sys.argv[1:])
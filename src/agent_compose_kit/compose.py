@@ -1,27 +1,55 @@
 """Unified public facade for core composer functionality (no runtime side-effects).
 
 Exports:
-- load_config, load_config_file, export_app_config_schema, AppConfig
+- load_config, load_config_file, load_config_json, load_config_bytes, export_app_config_schema,
+  AppConfig, ConfigCache
 - build_system_graph
-- get_quick_fixes, PatchOp, QuickFix
+- get_quick_fixes, PatchOp, QuickFix, apply_ops
+- IncrementalConfig, apply_patch (re-validate only patched agents)
 - fingerprint, list_dependencies, lint
+- analyze, ConfigAnalysis (all of the above from one walk)
+- fingerprint_tree, update_fingerprint_tree, FingerprintTree
 - plan_lock, LockfilePlan
+- plan_lock_threaded, plan_lock_async (concurrent resolvers)
+- plan_lock_incremental (re-resolve only changed refs/aliases)
+- ResolverCache (persistent resolver cache for plan_lock)
 """
 
 from __future__ import annotations
 
-from .config.models import AppConfig, export_app_config_schema, load_config, load_config_file
+from .config.cache import ConfigCache
+from .config.incremental import IncrementalConfig, apply_patch
+from .config.models import (
+    AppConfig,
+    export_app_config_schema,
+    load_config,
+    load_config_bytes,
+    load_config_file,
+    load_config_json,
+)
 from .graph.build import build_system_graph
-from .quickfix import QuickFix, PatchOp, get_quick_fixes
-from .quickfix.fixes import fingerprint, list_dependencies, lint
+from .lock import (
+    LockfilePlan,
+    ResolverCache,
+    plan_lock,
+    plan_lock_async,
+    plan_lock_incremental,
+    plan_lock_threaded,
+)
+from .quickfix import PatchOp, QuickFix, apply_ops, get_quick_fixes
+from .quickfix.analysis import ConfigAnalysis, analyze
+from .quickfix.fingerprints import FingerprintTree, fingerprint_tree, update_fingerprint_tree
+from .quickfix.fixes import fingerprint, lint, list_dependencies
 from .registries.aliases import validate_aliases
-from .lock import LockfilePlan, plan_lock
 
 __all__ = [
     # config
     "AppConfig",
+    "ConfigCache",
     "load_config",
     "load_config_file",
+    "load_config_json",
+    "load_config_bytes",
     "export_app_config_schema",
     # graph
     "build_system_graph",
@@ -29,11 +57,23 @@ __all__ = [
     "get_quick_fixes",
     "QuickFix",
     "PatchOp",
+    "apply_ops",
+    "IncrementalConfig",
+    "apply_patch",
     "fingerprint",
+    "fingerprint_tree",
+    "update_fingerprint_tree",
+    "FingerprintTree",
     "list_dependencies",
     "lint",
     "validate_aliases",
+    "analyze",
+    "ConfigAnalysis",
     # lock
     "LockfilePlan",
     "plan_lock",
+    "plan_lock_threaded",
+    "plan_lock_async",
+    "plan_lock_incremental",
+    "ResolverCache",
 ]
@@ -0,0 +1,143 @@
+"""Opt-in cache of validated ``AppConfig`` objects keyed on file identity.
+
+Entries are keyed by resolved path and validated against ``(mtime_ns, size)``
+from ``os.stat``; when the stat changes the file is re-read and its sha256 is
+compared before paying for parse + validation again. Content is only cached
+when the file's stat is the same before and after the read. Safe to share
+between threads of one process.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Tuple
+
+from .models import AppConfig, load_config_bytes
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+
+
+@dataclass
+class _Entry:
+    mtime_ns: int
+    size: int
+    sha256: str
+    cfg: AppConfig
+
+
+class ConfigCache:
+    """LRU cache of validated configs bounded by entry count and source bytes.
+
+    Args:
+        max_entries: Maximum number of cached files.
+        max_bytes: Maximum total size of cached source files.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, bool], _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def load(self, path: str | Path, *, discriminated: bool = False, copy: bool = False) -> AppConfig:
+        """Return the validated config for ``path``, reusing it while the file is unchanged.
+
+        Args:
+            path: Filesystem path to the YAML document.
+            discriminated: Forwarded to ``load_config_bytes``.
+            copy: Return a deep copy instead of the shared cached instance.
+
+        Returns:
+            Parsed ``AppConfig`` instance.
+
+        Raises:
+            FileNotFoundError: When the file does not exist.
+            ValueError: When the file content fails schema validation.
+        """
+        p = Path(path).resolve()
+        key = (str(p), discriminated)
+        st = os.stat(p)
+        with self._lock:
+            ent = self._entries.get(key)
+            if ent is not None and (ent.mtime_ns, ent.size) == (st.st_mtime_ns, st.st_size):
+                self._hit(key)
+                return self._out(ent.cfg, copy)
+        data = p.read_bytes()
+        after = os.stat(p)
+        # the file changed while being read: the bytes may not match either stat, so do not key them on it
+        stable = (st.st_mtime_ns, st.st_size) == (after.st_mtime_ns, after.st_size) and after.st_size == len(data)
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            ent = self._entries.get(key)
+            if ent is not None and ent.sha256 == digest:
+                if stable:
+                    # touched but unchanged: refresh stat and keep the parsed config
+                    self._bytes += len(data) - ent.size
+                    ent.mtime_ns, ent.size = st.st_mtime_ns, len(data)
+                self._hit(key)
+                return self._out(ent.cfg, copy)
+            self._misses += 1
+        cfg = load_config_bytes(data, discriminated=discriminated)
+        if not stable:
+            return self._out(cfg, copy)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.size
+            self._entries[key] = _Entry(st.st_mtime_ns, len(data), digest, cfg)
+            self._bytes += len(data)
+            self._evict()
+        return self._out(cfg, copy)
+
+    def invalidate(self, path: str | Path | None = None) -> None:
+        """Drop cached entries for ``path`` (both modes), or everything when omitted."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                self._bytes = 0
+                return
+            p = str(Path(path).resolve())
+            for key in [k for k in self._entries if k[0] == p]:
+                self._bytes -= self._entries.pop(key).size
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of hit/miss/eviction counters and current size."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+    def _hit(self, key: Tuple[str, bool]) -> None:
+        self._hits += 1
+        self._entries.move_to_end(key)
+
+    def _evict(self) -> None:
+        # keep at least the most recent entry even if it alone exceeds max_bytes
+        while len(self._entries) > 1 and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            _, ent = self._entries.popitem(last=False)
+            self._bytes -= ent.size
+            self._evictions += 1
+
+    @staticmethod
+    def _out(cfg: AppConfig, copy: bool) -> AppConfig:
+        return cfg.model_copy(deep=True) if copy else cfg
@@ -0,0 +1,177 @@
+"""Incremental re-validation of an ``AppConfig`` after JSON-Pointer patches.
+
+Only agents touched by a patch are dumped, patched and re-validated; untouched
+agents are reused as-is. The duplicate-name check runs against a name→count
+index maintained across calls, so a single-field edit costs one agent's
+validation regardless of system size. Edits outside ``/agents`` re-validate the
+top-level document (agents pass through as already-validated instances).
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any, Dict, List, Sequence
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from ..quickfix.fixes import PatchOp, apply_op_in_place, apply_ops, parse_pointer
+from ..tracing import traced
+from .models import AGENT_TYPES, Agent, AppConfig, _reloc
+
+_AGENT = TypeAdapter(Agent)
+
+
+def _dump(model: Any) -> Dict[str, Any]:
+    return model.model_dump(by_alias=True, exclude_unset=True)
+
+
+def _duplicate_error(names: List[str]) -> ValidationError:
+    return ValidationError.from_exception_data(
+        AppConfig.__name__,
+        [
+            {
+                "type": "value_error",
+                "loc": (),
+                "input": names,
+                "ctx": {"error": ValueError(f"duplicate agent names: {', '.join(sorted(names))}")},
+            }
+        ],
+    )
+
+
+class IncrementalConfig:
+    """Holds a validated ``AppConfig`` plus the indexes needed to patch it cheaply.
+
+    Args:
+        cfg: A previously validated configuration.
+    """
+
+    def __init__(self, cfg: AppConfig) -> None:
+        self._cfg = cfg
+        self._names: Dict[str, int] = {}
+        for a in cfg.agents:
+            n = getattr(a, "name", None)
+            if n:
+                self._names[n] = self._names.get(n, 0) + 1
+
+    @property
+    def cfg(self) -> AppConfig:
+        """Current validated configuration."""
+        return self._cfg
+
+    def apply(self, ops: Sequence[PatchOp]) -> AppConfig:
+        """Apply ``ops`` in order and re-validate only what they touch.
+
+        On failure the held configuration is left unchanged.
+
+        Args:
+            ops: JSON-Pointer patch operations (paths relative to the document root).
+
+        Returns:
+            The new validated ``AppConfig`` (also stored as ``cfg``).
+
+        Raises:
+            ValueError: When a path does not resolve or the result fails validation.
+        """
+        parsed = [(op, parse_pointer(op.path)) for op in ops]
+        if any(len(t) < 2 and t[:1] in ([], ["agents"]) for _, t in parsed):
+            # whole document / agent list replaced: nothing to reuse
+            return self._full(ops)
+
+        agents: List[Any] = list(self._cfg.agents)
+        removed: List[BaseModel] = []
+        pending: set[int] = set()  # positions dumped for patching (when no list ops)
+        structural = False  # agents inserted/removed/replaced: positions shifted
+        top: Dict[str, Any] | None = None
+        for op, tokens in parsed:
+            if tokens[0] != "agents":
+                if top is None:
+                    top = _dump(self._cfg)
+                    top.pop("agents", None)
+                apply_op_in_place(top, tokens, op)
+                continue
+            if len(tokens) == 2:
+                structural = True
+                if op.op != "add":
+                    old = agents[self._pos(tokens[1], agents, op)]
+                    if isinstance(old, BaseModel):
+                        removed.append(old)
+                value = copy.deepcopy(op.value)
+                apply_op_in_place(agents, tokens[1:], PatchOp(op=op.op, path=op.path, value=value))
+                continue
+            i = self._pos(tokens[1], agents, op)
+            if isinstance(agents[i], BaseModel):
+                removed.append(agents[i])
+                agents[i] = _dump(agents[i])
+                pending.add(i)
+            apply_op_in_place(agents[i], tokens[2:], op)
+
+        errors: List[Dict[str, Any]] = []
+        added: List[Any] = []
+        for i in range(len(agents)) if structural else sorted(pending):
+            a = agents[i]
+            if isinstance(a, BaseModel):
+                continue
+            tag = a.get("type") if isinstance(a, dict) else None
+            cls = AGENT_TYPES.get(tag) if isinstance(tag, str) else None
+            try:
+                # tagged entries validate against their one variant; untagged use the union
+                agents[i] = cls.model_validate(a) if cls is not None else _AGENT.validate_python(a)
+                added.append(agents[i])
+            except ValidationError as e:
+                errors.extend(_reloc(e, ("agents", i)))
+        if errors:
+            raise ValueError(str(ValidationError.from_exception_data(AppConfig.__name__, errors)))  # type: ignore[arg-type]
+
+        delta: Dict[str, int] = {}
+        for a, d in [(a, -1) for a in removed] + [(a, 1) for a in added]:
+            n = getattr(a, "name", None)
+            if n:
+                delta[n] = delta.get(n, 0) + d
+        dups = sorted(n for n, d in delta.items() if self._names.get(n, 0) + d > 1)
+        if dups:
+            raise ValueError(str(_duplicate_error(dups)))
+
+        if top is not None:
+            try:
+                cfg = AppConfig.model_validate({**top, "agents": agents})
+            except ValidationError as e:
+                raise ValueError(str(e))
+        else:
+            cfg = self._cfg.model_copy(update={"agents": agents})
+        for n, d in delta.items():
+            c = self._names.get(n, 0) + d
+            if c:
+                self._names[n] = c
+            else:
+                self._names.pop(n, None)
+        self._cfg = cfg
+        return cfg
+
+    def _full(self, ops: Sequence[PatchOp]) -> AppConfig:
+        try:
+            cfg = AppConfig.model_validate(apply_ops(_dump(self._cfg), ops))
+        except ValidationError as e:
+            raise ValueError(str(e))
+        self.__init__(cfg)  # type: ignore[misc]
+        return cfg
+
+    @staticmethod
+    def _pos(token: str, agents: List[Any], op: PatchOp) -> int:
+        try:
+            i = int(token)
+        except ValueError:
+            raise ValueError(f"patch path does not resolve: {op.path}")
+        if not 0 <= i < len(agents):
+            raise ValueError(f"patch path does not resolve: {op.path}")
+        return i
+
+
+@traced("compose.apply_patch")
+def apply_patch(cfg: AppConfig, ops: Sequence[PatchOp]) -> AppConfig:
+    """One-shot helper: patch ``cfg`` and re-validate only touched agents.
+
+    Builds the name index on every call; keep an ``IncrementalConfig`` around
+    for repeated edits to the same document.
+    """
+    return IncrementalConfig(cfg).apply(ops)
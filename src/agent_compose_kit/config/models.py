@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import re
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union
 
 import yaml
-import re
-from pydantic import BaseModel, Field, ValidationError, model_validator, field_validator
+from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
+
+from ..tracing import traced
+
+if TYPE_CHECKING:
+    from .cache import ConfigCache
 
 # =====================
 # Core reference types
@@ -701,24 +706,210 @@ class AppConfig(BaseModel):
 # =====================
 
 
-def load_config(yaml_or_dict: Union[str, Dict[str, Any]]) -> AppConfig:
+# Discriminator tables: ``type`` for agents, ``kind`` for tools. Used by the
+# discriminated validation mode and by the declarative registries.
+AGENT_TYPES: Dict[str, type[BaseModel]] = {
+    "llm": LlmAgentCfg,
+    "workflow.sequential": SequentialAgentCfg,
+    "workflow.parallel": ParallelAgentCfg,
+    "workflow.loop": LoopAgentCfg,
+    "custom": CustomAgentCfg,
+}
+
+TOOL_KINDS: Dict[str, type[BaseModel]] = {
+    "mcp": McpTool,
+    "openapi": OpenApiTool,
+    "function": FunctionTool,
+    "agent": AgentTool,
+    "openapi_toolset": OpenApiToolset,
+    "mcp_toolset": McpToolset,
+    "apihub_toolset": ApiHubToolset,
+    "builtin": BuiltInTool,
+}
+
+
+def _tag_error(loc: tuple, spec: Any, field: str, table: Dict[str, type[BaseModel]]) -> Dict[str, Any]:
+    """Return a pydantic line error for a missing or unknown discriminator tag."""
+    tag = spec.get(field) if isinstance(spec, dict) else None
+    if tag is None:
+        return {"type": "union_tag_not_found", "loc": loc, "input": spec, "ctx": {"discriminator": f"'{field}'"}}
+    return {
+        "type": "union_tag_invalid",
+        "loc": loc,
+        "input": spec,
+        "ctx": {
+            "discriminator": f"'{field}'",
+            "tag": str(tag),
+            "expected_tags": ", ".join(f"'{t}'" for t in table),
+        },
+    }
+
+
+def _reloc(err: ValidationError, loc: tuple) -> List[Dict[str, Any]]:
+    """Return ``err`` line errors re-rooted under ``loc``."""
+    out: List[Dict[str, Any]] = []
+    for d in err.errors():
+        item: Dict[str, Any] = {"type": d["type"], "loc": loc + tuple(d["loc"]), "input": d["input"]}
+        if "ctx" in d:
+            item["ctx"] = d["ctx"]
+        out.append(item)
+    return out
+
+
+def _validate_tagged(
+    spec: Any, loc: tuple, field: str, table: Dict[str, type[BaseModel]], errors: List[Dict[str, Any]]
+) -> Any:
+    """Validate ``spec`` against the single variant selected by ``spec[field]``.
+
+    Model instances pass through untouched. Errors are appended to ``errors``
+    (re-rooted under ``loc``) and ``None`` is returned.
+    """
+    if isinstance(spec, BaseModel):
+        return spec
+    tag = spec.get(field) if isinstance(spec, dict) else None
+    cls = table.get(tag) if isinstance(tag, str) else None  # lists/dicts are unhashable
+    if cls is None:
+        errors.append(_tag_error(loc, spec, field, table))
+        return None
+    if cls is LlmAgentCfg and isinstance(spec.get("tools"), list):
+        before = len(errors)
+        tools = [
+            _validate_tagged(t, loc + ("tools", j), "kind", TOOL_KINDS, errors)
+            for j, t in enumerate(spec["tools"])
+        ]
+        if len(errors) > before:
+            return None
+        spec = {**spec, "tools": tools}
+    try:
+        return cls.model_validate(spec)
+    except ValidationError as e:
+        errors.extend(_reloc(e, loc))
+        return None
+
+
+def _validate_discriminated(data: Any) -> AppConfig:
+    """Validate ``data`` dispatching agents on ``type`` and tools on ``kind``.
+
+    Each agent/tool is validated against exactly one variant instead of trying
+    every member of the ``Agent``/``Tool`` unions. Explicit ``type``/``kind``
+    tags are therefore required on every entry.
+    """
+    agents = data.get("agents") if isinstance(data, dict) else None
+    if not isinstance(agents, list):
+        return AppConfig.model_validate(data)
+    errors: List[Dict[str, Any]] = []
+    parsed = [_validate_tagged(a, ("agents", i), "type", AGENT_TYPES, errors) for i, a in enumerate(agents)]
+    if errors:
+        raise ValidationError.from_exception_data(AppConfig.__name__, errors)  # type: ignore[arg-type]
+    return AppConfig.model_validate({**data, "agents": parsed})
+
+
+# libyaml-backed loader when PyYAML was built with it; same safe semantics.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@traced("compose.load_config")
+def load_config(yaml_or_dict: Union[str, Dict[str, Any]], *, discriminated: bool = False) -> AppConfig:
+    """Load and validate an AppConfig from YAML text or a mapping.
+
+    Args:
+        yaml_or_dict: YAML document or already-parsed mapping.
+        discriminated: When true, validate each agent/tool only against the
+            variant named by its ``type``/``kind`` tag (faster, terser errors;
+            tags become required).
+
+    Returns:
+        Parsed ``AppConfig`` instance.
+
+    Raises:
+        ValueError: When the content fails schema validation.
+    """
     data: Dict[str, Any]
     if isinstance(yaml_or_dict, str):
-        data = yaml.safe_load(yaml_or_dict) or {}
+        data = yaml.load(yaml_or_dict, Loader=_YamlLoader) or {}
     else:
         data = yaml_or_dict
     try:
+        if discriminated:
+            return _validate_discriminated(data)
         return AppConfig.model_validate(data)
     except ValidationError as e:
         # Bubble up a concise error for callers; tests assert on structure
         raise ValueError(str(e))
 
 
-def load_config_file(path: Path) -> AppConfig:
-    """Load and validate an AppConfig from a YAML file.
+@traced("compose.load_config_json")
+def load_config_json(data: Union[str, bytes], *, discriminated: bool = False) -> AppConfig:
+    """Parse and validate a JSON document without going through PyYAML.
+
+    Parsing uses pydantic-core's JSON parser. ``AppConfig.model_validate_json``
+    is deliberately not used: the ``Agent``/``Tool`` smart unions are retried
+    per variant in JSON mode and measured slower than parse-then-validate
+    (see ``benchmarks/bench_ingest.py``).
+
+    Args:
+        data: JSON text or UTF-8 bytes.
+        discriminated: See ``load_config``.
+
+    Returns:
+        Parsed ``AppConfig`` instance.
+
+    Raises:
+        ValueError: When the document is not valid JSON or fails schema validation.
+    """
+    from pydantic_core import from_json
+
+    parsed = from_json(data)
+    try:
+        if discriminated:
+            return _validate_discriminated(parsed)
+        return AppConfig.model_validate(parsed)
+    except ValidationError as e:
+        raise ValueError(str(e))
+
+
+@traced("compose.load_config_bytes")
+def load_config_bytes(data: Union[str, bytes], *, discriminated: bool = False) -> AppConfig:
+    """Load an AppConfig from raw JSON or YAML content (e.g., an HTTP body).
+
+    Documents starting with ``{`` are tried as JSON first; anything else, or
+    ``{``-prefixed YAML flow mappings that are not valid JSON, goes through
+    the YAML path (libyaml loader when available).
+
+    Args:
+        data: Document text or UTF-8 bytes.
+        discriminated: See ``load_config``.
+
+    Returns:
+        Parsed ``AppConfig`` instance.
+
+    Raises:
+        ValueError: When the content fails parsing or schema validation.
+    """
+    text = data.decode("utf-8") if isinstance(data, bytes) else data
+    if text.lstrip()[:1] == "{":
+        from pydantic_core import from_json
+
+        try:
+            parsed = from_json(data)
+        except ValueError:
+            pass  # not JSON (e.g., a YAML flow mapping); fall through
+        else:
+            return load_config(parsed, discriminated=discriminated)
+    return load_config(text, discriminated=discriminated)
+
+
+@traced("compose.load_config_file")
+def load_config_file(
+    path: Path, *, discriminated: bool = False, cache: Optional["ConfigCache"] = None
+) -> AppConfig:
+    """Load and validate an AppConfig from a YAML (or JSON) file.
 
     Args:
-        path: Filesystem path to the YAML document.
+        path: Filesystem path to the YAML or JSON document.
+        discriminated: See ``load_config``.
+        cache: Optional ``ConfigCache``; when given, an unchanged file returns
+            the previously validated (shared) instance.
 
     Returns:
         Parsed ``AppConfig`` instance.
@@ -726,10 +917,12 @@ def load_config_file(path: Path) -> AppConfig:
     Raises:
         ValueError: When the file content fails schema validation.
     """
-    raw = Path(path).read_text(encoding="utf-8")
-    return load_config(raw)
+    if cache is not None:
+        return cache.load(path, discriminated=discriminated)
+    return load_config_bytes(Path(path).read_bytes(), discriminated=discriminated)
 
 
+@traced("compose.export_app_config_schema")
 def export_app_config_schema() -> dict:
     """Return JSON schema for AppConfig with ADK‑aligned agent variants."""
     return AppConfig.model_json_schema()
@@ -3,7 +3,7 @@
 Nodes
 - agent.llm | agent.workflow.sequential | agent.workflow.parallel | agent.workflow.loop | agent.custom
 - tool.function | tool.mcp | tool.openapi | tool.agent
-- registry:agent:* when referenced via RegistryRef
+- registry:agent:* when referenced via RegistryRef (one node per distinct ref)
 
 Edges
 - agent.llm -> tool.* (attached tools)
@@ -38,6 +38,7 @@ from ..config.models import (
     ApiHubToolset,
     BuiltInTool,
 )
+from ..tracing import traced
 
 
 def _agent_node_id(a: Union[LlmAgentCfg, SequentialAgentCfg, ParallelAgentCfg, LoopAgentCfg]) -> str:
@@ -79,8 +80,9 @@ def _tool_node_id(owner_id: str, idx: int, kind: str) -> str:
     return f"{owner_id}:tool:{idx}:{kind}"
 
 
+@traced("compose.build_system_graph")
 def build_system_graph(cfg: AppConfig) -> Dict[str, Any]:
-    """Build a deterministic ADK-aware graph from a config.
+    """Build a deterministic ADK-aware graph from a config in O(nodes + edges).
 
     Args:
         cfg: Parsed ``AppConfig`` instance.
@@ -94,6 +96,15 @@ def build_system_graph(cfg: AppConfig) -> Dict[str, Any]:
     nodes: List[Dict[str, Any]] = []
     edges: List[Dict[str, Any]] = []
     hints: List[str] = []
+    registry_seen: set[str] = set()
+
+    def registry_node(ref: RegistryRef) -> str:
+        # one node per distinct registry agent, however often it is referenced
+        rid = _registry_agent_id(ref)
+        if rid not in registry_seen:
+            registry_seen.add(rid)
+            nodes.append({"id": rid, "label": ref.key or "agent", "type": "agent.registry"})
+        return rid
 
     # Map local agents by name and collect nodes
     local: Dict[str, Tuple[str, Agent]] = {}
@@ -131,6 +142,9 @@ def build_system_graph(cfg: AppConfig) -> Dict[str, Any]:
             nodes.append({"id": nid, "label": name, "type": "agent.custom"})
             local[name] = (nid, ag)
 
+    # node id -> (name, agent) for O(1) lookups when walking workflow steps
+    by_node: Dict[str, Tuple[str, Agent]] = {nid: (name, ag) for name, (nid, ag) in local.items()}
+
     # Edges for LLM agents
     for name, (nid, ag) in local.items():
         if not isinstance(ag, LlmAgentCfg):
@@ -189,9 +203,7 @@ def build_system_graph(cfg: AppConfig) -> Dict[str, Any]:
                 else:
                     hints.append(f"agent '{ag.name}' references unknown sub_agent '{ref}'")
             elif isinstance(ref, RegistryRef):
-                rid = _registry_agent_id(ref)
-                nodes.append({"id": rid, "label": ref.key or "agent", "type": "agent.registry"})
-                edges.append({"source": nid, "target": rid, "type": "sub"})
+                edges.append({"source": nid, "target": registry_node(ref), "type": "sub"})
 
     # Workflow: sequential / parallel / loop
     for name, (nid, ag) in local.items():
@@ -202,31 +214,24 @@ def build_system_graph(cfg: AppConfig) -> Dict[str, Any]:
                 if isinstance(s, str) and s in local:
                     seq.append(local[s][0])
                 elif isinstance(s, RegistryRef):
-                    rid = _registry_agent_id(s)
-                    nodes.append({"id": rid, "label": s.key or "agent", "type": "agent.registry"})
-                    seq.append(rid)
+                    seq.append(registry_node(s))
                 else:
                     hints.append(f"sequential '{ag.name}' includes unknown sub_agent '{s}'")
             for i in range(len(seq) - 1):
                 edges.append({"source": seq[i], "target": seq[i + 1], "type": "flow"})
             # Hints: upstream LLM without output_key
             for i in range(len(seq) - 1):
-                src = seq[i]
-                # find agent by node id
-                for aname, (anid, aobj) in local.items():
-                    if anid == src and isinstance(aobj, LlmAgentCfg):
-                        if not getattr(aobj, "output_key", None):
-                            hints.append(
-                                f"sequential '{ag.name}' upstream agent '{aname}' has no output_key; downstream may lack inputs"
-                            )
+                up = by_node.get(seq[i])
+                if up is not None and isinstance(up[1], LlmAgentCfg) and not getattr(up[1], "output_key", None):
+                    hints.append(
+                        f"sequential '{ag.name}' upstream agent '{up[0]}' has no output_key; downstream may lack inputs"
+                    )
         elif isinstance(ag, ParallelAgentCfg):
             for s in ag.sub_agents:
                 if isinstance(s, str) and s in local:
                     edges.append({"source": nid, "target": local[s][0], "type": "flow"})
                 elif isinstance(s, RegistryRef):
-                    rid = _registry_agent_id(s)
-                    nodes.append({"id": rid, "label": s.key or "agent", "type": "agent.registry"})
-                    edges.append({"source": nid, "target": rid, "type": "flow"})
+                    edges.append({"source": nid, "target": registry_node(s), "type": "flow"})
                 else:
                     hints.append(f"parallel '{ag.name}' includes unknown sub_agent '{s}'")
         elif isinstance(ag, LoopAgentCfg):
@@ -235,9 +240,7 @@ def build_system_graph(cfg: AppConfig) -> Dict[str, Any]:
                 if isinstance(s, str) and s in local:
                     edges.append({"source": nid, "target": local[s][0], "type": "flow"})
                 elif isinstance(s, RegistryRef):
-                    rid = _registry_agent_id(s)
-                    nodes.append({"id": rid, "label": s.key or "agent", "type": "agent.registry"})
-                    edges.append({"source": nid, "target": rid, "type": "flow"})
+                    edges.append({"source": nid, "target": registry_node(s), "type": "flow"})
                 else:
                     hints.append(f"loop '{ag.name}' includes unknown sub_agent '{s}'")
         else:
@@ -247,9 +250,7 @@ def build_system_graph(cfg: AppConfig) -> Dict[str, Any]:
                 if isinstance(s, str) and s in local:
                     edges.append({"source": nid, "target": local[s][0], "type": "sub"})
                 elif isinstance(s, RegistryRef):
-                    rid = _registry_agent_id(s)
-                    nodes.append({"id": rid, "label": s.key or "agent", "type": "agent.registry"})
-                    edges.append({"source": nid, "target": rid, "type": "sub"})
+                    edges.append({"source": nid, "target": registry_node(s), "type": "sub"})
                 else:
                     hints.append(f"custom '{getattr(ag, 'name', 'custom')}' includes unknown sub_agent '{s}'")
 
@@ -3,12 +3,20 @@ from .plan import (
     AliasPin,
     LockfilePlan,
     plan_lock,
+    plan_lock_incremental,
 )
+from .cache import ResolverCache, ResolverCacheStats
+from .concurrent import plan_lock_async, plan_lock_threaded
 
 __all__ = [
     "RegistryPin",
     "AliasPin",
     "LockfilePlan",
     "plan_lock",
+    "plan_lock_incremental",
+    "plan_lock_async",
+    "plan_lock_threaded",
+    "ResolverCache",
+    "ResolverCacheStats",
 ]
 
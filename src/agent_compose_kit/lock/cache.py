@@ -0,0 +1,302 @@
+"""Persistent resolver cache for lock planning.
+
+Stores registry resolutions keyed by ``(kind, key, range)`` and alias
+resolutions keyed by alias name in a single JSON file, so repeated
+``plan_lock`` runs (e.g., in CI with the file restored between jobs) skip the
+resolvers. Entries expire after ``ttl`` seconds; an expired registry entry
+with an ``etag`` is revalidated conditionally when the resolver accepts an
+``etag`` keyword argument and answers ``{"not_modified": True}``. A corrupt
+or truncated cache file is treated as empty and rewritten on the next save.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import inspect
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class ResolverCacheStats:
+    hits: int
+    misses: int
+    revalidated: int
+    not_modified: int
+    entries: int
+
+
+def _accepts_etag(fn: Callable[..., Any]) -> bool:
+    try:
+        params = inspect.signature(fn).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(p.name == "etag" or p.kind is inspect.Parameter.VAR_KEYWORD for p in params)
+
+
+def _require_sync(fn: Callable[..., Any]) -> None:
+    if inspect.iscoroutinefunction(fn):
+        raise TypeError("ResolverCache wraps synchronous resolvers only")
+
+
+class ResolverCache:
+    """JSON-file cache in front of ``plan_lock`` resolver callbacks.
+
+    Args:
+        path: Cache file; created on ``save`` when missing.
+        ttl: Seconds before an entry must be revalidated; ``None`` never expires.
+        offline: Never call resolvers. Cached entries are returned even when
+            expired; a miss raises ``LookupError``, which ``plan_lock`` records
+            like any other resolver failure.
+        clock: Time source (seconds), mainly for tests.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        ttl: Optional[float] = 3600.0,
+        offline: bool = False,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = Path(path)
+        self.ttl = ttl
+        self.offline = offline
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._hits = 0
+        self._misses = 0
+        self._revalidated = 0
+        self._not_modified = 0
+        self._entries = self._read()
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        """Entries from the cache file; a missing, corrupt or foreign file counts as empty."""
+        try:
+            doc = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):  # missing, unreadable, truncated or not JSON
+            return {}
+        if not isinstance(doc, dict) or doc.get("version") != self.VERSION or not isinstance(doc.get("entries"), dict):
+            return {}
+        return {
+            k: e
+            for k, e in doc["entries"].items()
+            if isinstance(e, dict) and isinstance(e.get("value"), dict) and isinstance(e.get("fetched_at"), (int, float))
+        }
+
+    @staticmethod
+    def registry_key(kind: str, key: str, rng: str) -> str:
+        return f"registry:{kind}/{key}@{rng}"
+
+    @staticmethod
+    def alias_key(alias: str) -> str:
+        return f"alias:{alias}"
+
+    def registry(self, resolver: Callable[..., Dict[str, Any]]) -> Callable[[str, str, str], Dict[str, Any]]:
+        """Wrap a ``registry_resolves(kind, key, range)`` callback with this cache.
+
+        Raises:
+            TypeError: If ``resolver`` is a coroutine function.
+        """
+        _require_sync(resolver)
+        conditional = _accepts_etag(resolver)
+
+        def resolve(kind: str, key: str, rng: str) -> Dict[str, Any]:
+            return self._resolve(self.registry_key(kind, key, rng), resolver, (kind, key, rng), conditional)
+
+        return resolve
+
+    def alias(self, resolver: Callable[..., Dict[str, Any]]) -> Callable[[str], Dict[str, Any]]:
+        """Wrap an ``alias_resolves(alias)`` callback with this cache.
+
+        Raises:
+            TypeError: If ``resolver`` is a coroutine function.
+        """
+        _require_sync(resolver)
+
+        def resolve(alias: str) -> Dict[str, Any]:
+            return self._resolve(self.alias_key(alias), resolver, (alias,), False)
+
+        return resolve
+
+    def registry_many(self, resolver: Callable[[List[Any]], Dict[Any, Any]]) -> Callable[[List[Any]], Dict[Any, Any]]:
+        """Wrap a batch ``registry_resolves_many`` so only cache misses reach it.
+
+        Batch calls do not revalidate by etag: expired entries are re-resolved.
+        """
+        return self._many(resolver, lambda t: self.registry_key(*t))
+
+    def alias_many(self, resolver: Callable[[List[str]], Dict[str, Any]]) -> Callable[[List[str]], Dict[str, Any]]:
+        """Wrap a batch ``alias_resolves_many`` so only cache misses reach it."""
+        return self._many(resolver, self.alias_key)
+
+    def _many(self, resolver: Callable[[List[Any]], Dict[Any, Any]], key_of: Callable[[Any], str]) -> Callable[[List[Any]], Dict[Any, Any]]:
+        _require_sync(resolver)
+
+        def resolve(items: List[Any]) -> Dict[Any, Any]:
+            now = self._clock()
+            out: Dict[Any, Any] = {}
+            todo: List[Any] = []
+            with self._lock:
+                for item in items:
+                    ent = self._entries.get(key_of(item))
+                    if ent is not None and (self.offline or self.ttl is None or now - ent["fetched_at"] < self.ttl):
+                        self._hits += 1
+                        out[item] = dict(ent["value"])
+                    elif self.offline:
+                        self._misses += 1
+                        out[item] = LookupError(f"{key_of(item)} is not in the resolver cache (offline)")
+                    else:
+                        todo.append(item)
+            if todo:
+                got = resolver(todo) or {}
+                with self._lock:
+                    for item in todo:
+                        value = got.get(item)
+                        if item not in got or isinstance(value, BaseException):
+                            continue
+                        value = value or {}
+                        self._misses += 1
+                        self._entries[key_of(item)] = {"value": dict(value), "etag": value.get("etag"), "fetched_at": now}
+                        self._dirty = True
+                        out[item] = dict(value)
+                    out.update({item: got[item] for item in todo if item in got and item not in out})
+            return out
+
+        return resolve
+
+    def registry_async(self, resolver: Callable[..., Any]) -> Callable[[str, str, str], Awaitable[Dict[str, Any]]]:
+        """Coroutine version of ``registry`` for ``plan_lock_async``.
+
+        ``resolver`` may be an ``async def`` function or a plain callable (run
+        in a worker thread via ``asyncio.to_thread``).
+        """
+        conditional = _accepts_etag(resolver)
+
+        async def resolve(kind: str, key: str, rng: str) -> Dict[str, Any]:
+            return await self._resolve_async(self.registry_key(kind, key, rng), resolver, (kind, key, rng), conditional)
+
+        return resolve
+
+    def alias_async(self, resolver: Callable[..., Any]) -> Callable[[str], Awaitable[Dict[str, Any]]]:
+        """Coroutine version of ``alias`` for ``plan_lock_async``."""
+
+        async def resolve(alias: str) -> Dict[str, Any]:
+            return await self._resolve_async(self.alias_key(alias), resolver, (alias,), False)
+
+        return resolve
+
+    def _lookup(self, ck: str, now: float) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Return ``(cached value, None)`` on a usable hit, else ``(None, etag to revalidate)``.
+
+        Raises:
+            LookupError: On a miss in offline mode.
+        """
+        with self._lock:
+            ent = self._entries.get(ck)
+            fresh = ent is not None and (self.ttl is None or now - ent["fetched_at"] < self.ttl)
+            if ent is not None and (fresh or self.offline):
+                self._hits += 1
+                return dict(ent["value"]), None
+            if self.offline:
+                self._misses += 1
+                raise LookupError(f"{ck} is not in the resolver cache (offline)")
+            return None, ent.get("etag") if ent is not None else None
+
+    def _store(self, ck: str, value: Optional[Dict[str, Any]], now: float, revalidated: bool) -> Dict[str, Any]:
+        value = value or {}
+        with self._lock:
+            if revalidated:
+                self._revalidated += 1
+                ent = self._entries.get(ck)
+                if value.get("not_modified") and ent is not None:
+                    self._not_modified += 1
+                    ent["fetched_at"] = now
+                    self._dirty = True
+                    return dict(ent["value"])
+            else:
+                self._misses += 1
+            self._entries[ck] = {"value": dict(value), "etag": value.get("etag"), "fetched_at": now}
+            self._dirty = True
+        return dict(value)
+
+    def _resolve(self, ck: str, resolver: Callable[..., Any], args: tuple, conditional: bool) -> Dict[str, Any]:
+        now = self._clock()
+        hit, etag = self._lookup(ck, now)
+        if hit is not None:
+            return hit
+        revalidate = bool(conditional and etag)
+        value = resolver(*args, etag=etag) if revalidate else resolver(*args)
+        return self._store(ck, value, now, revalidate)
+
+    async def _resolve_async(self, ck: str, resolver: Callable[..., Any], args: tuple, conditional: bool) -> Dict[str, Any]:
+        now = self._clock()
+        hit, etag = self._lookup(ck, now)
+        if hit is not None:
+            return hit
+        revalidate = bool(conditional and etag)
+        kwargs = {"etag": etag} if revalidate else {}
+        if inspect.iscoroutinefunction(resolver):
+            value = await resolver(*args, **kwargs)
+        else:
+            value = await asyncio.to_thread(resolver, *args, **kwargs)
+            if inspect.isawaitable(value):
+                value = await value
+        return self._store(ck, value, now, revalidate)
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Drop one entry (by ``registry_key``/``alias_key``) or all entries."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+            self._dirty = True
+
+    def save(self) -> None:
+        """Atomically write the cache file if anything changed since load/save.
+
+        A failed write leaves the cache dirty, so a later ``save`` retries it.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            doc = {"version": self.VERSION, "entries": self._entries}
+            data = json.dumps(doc, sort_keys=True, separators=(",", ":"))
+            self._dirty = False  # changes made while writing mark it dirty again
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                    fh.write(data)
+                os.replace(tmp, self.path)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp)
+                raise
+        except BaseException:
+            with self._lock:
+                self._dirty = True
+            raise
+
+    def stats(self) -> ResolverCacheStats:
+        with self._lock:
+            return ResolverCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                revalidated=self._revalidated,
+                not_modified=self._not_modified,
+                entries=len(self._entries),
+            )
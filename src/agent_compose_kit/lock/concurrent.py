@@ -0,0 +1,219 @@
+"""Concurrent variants of ``plan_lock``.
+
+Both variants resolve registry refs and aliases with bounded concurrency and an
+optional per-call timeout, capture failures exactly like ``plan_lock`` (error
+string in ``RegistryPin.error``, empty ``AliasPin`` for aliases) and sort the
+pins, so the plan does not depend on the order results arrive in.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, CancelledError, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..tracing import traced
+from .cache import ResolverCache
+from .plan import (
+    AliasPin,
+    LockfilePlan,
+    RegistryPin,
+    _alias_pin,
+    _finish,
+    _plan_requests,
+    _registry_pin,
+)
+
+
+def _timeout_error(timeout: float) -> TimeoutError:
+    return TimeoutError(f"resolver timed out after {timeout:g}s")
+
+
+def _calls(
+    requests: List[Tuple[str, str, str, str]],
+    aliases: List[str],
+    registry_resolves: Callable[..., Any],
+    alias_resolves: Callable[..., Any],
+) -> List[Tuple[Callable[..., Any], Tuple[Any, ...]]]:
+    return [(registry_resolves, req[1:]) for req in requests] + [(alias_resolves, (a,)) for a in aliases]
+
+
+def _assemble(
+    bad: List[RegistryPin],
+    requests: List[Tuple[str, str, str, str]],
+    aliases: List[str],
+    results: List[Tuple[Any, Optional[BaseException]]],
+) -> LockfilePlan:
+    reg_pins = list(bad)
+    for req, (value, err) in zip(requests, results):
+        if err is not None:
+            reg_pins.append(_registry_pin(req, error=err))
+            continue
+        try:
+            reg_pins.append(_registry_pin(req, value))
+        except Exception as e:
+            reg_pins.append(_registry_pin(req, error=e))
+    alias_pins: List[AliasPin] = [
+        _alias_pin(alias, None if err is not None else value)
+        for alias, (value, err) in zip(aliases, results[len(requests) :])
+    ]
+    return _finish(reg_pins, alias_pins)
+
+
+@traced("compose.plan_lock_threaded")
+def plan_lock_threaded(
+    cfg: Any,
+    registry_resolves: Callable[[str, str, str], Dict[str, Any]],
+    alias_resolves: Callable[[str], Dict[str, Any]],
+    *,
+    max_workers: int = 8,
+    timeout: Optional[float] = None,
+    cancel: Optional[threading.Event] = None,
+    cache: Optional[ResolverCache] = None,
+) -> LockfilePlan:
+    """``plan_lock`` with synchronous resolvers run on a thread pool.
+
+    Args:
+        cfg: ``AppConfig`` instance or raw mapping.
+        registry_resolves: ``(kind, key, range) -> {version, etag?, uri?}``.
+        alias_resolves: ``alias -> {provider?, model, ...}``.
+        max_workers: Maximum number of resolver calls in flight.
+        timeout: Per-call timeout in seconds, measured from when the call
+            starts. A timed-out call is recorded as an error and abandoned
+            (threads cannot be interrupted; its worker stays busy until the
+            callback returns).
+        cancel: Event that aborts planning when set; calls not yet started are
+            cancelled.
+        cache: Optional persistent ``ResolverCache`` consulted before the
+            resolvers and saved afterwards.
+
+    Returns:
+        The same ``LockfilePlan`` ``plan_lock`` would return for these resolvers.
+
+    Raises:
+        ValueError: If ``max_workers`` is less than 1.
+        concurrent.futures.CancelledError: If ``cancel`` was set before all
+            calls finished.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be >= 1")
+    if cache is not None:
+        registry_resolves, alias_resolves = cache.registry(registry_resolves), cache.alias(alias_resolves)
+        try:
+            return plan_lock_threaded(
+                cfg, registry_resolves, alias_resolves, max_workers=max_workers, timeout=timeout, cancel=cancel
+            )
+        finally:
+            cache.save()
+    bad, requests, aliases = _plan_requests(cfg)
+    calls = _calls(requests, aliases, registry_resolves, alias_resolves)
+    results: List[Tuple[Any, Optional[BaseException]]] = [(None, None)] * len(calls)
+    started: Dict[int, float] = {}
+
+    def run(i: int) -> Any:
+        started[i] = time.monotonic()
+        fn, args = calls[i]
+        return fn(*args)
+
+    pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="plan-lock")
+    try:
+        pending: Dict[Future, int] = {pool.submit(run, i): i for i in range(len(calls))}
+        while pending:
+            if cancel is not None and cancel.is_set():
+                raise CancelledError("lock planning cancelled")
+            wait_for: Optional[float] = None
+            if timeout is not None:
+                now = time.monotonic()
+                for fut, i in list(pending.items()):
+                    t0 = started.get(i)
+                    if t0 is not None and now - t0 >= timeout and not fut.done():
+                        results[i] = (None, _timeout_error(timeout))
+                        del pending[fut]
+                deadlines = [started[i] + timeout for i in pending.values() if i in started]
+                # Unstarted calls have no deadline yet; poll until they start.
+                wait_for = max(0.0, min(deadlines) - now) if deadlines else 0.05
+            if cancel is not None:
+                wait_for = 0.05 if wait_for is None else min(wait_for, 0.05)
+            if not pending:
+                break
+            done, _ = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+            for fut in done:
+                i = pending.pop(fut)
+                err = fut.exception()
+                results[i] = (None, err) if err is not None else (fut.result(), None)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    return _assemble(bad, requests, aliases, results)
+
+
+@traced("compose.plan_lock_async")
+async def plan_lock_async(
+    cfg: Any,
+    registry_resolves: Callable[..., Any],
+    alias_resolves: Callable[..., Any],
+    *,
+    concurrency: int = 16,
+    timeout: Optional[float] = None,
+    cache: Optional[ResolverCache] = None,
+) -> LockfilePlan:
+    """``plan_lock`` for coroutine resolvers, resolved concurrently.
+
+    Resolvers may be ``async def`` functions or plain callables; plain
+    callables run in a worker thread via ``asyncio.to_thread``. Cancelling the
+    awaiting task cancels every in-flight resolver call.
+
+    Args:
+        cfg: ``AppConfig`` instance or raw mapping.
+        registry_resolves: ``(kind, key, range) -> {version, etag?, uri?}``.
+        alias_resolves: ``alias -> {provider?, model, ...}``.
+        concurrency: Maximum number of resolver calls in flight.
+        timeout: Per-call timeout in seconds; a timed-out call is cancelled and
+            recorded as an error.
+        cache: Optional persistent ``ResolverCache`` consulted before the
+            resolvers and saved afterwards.
+
+    Returns:
+        The same ``LockfilePlan`` ``plan_lock`` would return for these resolvers.
+
+    Raises:
+        ValueError: If ``concurrency`` is less than 1.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    if cache is not None:
+        registry_resolves, alias_resolves = cache.registry_async(registry_resolves), cache.alias_async(alias_resolves)
+        try:
+            return await plan_lock_async(cfg, registry_resolves, alias_resolves, concurrency=concurrency, timeout=timeout)
+        finally:
+            cache.save()
+    bad, requests, aliases = _plan_requests(cfg)
+    calls = _calls(requests, aliases, registry_resolves, alias_resolves)
+    sem = asyncio.Semaphore(concurrency)
+
+    async def invoke(fn: Callable[..., Any], args: Tuple[Any, ...]) -> Any:
+        if inspect.iscoroutinefunction(fn):
+            return await fn(*args)
+        value = await asyncio.to_thread(fn, *args)
+        if inspect.isawaitable(value):
+            value = await value
+        return value
+
+    async def one(fn: Callable[..., Any], args: Tuple[Any, ...]) -> Tuple[Any, Optional[BaseException]]:
+        async with sem:
+            task = asyncio.ensure_future(invoke(fn, args))
+            try:
+                done, _ = await asyncio.wait({task}, timeout=timeout)
+            except asyncio.CancelledError:
+                task.cancel()
+                raise
+            if not done:
+                task.cancel()
+                return None, _timeout_error(timeout)  # type: ignore[arg-type]
+            err = task.exception()
+            return (None, err) if err is not None else (task.result(), None)
+
+    results = await asyncio.gather(*(one(fn, args) for fn, args in calls))
+    return _assemble(bad, requests, aliases, list(results))
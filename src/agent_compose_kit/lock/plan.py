@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from ..tracing import count, traced
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .cache import ResolverCache
 
 
 @dataclass(frozen=True)
@@ -31,6 +36,14 @@ class LockfilePlan:
     registryPins: List[RegistryPin]
     aliasPins: List[AliasPin]
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LockfilePlan":
+        """Rebuild a plan from ``dataclasses.asdict(plan)`` output (e.g., a stored lockfile)."""
+        return cls(
+            registryPins=[RegistryPin(**p) for p in data.get("registryPins") or []],
+            aliasPins=[AliasPin(**a) for a in data.get("aliasPins") or []],
+        )
+
 
 def _to_raw(cfg: Any) -> Dict[str, Any]:
     """Return a plain dict for a Pydantic model or mapping.
@@ -71,79 +84,261 @@ def _parse_registry_ref(value: str) -> Tuple[str, str, str]:
     return kind, key, ver
 
 
-def plan_lock(
-    cfg: Any,
-    registry_resolves: Callable[[str, str, str], Dict[str, Any]],
-    alias_resolves: Callable[[str], Dict[str, Any]],
-) -> LockfilePlan:
-    """Compute a deterministic lock plan from a config and resolver callbacks.
+def _plan_requests(cfg: Any) -> Tuple[List[RegistryPin], List[Tuple[str, str, str, str]], List[str]]:
+    """Collect what ``plan_lock`` has to resolve.
 
-    - Extracts unique registry refs and model aliases (order-independent).
-    - Calls provided resolvers to pin versions and alias details (offline).
-    - Returns a stable structure suitable for serialization.
+    Args:
+        cfg: ``AppConfig`` instance or raw mapping.
+
+    Returns:
+        Tuple ``(bad_pins, requests, aliases)``: error pins for malformed refs,
+        unique ``(ref, kind, key, range)`` registry requests (first ref in sorted
+        order wins per triple) and sorted unique alias names.
     """
     from ..quickfix.fixes import list_dependencies
 
-    raw = _to_raw(cfg)
-    deps = list_dependencies(raw)
-    reg_values: List[str] = deps.get("registryRefs", [])
-    aliases: List[str] = deps.get("modelAliases", [])
-
-    # Registry pins
-    reg_pins: List[RegistryPin] = []
+    deps = list_dependencies(_to_raw(cfg))
+    bad: List[RegistryPin] = []
+    requests: List[Tuple[str, str, str, str]] = []
     seen_reg: set[Tuple[str, str, str]] = set()
-    for ref in sorted(set(reg_values)):
+    for ref in sorted(set(deps.get("registryRefs", []))):
         try:
             kind, key, rng = _parse_registry_ref(ref)
         except Exception as e:
-            reg_pins.append(RegistryPin(kind="unknown", key=ref, range="", pinned=None, ref=ref, error=str(e)))
+            bad.append(RegistryPin(kind="unknown", key=ref, range="", pinned=None, ref=ref, error=str(e)))
             continue
         triple = (kind, key, rng)
         if triple in seen_reg:
             continue
         seen_reg.add(triple)
+        requests.append((ref, kind, key, rng))
+    aliases = sorted(set(deps.get("modelAliases", [])))
+    count("lock.registry_refs", len(requests))
+    count("lock.aliases", len(aliases))
+    return bad, requests, aliases
+
+
+def _registry_pin(
+    request: Tuple[str, str, str, str],
+    resolved: Optional[Dict[str, Any]] = None,
+    error: Optional[BaseException] = None,
+) -> RegistryPin:
+    """Build a registry pin from a resolver result or the exception it raised."""
+    ref, kind, key, rng = request
+    if error is not None:
+        return RegistryPin(kind=kind, key=key, range=rng, pinned=None, ref=ref, error=str(error))
+    resolved = resolved or {}
+    return RegistryPin(
+        kind=kind,
+        key=key,
+        range=rng,
+        pinned=resolved.get("version"),
+        etag=resolved.get("etag"),
+        uri=resolved.get("uri"),
+        ref=ref,
+    )
+
+
+def _alias_pin(alias: str, resolved: Optional[Dict[str, Any]] = None) -> AliasPin:
+    """Build an alias pin; ``None`` (resolver failed) yields an empty pin."""
+    try:
+        r = resolved or {}
+        params = r.get("params") or {}
+        # fingerprint params if provided as dict
+        params_fp = None
+        if isinstance(params, dict) and params:
+            import json, hashlib
+
+            raw = json.dumps(params, sort_keys=True, separators=(",", ":")).encode("utf-8")
+            params_fp = hashlib.sha256(raw).hexdigest()
+        return AliasPin(
+            alias=alias,
+            provider=r.get("provider"),
+            model=r.get("model"),
+            resolver=r.get("resolver"),
+            secret_ref=r.get("secret_ref"),
+            params_fingerprint=params_fp,
+        )
+    except Exception:
+        return AliasPin(alias=alias, provider=None, model=None, resolver=None, secret_ref=None, params_fingerprint=None)
+
+
+RegistryResolvesMany = Callable[[List[Tuple[str, str, str]]], Dict[Tuple[str, str, str], Any]]
+AliasResolvesMany = Callable[[List[str]], Dict[str, Any]]
+
+
+def _batched(items: List[Any], many: Optional[Callable[[List[Any]], Dict[Any, Any]]], batch_size: Optional[int]) -> Dict[Any, Any]:
+    """Answer ``items`` through a batch resolver, chunked by ``batch_size``.
+
+    A chunk whose call raises, and items missing from an answer, are left out so
+    the caller falls back to per-item resolution for them.
+    """
+    got: Dict[Any, Any] = {}
+    if many is None or not items:
+        return got
+    size = batch_size or len(items)
+    for start in range(0, len(items), size):
+        chunk = items[start : start + size]
         try:
-            resolved = registry_resolves(kind, key, rng) or {}
-            pin = RegistryPin(
-                kind=kind,
-                key=key,
-                range=rng,
-                pinned=resolved.get("version"),
-                etag=resolved.get("etag"),
-                uri=resolved.get("uri"),
-                ref=ref,
-            )
+            answer = many(chunk) or {}
+        except Exception:
+            continue
+        for item in chunk:
+            if item in answer:
+                got[item] = answer[item]
+    return got
+
+
+def _resolve_registry(
+    requests: List[Tuple[str, str, str, str]],
+    registry_resolves: Callable[[str, str, str], Dict[str, Any]],
+    registry_resolves_many: Optional[RegistryResolvesMany] = None,
+    batch_size: Optional[int] = None,
+) -> List[RegistryPin]:
+    """Resolve registry requests (batch first, then per item) into pins."""
+    batch = _batched([req[1:] for req in requests], registry_resolves_many, batch_size)
+    pins: List[RegistryPin] = []
+    for req in requests:
+        try:
+            if req[1:] in batch:
+                value = batch[req[1:]]
+                if isinstance(value, BaseException):
+                    raise value
+            else:
+                value = registry_resolves(*req[1:])
+            pin = _registry_pin(req, value)
         except Exception as e:
-            pin = RegistryPin(kind=kind, key=key, range=rng, pinned=None, ref=ref, error=str(e))
-        reg_pins.append(pin)
+            pin = _registry_pin(req, error=e)
+        pins.append(pin)
+    return pins
+
 
-    # Alias pins
-    alias_pins: List[AliasPin] = []
-    for alias in sorted(set(aliases)):
+def _resolve_aliases(
+    aliases: List[str],
+    alias_resolves: Callable[[str], Dict[str, Any]],
+    alias_resolves_many: Optional[AliasResolvesMany] = None,
+    batch_size: Optional[int] = None,
+) -> List[AliasPin]:
+    """Resolve aliases (batch first, then per item) into pins."""
+    batch = _batched(aliases, alias_resolves_many, batch_size)
+    pins: List[AliasPin] = []
+    for alias in aliases:
         try:
-            r = alias_resolves(alias) or {}
-            params = r.get("params") or {}
-            # fingerprint params if provided as dict
-            params_fp = None
-            if isinstance(params, dict) and params:
-                import json, hashlib
-
-                raw = json.dumps(params, sort_keys=True, separators=(",", ":")).encode("utf-8")
-                params_fp = hashlib.sha256(raw).hexdigest()
-            alias_pins.append(
-                AliasPin(
-                    alias=alias,
-                    provider=r.get("provider"),
-                    model=r.get("model"),
-                    resolver=r.get("resolver"),
-                    secret_ref=r.get("secret_ref"),
-                    params_fingerprint=params_fp,
-                )
-            )
+            r = batch[alias] if alias in batch else alias_resolves(alias)
         except Exception:
-            alias_pins.append(AliasPin(alias=alias, provider=None, model=None, resolver=None, secret_ref=None, params_fingerprint=None))
+            r = None
+        pins.append(_alias_pin(alias, None if isinstance(r, BaseException) else r))
+    return pins
+
 
-    # Sort deterministically
+def _finish(reg_pins: List[RegistryPin], alias_pins: List[AliasPin]) -> LockfilePlan:
+    """Sort pins deterministically, independent of resolution order."""
     reg_pins = sorted(reg_pins, key=lambda p: (p.kind or "", p.key or "", p.range or "", p.pinned or ""))
     alias_pins = sorted(alias_pins, key=lambda a: a.alias)
     return LockfilePlan(registryPins=reg_pins, aliasPins=alias_pins)
+
+
+@traced("compose.plan_lock")
+def plan_lock(
+    cfg: Any,
+    registry_resolves: Callable[[str, str, str], Dict[str, Any]],
+    alias_resolves: Callable[[str], Dict[str, Any]],
+    *,
+    cache: Optional["ResolverCache"] = None,
+    registry_resolves_many: Optional[RegistryResolvesMany] = None,
+    alias_resolves_many: Optional[AliasResolvesMany] = None,
+    batch_size: Optional[int] = None,
+) -> LockfilePlan:
+    """Compute a deterministic lock plan from a config and resolver callbacks.
+
+    - Extracts unique registry refs and model aliases (order-independent).
+    - Calls provided resolvers to pin versions and alias details (offline).
+    - Returns a stable structure suitable for serialization.
+    - With ``cache``, answers from a persistent ``ResolverCache`` first and
+      saves it afterwards.
+    - With ``registry_resolves_many`` / ``alias_resolves_many``, resolves in
+      batches (``[(kind, key, range), ...] -> {(kind, key, range): result}`` and
+      ``[alias, ...] -> {alias: result}``; a result may be an exception
+      instance). Items a batch omits, or whose batch call raises, fall back to
+      the per-item resolvers.
+
+    See ``plan_lock_threaded`` / ``plan_lock_async`` for concurrent resolution.
+    """
+    if cache is not None:
+        try:
+            return plan_lock(
+                cfg,
+                cache.registry(registry_resolves),
+                cache.alias(alias_resolves),
+                registry_resolves_many=cache.registry_many(registry_resolves_many) if registry_resolves_many else None,
+                alias_resolves_many=cache.alias_many(alias_resolves_many) if alias_resolves_many else None,
+                batch_size=batch_size,
+            )
+        finally:
+            cache.save()
+    reg_pins, requests, aliases = _plan_requests(cfg)
+    reg_pins += _resolve_registry(requests, registry_resolves, registry_resolves_many, batch_size)
+    alias_pins = _resolve_aliases(aliases, alias_resolves, alias_resolves_many, batch_size)
+    return _finish(reg_pins, alias_pins)
+
+
+@traced("compose.plan_lock_incremental")
+def plan_lock_incremental(
+    previous: LockfilePlan,
+    cfg: Any,
+    registry_resolves: Callable[[str, str, str], Dict[str, Any]],
+    alias_resolves: Callable[[str], Dict[str, Any]],
+    *,
+    retry_errors: bool = True,
+    registry_resolves_many: Optional[RegistryResolvesMany] = None,
+    alias_resolves_many: Optional[AliasResolvesMany] = None,
+    batch_size: Optional[int] = None,
+) -> LockfilePlan:
+    """Re-plan against a previous lock plan, resolving only what changed.
+
+    Registry refs whose ``(kind, key, range)`` already has a pin in
+    ``previous`` and aliases that already have a pin are carried over
+    verbatim; only new refs/aliases (including a changed range) reach the
+    resolvers, and pins for refs no longer used are dropped. With deterministic
+    resolvers the result equals ``plan_lock(cfg, ...)``.
+
+    Args:
+        previous: Plan produced earlier by ``plan_lock`` (or ``LockfilePlan.from_dict``).
+        cfg: ``AppConfig`` instance or raw mapping.
+        registry_resolves: ``(kind, key, range) -> {version, etag?, uri?}``.
+        alias_resolves: ``alias -> {provider?, model, ...}``.
+        retry_errors: Re-resolve previous registry pins that carry an ``error``
+            and empty alias pins (no provider and no model, i.e. the alias
+            resolver failed).
+        registry_resolves_many: Optional batch registry resolver (see ``plan_lock``).
+        alias_resolves_many: Optional batch alias resolver (see ``plan_lock``).
+        batch_size: Maximum items per batch call.
+
+    Returns:
+        Deterministically sorted ``LockfilePlan``.
+    """
+    from dataclasses import replace
+
+    old_reg: Dict[Tuple[str, str, str], RegistryPin] = {}
+    for p in previous.registryPins:
+        if p.kind == "unknown" or (retry_errors and p.error is not None):
+            continue
+        old_reg.setdefault((p.kind, p.key, p.range), p)
+    # a failed alias resolution leaves an empty pin (no provider, no model)
+    old_alias = {
+        a.alias: a for a in previous.aliasPins if not (retry_errors and a.provider is None and a.model is None)
+    }
+
+    reg_pins, requests, aliases = _plan_requests(cfg)
+    todo: List[Tuple[str, str, str, str]] = []
+    for req in requests:
+        pin = old_reg.get(req[1:])
+        if pin is None:
+            todo.append(req)
+        else:
+            reg_pins.append(pin if pin.ref == req[0] else replace(pin, ref=req[0]))
+    reg_pins += _resolve_registry(todo, registry_resolves, registry_resolves_many, batch_size)
+
+    alias_pins = [old_alias[a] for a in aliases if a in old_alias]
+    alias_pins += _resolve_aliases([a for a in aliases if a not in old_alias], alias_resolves, alias_resolves_many, batch_size)
+    return _finish(reg_pins, alias_pins)
@@ -1,6 +1,7 @@
 from .fixes import (
     QuickFix,
     PatchOp,
+    apply_ops,
     get_quick_fixes,
 )
 
@@ -8,5 +9,6 @@ __all__ = [
     "QuickFix",
     "PatchOp",
     "get_quick_fixes",
+    "apply_ops",
 ]
 
@@ -0,0 +1,164 @@
+"""One-walk config analyzer.
+
+``list_dependencies``, ``validate_aliases``, ``lint`` and ``get_quick_fixes``
+all derive the same facts from a raw config (agent names, alias usage,
+``sub_agents`` lists). ``analyze`` builds those facts once through
+``QuickFixContext`` and then walks ``agents`` a single time, feeding the
+dependency/lint collectors and every quick-fix rule from the same loop. The
+individual functions are thin views that request only their own section.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+from .. import tracing
+from ..tracing import traced
+from .engine import QuickFixContext, QuickFixEngine, _report_rules, default_engine
+from .fixes import QuickFix
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..config.models import AppConfig
+
+ANALYSES = ("dependencies", "aliases", "lint", "quick_fixes", "graph")
+
+
+@dataclass(frozen=True)
+class ConfigAnalysis:
+    """Results of ``analyze``; sections that were not requested are ``None``.
+
+    Attributes:
+        dependencies: Output of ``list_dependencies``.
+        aliases: Output of ``validate_aliases``.
+        lint: Output of ``lint``.
+        quick_fixes: Output of ``get_quick_fixes``.
+        graph: Output of ``build_system_graph`` (only when ``cfg`` was given).
+    """
+
+    dependencies: Optional[Dict[str, List[str]]] = None
+    aliases: Optional[Dict[str, List[str]]] = None
+    lint: Optional[Dict[str, List[str]]] = None
+    quick_fixes: Optional[List[QuickFix]] = None
+    graph: Optional[Dict[str, Any]] = None
+
+
+@traced("compose.analyze")
+def analyze(
+    raw_cfg: Dict[str, Any],
+    *,
+    cfg: Optional["AppConfig"] = None,
+    validation_error: Optional[str] = None,
+    indexes: Optional[Dict[str, Any]] = None,
+    include: Optional[Iterable[str]] = None,
+    engine: Optional[QuickFixEngine] = None,
+) -> ConfigAnalysis:
+    """Compute dependencies, alias checks, lint and quick fixes in one walk.
+
+    Args:
+        raw_cfg: Raw configuration mapping (not mutated).
+        cfg: Validated ``AppConfig`` for ``raw_cfg``; required for ``graph``.
+        validation_error: Optional validation error text for quick fixes.
+        indexes: Optional external indexes (``openapi_operationIds``).
+        include: Sections to compute (subset of ``ANALYSES``); all by default.
+        engine: Quick-fix engine whose rules to run; ``default_engine`` by default.
+
+    Returns:
+        ConfigAnalysis with the requested sections filled in.
+
+    Raises:
+        ValueError: If ``include`` names an unknown section.
+    """
+    want = set(ANALYSES if include is None else include)
+    unknown = want.difference(ANALYSES)
+    if unknown:
+        raise ValueError(f"Unknown analysis section(s): {', '.join(sorted(unknown))}")
+    want_deps = "dependencies" in want
+    want_lint = "lint" in want
+    want_fixes = "quick_fixes" in want
+
+    ctx = QuickFixContext.build(raw_cfg, indexes, validation_error)
+    rules = (engine or default_engine).rules if want_fixes else []
+    outs: List[List[QuickFix]] = [[] for _ in rules]
+    pairs = list(zip(rules, outs))
+    # per-rule timing only when a tracing sink will receive it
+    clock = time.perf_counter if rules and tracing.enabled() else None
+    spent = [0.0] * len(rules)
+
+    reg: set[str] = set()
+    parent_count: Dict[str, int] = {}
+    infos: List[str] = []
+    for idx, a in enumerate(ctx.agents):
+        if not isinstance(a, dict):
+            continue
+        if want_deps or want_lint:
+            subs = a.get("sub_agents") or []
+            for s in subs:
+                if isinstance(s, str):
+                    parent_count[s] = parent_count.get(s, 0) + 1
+                elif want_deps and isinstance(s, dict):
+                    v = s.get("value")
+                    if isinstance(v, str) and v.startswith("registry://"):
+                        reg.add(v)
+            if want_lint and a.get("type") == "workflow.parallel" and len(subs) > 6:
+                infos.append(
+                    f"Parallel agent '{a.get('name','')}' fans out to {len(subs)} sub_agents; ensure downstream synthesis"
+                )
+        if want_deps:
+            for t in a.get("tools") or []:
+                if not isinstance(t, dict):
+                    continue
+                for key in ("server", "spec", "function", "agent"):
+                    v = t.get(key)
+                    if isinstance(v, dict) and isinstance(v.get("ref"), dict) and isinstance(v["ref"].get("value"), str):
+                        val = v["ref"]["value"]
+                        if val.startswith("registry://"):
+                            reg.add(val)
+        if clock is None:
+            for r, out in pairs:
+                r.visit(ctx, idx, a, out)
+        else:
+            for k, (r, out) in enumerate(pairs):
+                t0 = clock()
+                r.visit(ctx, idx, a, out)
+                spent[k] += clock() - t0
+    if clock is None:
+        for r, out in pairs:
+            r.finish(ctx, out)
+    else:
+        for k, (r, out) in enumerate(pairs):
+            t0 = clock()
+            r.finish(ctx, out)
+            spent[k] += clock() - t0
+        _report_rules(rules, outs, spent)
+
+    dependencies = None
+    if want_deps:
+        dependencies = {
+            "registryRefs": sorted(reg),
+            "modelAliases": sorted(ctx.used_aliases),
+            "agentRefs": sorted(parent_count),
+        }
+    lint = None
+    if want_lint:
+        warnings = [
+            f"Agent '{name}' is referenced by {cnt} parents; consider duplication or registry refs"
+            for name, cnt in parent_count.items()
+            if cnt > 1
+        ]
+        lint = {"warnings": warnings, "infos": infos}
+        tracing.count("lint.rule.findings", len(warnings), rule="multi-parent")
+        tracing.count("lint.rule.findings", len(infos), rule="parallel-fanout")
+    graph = None
+    if "graph" in want and cfg is not None:
+        from ..graph.build import build_system_graph
+
+        graph = build_system_graph(cfg)
+    return ConfigAnalysis(
+        dependencies=dependencies,
+        aliases={"unknown_aliases": sorted(ctx.used_aliases - ctx.declared_aliases)} if "aliases" in want else None,
+        lint=lint,
+        quick_fixes=[f for out in outs for f in out] if want_fixes else None,
+        graph=graph,
+    )
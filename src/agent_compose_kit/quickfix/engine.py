@@ -0,0 +1,413 @@
+"""Single-pass quick-fix engine.
+
+Builds name/index/type maps once, then walks ``agents`` a single time and lets
+every enabled rule visit each agent. Rules buffer their fixes separately and
+the buffers are concatenated in rule order, so the output matches the
+historical rule-by-rule ordering of ``get_quick_fixes``.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from .. import tracing
+from .fixes import PatchOp, QuickFix
+from .fuzzy import FuzzyIndex
+
+
+@dataclass
+class QuickFixContext:
+    """Per-run lookup tables shared by all rules.
+
+    Attributes:
+        raw_cfg: Raw configuration mapping (never mutated).
+        agents: ``raw_cfg["agents"]`` as a list.
+        names: Declared agent names in order (same as ``_agent_names``).
+        name_set: String agent names for O(1) membership tests.
+        index_by_name: First agent index per string name.
+        default_alias: ``defaults.model_alias`` when set.
+        declared_aliases: Alias ids declared in ``model_aliases.aliases``.
+        used_aliases: Alias names referenced by ``defaults.model_alias`` and
+            ``alias://`` agent models.
+        indexes: Optional external indexes (e.g., ``openapi_operationIds``).
+        validation_error: Optional validation error text from the caller.
+        op_index: Fuzzy index over ``indexes["openapi_operationIds"]`` (reused
+            as-is when the caller passes a prebuilt ``FuzzyIndex``).
+    """
+
+    raw_cfg: Dict[str, Any]
+    agents: List[Any]
+    names: List[Any]
+    name_set: set[str]
+    index_by_name: Dict[str, int]
+    default_alias: Optional[str]
+    declared_aliases: set[str] = field(default_factory=set)
+    used_aliases: set[str] = field(default_factory=set)
+    indexes: Optional[Dict[str, Any]] = None
+    validation_error: Optional[str] = None
+    op_index: Optional[FuzzyIndex] = None
+    _name_index: Optional[FuzzyIndex] = field(default=None, repr=False)
+
+    def closest_name(self, name: str) -> Optional[str]:
+        """Closest declared agent name (index built on first use)."""
+        if self._name_index is None:
+            self._name_index = FuzzyIndex(self.names)
+        return self._name_index.closest(name)
+
+    @classmethod
+    def build(
+        cls,
+        raw_cfg: Dict[str, Any],
+        indexes: Optional[Dict[str, Any]] = None,
+        validation_error: Optional[str] = None,
+    ) -> "QuickFixContext":
+        agents = list(raw_cfg.get("agents") or [])
+        names: List[Any] = []
+        index_by_name: Dict[str, int] = {}
+        used: set[str] = set()
+        defaults = raw_cfg.get("defaults") or {}
+        default_alias = defaults.get("model_alias") if isinstance(defaults, dict) else None
+        if isinstance(default_alias, str):
+            used.add(default_alias)
+        for i, a in enumerate(agents):
+            if not isinstance(a, dict):
+                continue
+            n = a.get("name")
+            if n:
+                names.append(n)
+            if isinstance(n, str):
+                index_by_name.setdefault(n, i)
+            m = a.get("model")
+            if isinstance(m, str) and m.startswith("alias://"):
+                used.add(m.split("alias://", 1)[1])
+        declared: set[str] = set()
+        reg = raw_cfg.get("model_aliases") or {}
+        for a in (reg.get("aliases") if isinstance(reg, dict) else None) or []:
+            if isinstance(a, dict) and isinstance(a.get("id"), str):
+                declared.add(a["id"])
+        op_ids = (indexes or {}).get("openapi_operationIds") or None
+        if op_ids is not None and not isinstance(op_ids, FuzzyIndex):
+            op_ids = FuzzyIndex(op_ids)
+        return cls(
+            raw_cfg=raw_cfg,
+            agents=agents,
+            names=names,
+            name_set={n for n in names if isinstance(n, str)},
+            index_by_name=index_by_name,
+            default_alias=default_alias,
+            declared_aliases=declared,
+            used_aliases=used,
+            indexes=indexes,
+            validation_error=validation_error,
+            op_index=op_ids,
+        )
+
+
+class QuickFixRule:
+    """Base visitor. Subclasses override ``visit`` and/or ``finish``.
+
+    Attributes:
+        id: Stable rule identifier used to enable/disable and time the rule.
+    """
+
+    id: str = ""
+
+    def visit(self, ctx: QuickFixContext, idx: int, agent: Dict[str, Any], out: List[QuickFix]) -> None:
+        """Inspect one dict agent at position ``idx`` and append fixes to ``out``."""
+
+    def finish(self, ctx: QuickFixContext, out: List[QuickFix]) -> None:
+        """Append document-level fixes to ``out`` after all agents were visited."""
+
+
+class LlmModelFromDefaults(QuickFixRule):
+    """LLM missing model and defaults.model_alias → add model alias."""
+
+    id = "llm-model-from-defaults"
+
+    def visit(self, ctx: QuickFixContext, idx: int, agent: Dict[str, Any], out: List[QuickFix]) -> None:
+        if ctx.default_alias and agent.get("type") == "llm" and agent.get("model") is None:
+            out.append(
+                QuickFix(
+                    id=f"llm-model-{idx}",
+                    title=f"Set model to alias://{ctx.default_alias}",
+                    description="Use defaults.model_alias for this LLM agent",
+                    ops=[PatchOp(op="add", path=f"/agents/{idx}/model", value=f"alias://{ctx.default_alias}")],
+                )
+            )
+
+
+class SeedWorkflowSubAgents(QuickFixRule):
+    """Workflow agents with empty/missing sub_agents → seed with another local agent."""
+
+    id = "seed-workflow-sub-agents"
+
+    def visit(self, ctx: QuickFixContext, idx: int, agent: Dict[str, Any], out: List[QuickFix]) -> None:
+        if agent.get("type") not in {"workflow.sequential", "workflow.parallel"} or agent.get("sub_agents"):
+            return
+        candidate = next((n for n in ctx.names if n != agent.get("name")), None)
+        if candidate:
+            out.append(
+                QuickFix(
+                    id=f"seed-subs-{idx}",
+                    title=f"Add sub_agents with '{candidate}'",
+                    description="Seed workflow with an existing agent",
+                    ops=[PatchOp(op="add", path=f"/agents/{idx}/sub_agents", value=[candidate])],
+                )
+            )
+
+
+class UnknownSubAgent(QuickFixRule):
+    """Unknown sub_agent names → replace with the closest local name."""
+
+    id = "unknown-sub-agent"
+
+    def visit(self, ctx: QuickFixContext, idx: int, agent: Dict[str, Any], out: List[QuickFix]) -> None:
+        subs = agent.get("sub_agents") or []
+        if not isinstance(subs, list):
+            return
+        for j, s in enumerate(subs):
+            if isinstance(s, str) and s not in ctx.name_set:
+                new_name = ctx.closest_name(s)
+                if new_name:
+                    out.append(
+                        QuickFix(
+                            id=f"fix-subref-{idx}-{j}",
+                            title=f"Replace '{s}' with '{new_name}'",
+                            description="Unknown sub_agent reference; replace with closest name",
+                            ops=[PatchOp(op="replace", path=f"/agents/{idx}/sub_agents/{j}", value=new_name)],
+                        )
+                    )
+
+
+class SequentialOutputKey(QuickFixRule):
+    """Sequential upstream LLM missing output_key → add one."""
+
+    id = "sequential-output-key"
+
+    def visit(self, ctx: QuickFixContext, idx: int, agent: Dict[str, Any], out: List[QuickFix]) -> None:
+        if agent.get("type") != "workflow.sequential":
+            return
+        seq = [s for s in (agent.get("sub_agents") or []) if isinstance(s, str)]
+        for up in seq[:-1]:
+            up_idx = ctx.index_by_name.get(up)
+            if up_idx is None:
+                continue
+            up_ag = ctx.agents[up_idx]
+            if up_ag.get("type") == "llm" and not up_ag.get("output_key"):
+                key = f"{up_ag.get('name','agent')}_output"
+                out.append(
+                    QuickFix(
+                        id=f"add-output-key-{up_idx}",
+                        title=f"Add output_key '{key}'",
+                        description="Sequential pipeline: give upstream LLM an output_key for downstream input",
+                        ops=[PatchOp(op="add", path=f"/agents/{up_idx}/output_key", value=key)],
+                    )
+                )
+
+
+class MoveThinkingConfig(QuickFixRule):
+    """generate_content_config.thinking_config → planner.built_in."""
+
+    id = "move-thinking-config"
+
+    def visit(self, ctx: QuickFixContext, idx: int, agent: Dict[str, Any], out: List[QuickFix]) -> None:
+        if agent.get("type") != "llm":
+            return
+        gcc = agent.get("generate_content_config") or {}
+        if isinstance(gcc, dict) and "thinking_config" in gcc:
+            out.append(
+                QuickFix(
+                    id=f"move-thinking-{idx}",
+                    title="Move thinking_config to planner.built_in",
+                    description="Align with ADK: thinking_config belongs under planner",
+                    ops=[
+                        PatchOp(
+                            op="add",
+                            path=f"/agents/{idx}/planner",
+                            value={"type": "built_in", "thinking_config": gcc.get("thinking_config")},
+                        ),
+                        PatchOp(op="remove", path=f"/agents/{idx}/generate_content_config/thinking_config"),
+                    ],
+                )
+            )
+
+
+class PlanReactOutputSchema(QuickFixRule):
+    """plan_react planner with output_schema → remove output_schema."""
+
+    id = "plan-react-output-schema"
+
+    def visit(self, ctx: QuickFixContext, idx: int, agent: Dict[str, Any], out: List[QuickFix]) -> None:
+        if agent.get("type") != "llm":
+            return
+        if (agent.get("planner") or {}).get("type") == "plan_react" and agent.get("output_schema"):
+            out.append(
+                QuickFix(
+                    id=f"rm-output-schema-{idx}",
+                    title="Remove output_schema (Plan-Re-Act expects tools)",
+                    description="Plan-Re-Act conflicts with structured output; remove output_schema",
+                    ops=[PatchOp(op="remove", path=f"/agents/{idx}/output_schema")],
+                )
+            )
+
+
+class AddDefaultsModelAlias(QuickFixRule):
+    """No defaults but an LLM misses its model → add defaults.model_alias."""
+
+    id = "add-defaults-model-alias"
+
+    def visit(self, ctx: QuickFixContext, idx: int, agent: Dict[str, Any], out: List[QuickFix]) -> None:
+        if not ctx.default_alias and not out and agent.get("type") == "llm" and not agent.get("model"):
+            out.append(
+                QuickFix(
+                    id="add-defaults-model-alias",
+                    title="Add defaults.model_alias: chat-default",
+                    description="Provide a default model alias for LLM agents",
+                    ops=[PatchOp(op="add", path="/defaults", value={"model_alias": "chat-default"})],
+                )
+            )
+
+
+class UnknownOperationId(QuickFixRule):
+    """Unknown OpenAPI operationId (when an index is provided) → closest match."""
+
+    id = "unknown-operation-id"
+
+    def visit(self, ctx: QuickFixContext, idx: int, agent: Dict[str, Any], out: List[QuickFix]) -> None:
+        if not ctx.op_index or agent.get("type") != "llm":
+            return
+        for j, t in enumerate(agent.get("tools") or []):
+            if not isinstance(t, dict) or t.get("kind") != "openapi":
+                continue
+            op = t.get("operationId")
+            if isinstance(op, str) and op not in ctx.op_index:
+                close = ctx.op_index.closest(op)
+                if close:
+                    out.append(
+                        QuickFix(
+                            id=f"fix-opid-{idx}-{j}",
+                            title=f"Replace operationId '{op}' with '{close}'",
+                            description="Unknown operationId; replace with closest match from index",
+                            ops=[PatchOp(op="replace", path=f"/agents/{idx}/tools/{j}/operationId", value=close)],
+                        )
+                    )
+
+
+class DeclareMissingAliases(QuickFixRule):
+    """Used-but-undeclared model aliases → add stub entries."""
+
+    id = "declare-missing-aliases"
+
+    def finish(self, ctx: QuickFixContext, out: List[QuickFix]) -> None:
+        for missing in sorted(ctx.used_aliases - ctx.declared_aliases):
+            out.append(
+                QuickFix(
+                    id=f"add-alias-{missing}",
+                    title=f"Declare model alias '{missing}'",
+                    description="Add a model alias entry (resolver: direct)",
+                    ops=[
+                        PatchOp(
+                            op="add",
+                            path="/model_aliases/aliases/-",
+                            value={"id": missing, "resolver": "direct", "model": "gemini-2.0-flash", "labels": {}},
+                        )
+                    ],
+                )
+            )
+
+
+DEFAULT_RULES: List[QuickFixRule] = [
+    LlmModelFromDefaults(),
+    SeedWorkflowSubAgents(),
+    UnknownSubAgent(),
+    SequentialOutputKey(),
+    MoveThinkingConfig(),
+    PlanReactOutputSchema(),
+    AddDefaultsModelAlias(),
+    UnknownOperationId(),
+    DeclareMissingAliases(),
+]
+
+
+class QuickFixEngine:
+    """Runs a list of ``QuickFixRule`` visitors over one traversal of ``agents``.
+
+    Args:
+        rules: Rules in output order; defaults to ``DEFAULT_RULES``.
+    """
+
+    def __init__(self, rules: Optional[Sequence[QuickFixRule]] = None) -> None:
+        self.rules: List[QuickFixRule] = list(DEFAULT_RULES if rules is None else rules)
+
+    def rule_ids(self) -> List[str]:
+        """Return rule ids in execution/output order."""
+        return [r.id for r in self.rules]
+
+    def run(
+        self,
+        raw_cfg: Dict[str, Any],
+        *,
+        validation_error: Optional[str] = None,
+        indexes: Optional[Dict[str, Any]] = None,
+        enabled: Optional[Iterable[str]] = None,
+        timings: Optional[Dict[str, float]] = None,
+    ) -> List[QuickFix]:
+        """Return quick fixes for ``raw_cfg``.
+
+        Args:
+            raw_cfg: Raw configuration mapping (not mutated).
+            validation_error: Optional validation error text.
+            indexes: Optional external indexes (``openapi_operationIds``).
+            enabled: Rule ids to run; all rules when omitted.
+            timings: When given, filled with cumulative seconds per rule id.
+
+        Returns:
+            Fixes grouped by rule, in rule order.
+
+        With a tracing sink installed, rules are timed and reported as
+        ``quickfix.rule.seconds`` / ``quickfix.rule.fixes`` counters.
+        """
+        ctx = QuickFixContext.build(raw_cfg, indexes, validation_error)
+        allow = None if enabled is None else set(enabled)
+        rules = [r for r in self.rules if allow is None or r.id in allow]
+        outs: List[List[QuickFix]] = [[] for _ in rules]
+        report = tracing.enabled()
+        if report and timings is None:
+            timings = {}
+        if timings is None:
+            pairs = list(zip(rules, outs))
+            for idx, a in enumerate(ctx.agents):
+                if isinstance(a, dict):
+                    for r, out in pairs:
+                        r.visit(ctx, idx, a, out)
+            for r, out in pairs:
+                r.finish(ctx, out)
+        else:
+            clock = time.perf_counter
+            spent = [0.0] * len(rules)
+            for idx, a in enumerate(ctx.agents):
+                if isinstance(a, dict):
+                    for k, r in enumerate(rules):
+                        t0 = clock()
+                        r.visit(ctx, idx, a, outs[k])
+                        spent[k] += clock() - t0
+            for k, r in enumerate(rules):
+                t0 = clock()
+                r.finish(ctx, outs[k])
+                spent[k] += clock() - t0
+                timings[r.id] = timings.get(r.id, 0.0) + spent[k]
+            if report:
+                _report_rules(rules, outs, spent)
+        return [f for out in outs for f in out]
+
+
+def _report_rules(rules: Sequence[QuickFixRule], outs: Sequence[List[QuickFix]], spent: Sequence[float]) -> None:
+    """Emit per-rule tracing counters for one run."""
+    for r, out, seconds in zip(rules, outs, spent):
+        tracing.count("quickfix.rule.seconds", seconds, rule=r.id)
+        tracing.count("quickfix.rule.fixes", len(out), rule=r.id)
+
+
+default_engine = QuickFixEngine()
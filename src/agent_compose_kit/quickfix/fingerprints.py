@@ -0,0 +1,200 @@
+"""Merkle-style fingerprints over a raw config: one hash per agent, per tool,
+per model alias entry and per top-level section, rolled up into a root hash.
+
+Leaves are sha256 digests of canonical JSON (sorted keys, compact separators,
+the same encoding ``fingerprint()`` uses); inner nodes hash their children's
+digests. After a patch, ``update_fingerprint_tree`` re-hashes only the touched
+agents/aliases/sections and the path up to the root.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..tracing import traced
+from .fixes import PatchOp, parse_pointer
+
+
+def _h(*parts: str) -> str:
+    return hashlib.sha256("\x00".join(parts).encode("utf-8")).hexdigest()
+
+
+def _leaf(obj: Any) -> str:
+    raw = json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()
+
+
+@dataclass(frozen=True)
+class FingerprintTree:
+    """Per-subtree hashes for a raw config.
+
+    Attributes:
+        root: Root hash over all section hashes.
+        sections: Top-level key → section hash.
+        agents: Per-agent hashes in declaration order.
+        agent_names: Agent ``name`` per position (``None`` when missing).
+        tools: Per-agent list of per-tool hashes.
+        aliases: Per model alias entry hashes in declaration order.
+    """
+
+    root: str
+    sections: Dict[str, str]
+    agents: List[str] = field(default_factory=list)
+    agent_names: List[Optional[str]] = field(default_factory=list)
+    tools: List[List[str]] = field(default_factory=list)
+    aliases: List[str] = field(default_factory=list)
+
+    def agent_hashes(self) -> Dict[str, str]:
+        """Return ``{agent name: hash}`` for named agents."""
+        return {n: h for n, h in zip(self.agent_names, self.agents) if n}
+
+    def diff(self, other: "FingerprintTree") -> Dict[str, List[str]]:
+        """Return what changed from ``self`` to ``other``.
+
+        Returns:
+            ``{"sections": [...], "agents": [...]}`` — sorted top-level keys whose
+            hash differs, and sorted names of agents added, removed or changed.
+        """
+        keys = set(self.sections) | set(other.sections)
+        a, b = self.agent_hashes(), other.agent_hashes()
+        return {
+            "sections": sorted(k for k in keys if self.sections.get(k) != other.sections.get(k)),
+            "agents": sorted(n for n in set(a) | set(b) if a.get(n) != b.get(n)),
+        }
+
+
+def _agent(a: Any) -> Tuple[str, Optional[str], List[str]]:
+    """Return ``(hash, name, tool hashes)`` for one agent entry."""
+    if not isinstance(a, dict):
+        return _h("agent", _leaf(a)), None, []
+    name = a.get("name") if isinstance(a.get("name"), str) else None
+    tools = a.get("tools")
+    if not isinstance(tools, list):
+        return _h("agent", _leaf(a)), name, []
+    base = {k: v for k, v in a.items() if k != "tools"}
+    th = [_leaf(t) for t in tools]
+    return _h("agent", _leaf(base), "tools", *th), name, th
+
+
+def _aliases_section(section: Any) -> Tuple[str, List[str]]:
+    if not isinstance(section, dict) or not isinstance(section.get("aliases"), list):
+        return _leaf(section), []
+    base = {k: v for k, v in section.items() if k != "aliases"}
+    ah = [_leaf(x) for x in section["aliases"]]
+    return _h("model_aliases", _leaf(base), "aliases", *ah), ah
+
+
+def _root(sections: Dict[str, str]) -> str:
+    return _h("root", *(f"{k}={sections[k]}" for k in sorted(sections)))
+
+
+@traced("compose.fingerprint_tree")
+def fingerprint_tree(cfg: Dict[str, Any]) -> FingerprintTree:
+    """Compute the full fingerprint tree for a raw config dict.
+
+    Args:
+        cfg: Raw configuration mapping (e.g., ``AppConfig.model_dump()``).
+
+    Returns:
+        A ``FingerprintTree``; equal configs yield equal trees.
+    """
+    sections: Dict[str, str] = {}
+    agents: List[str] = []
+    names: List[Optional[str]] = []
+    tools: List[List[str]] = []
+    aliases: List[str] = []
+    for key, value in cfg.items():
+        if key == "agents" and isinstance(value, list):
+            for a in value:
+                h, n, th = _agent(a)
+                agents.append(h)
+                names.append(n)
+                tools.append(th)
+            sections[key] = _h("agents", *agents)
+        elif key == "model_aliases":
+            sections[key], aliases = _aliases_section(value)
+        else:
+            sections[key] = _leaf(value)
+    return FingerprintTree(_root(sections), sections, agents, names, tools, aliases)
+
+
+@traced("compose.update_fingerprint_tree")
+def update_fingerprint_tree(tree: FingerprintTree, cfg: Dict[str, Any], ops: Sequence[PatchOp]) -> FingerprintTree:
+    """Re-hash only what ``ops`` touched and return the new tree.
+
+    Args:
+        tree: Tree computed for the config before ``ops`` were applied.
+        cfg: The raw config after applying ``ops``.
+        ops: The applied patch operations, in order.
+
+    Returns:
+        A new ``FingerprintTree`` equal to ``fingerprint_tree(cfg)``.
+    """
+    agents: List[Optional[str]] = list(tree.agents)
+    names = list(tree.agent_names)
+    tools = list(tree.tools)
+    touched: set[str] = set()
+    rebuild = False
+    for op in ops:
+        tokens = parse_pointer(op.path)
+        if not tokens:
+            return fingerprint_tree(cfg)
+        key = tokens[0]
+        touched.add(key)
+        if key != "agents" or len(tokens) == 1:
+            if key == "agents":
+                rebuild = True  # whole list replaced
+            continue
+        try:
+            i = len(agents) if tokens[1] == "-" else int(tokens[1])
+        except ValueError:
+            return fingerprint_tree(cfg)
+        if len(tokens) == 2 and op.op == "add" and 0 <= i <= len(agents):
+            agents.insert(i, None)
+            names.insert(i, None)
+            tools.insert(i, [])
+        elif len(tokens) == 2 and op.op == "remove" and 0 <= i < len(agents):
+            del agents[i], names[i], tools[i]
+        elif 0 <= i < len(agents):
+            agents[i] = None
+        else:
+            rebuild = True
+
+    sections = dict(tree.sections)
+    aliases = tree.aliases
+    for key in touched:
+        if key not in cfg:
+            sections.pop(key, None)
+            if key == "agents":
+                agents, names, tools = [], [], []
+            elif key == "model_aliases":
+                aliases = []
+        elif key == "agents":
+            raw = cfg["agents"] if isinstance(cfg["agents"], list) else None
+            if raw is None:
+                agents, names, tools = [], [], []
+                sections[key] = _leaf(cfg[key])
+                continue
+            if rebuild or len(raw) != len(agents):
+                agents = [None] * len(raw)
+                names, tools = [None] * len(raw), [[] for _ in raw]
+            for i, h in enumerate(agents):
+                if h is None:
+                    agents[i], names[i], tools[i] = _agent(raw[i])
+            sections[key] = _h("agents", *agents)  # type: ignore[arg-type]
+        elif key == "model_aliases":
+            sections[key], aliases = _aliases_section(cfg[key])
+        else:
+            sections[key] = _leaf(cfg[key])
+    return replace(
+        tree,
+        root=_root(sections),
+        sections=sections,
+        agents=agents,  # type: ignore[arg-type]
+        agent_names=names,
+        tools=tools,
+        aliases=aliases,
+    )
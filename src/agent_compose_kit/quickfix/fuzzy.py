@@ -0,0 +1,117 @@
+"""Reusable fuzzy-name index with ``difflib.get_close_matches(n=1)`` semantics.
+
+``difflib`` scores every candidate with ``SequenceMatcher`` on each lookup.
+``FuzzyIndex`` is built once from a name list and prunes candidates with
+bounds that can never reject a real match:
+
+- length: ``ratio`` ≤ ``2·min(la, lb) / (la + lb)`` (``real_quick_ratio``);
+- characters: ``ratio`` ≤ ``2·|A ∩ B| / (la + lb)`` over character multisets
+  (``quick_ratio``). Candidates are generated by prefix filtering over
+  per-character occurrence tokens (``("a", 2)`` = "has at least two a's"),
+  rarest first, so only names sharing a rare character are looked at;
+- survivors are scored best-bound-first and scoring stops once no remaining
+  bound can beat the best exact ``ratio``.
+
+The winner is the same as ``difflib``'s: the highest ``(ratio, name)`` pair
+with ``ratio >= cutoff``. Lookups are memoized per index.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+_Token = Tuple[str, int]
+
+
+def _tokens(counts: Counter) -> List[_Token]:
+    return [(c, k) for c, n in counts.items() for k in range(1, n + 1)]
+
+
+class FuzzyIndex:
+    """Prebuilt index answering "closest name above cutoff" queries.
+
+    Args:
+        choices: Candidate names (non-strings are ignored; duplicates collapse).
+        cutoff: Minimum ``SequenceMatcher.ratio`` for a match, as in ``difflib``.
+        cache_size: Maximum memoized lookups before the memo is reset.
+    """
+
+    def __init__(self, choices: Iterable[str], *, cutoff: float = 0.6, cache_size: int = 4096) -> None:
+        if not 0.0 <= cutoff <= 1.0:
+            raise ValueError(f"cutoff must be in [0.0, 1.0]: {cutoff!r}")
+        self.cutoff = cutoff
+        self._names: List[str] = list(dict.fromkeys(c for c in choices if isinstance(c, str)))
+        self._set = set(self._names)
+        self._toks: List[frozenset[_Token]] = [frozenset(_tokens(Counter(n))) for n in self._names]
+        self._post: Dict[_Token, List[int]] = {}
+        for i, toks in enumerate(self._toks):
+            for tok in toks:
+                self._post.setdefault(tok, []).append(i)
+        self._cache: Dict[str, Optional[str]] = {}
+        self._cache_size = cache_size
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._set
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def closest(self, name: str) -> Optional[str]:
+        """Return the best match for ``name`` or ``None`` (same as ``difflib``)."""
+        try:
+            return self._cache[name]
+        except KeyError:
+            pass
+        out = self._lookup(name)
+        if len(self._cache) >= self._cache_size:
+            self._cache.clear()
+        self._cache[name] = out
+        return out
+
+    def _lookup(self, name: str) -> Optional[str]:
+        la = len(name)
+        c = self.cutoff
+        if la == 0 or c == 0.0:
+            # degenerate bounds: score everything like difflib does
+            return self._best(name, range(len(self._names)), la, frozenset(_tokens(Counter(name))))
+        lb_min = math.floor(c * la / (2.0 - c))
+        lb_max = math.ceil(la * (2.0 - c) / c)
+        # any match shares at least t characters (conservatively rounded down)
+        t = max(1, math.floor(c * (la + lb_min) / 2.0))
+        qtoks = _tokens(Counter(name))
+        qtoks.sort(key=lambda tok: len(self._post.get(tok, ())))
+        cand: set[int] = set()
+        for tok in qtoks[: max(0, la - t + 1)]:
+            cand.update(self._post.get(tok, ()))
+        return self._best(
+            name, (i for i in cand if lb_min <= len(self._names[i]) <= lb_max), la, frozenset(qtoks)
+        )
+
+    def _best(self, name: str, ids: Iterable[int], la: int, qtoks: frozenset[_Token]) -> Optional[str]:
+        c = self.cutoff
+        bounded: List[Tuple[float, str]] = []
+        for i in ids:
+            x = self._names[i]
+            lt = la + len(x)
+            # |tokens ∩ tokens| is the character-multiset intersection (quick_ratio bound)
+            ub = 2.0 * len(qtoks & self._toks[i]) / lt if lt else 1.0
+            if ub >= c:
+                bounded.append((ub, x))
+        bounded.sort(reverse=True)
+        best: Optional[Tuple[float, str]] = None
+        s = SequenceMatcher()
+        s.set_seq2(name)
+        for ub, x in bounded:
+            if best is not None and ub < best[0]:
+                break
+            s.set_seq1(x)
+            r = s.ratio()
+            if r >= c and (best is None or (r, x) > best):
+                best = (r, x)
+        return best[1] if best else None
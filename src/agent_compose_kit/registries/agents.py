@@ -1,15 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Tuple
 
-from ..config.models import (
-    Agent,
-    CustomAgentCfg,
-    LlmAgentCfg,
-    LoopAgentCfg,
-    ParallelAgentCfg,
-    SequentialAgentCfg,
-)
+from ..config.models import AGENT_TYPES, Agent
+from .base import DeclarativeRegistry
 
 
 def _parse_agent(spec: Dict[str, Any]) -> Agent:
@@ -25,20 +19,13 @@ def _parse_agent(spec: Dict[str, Any]) -> Agent:
         ValueError: When ``type`` is missing or unsupported.
     """
     t = str(spec.get("type"))
-    if t == "llm":
-        return LlmAgentCfg.model_validate(spec)
-    if t == "workflow.sequential":
-        return SequentialAgentCfg.model_validate(spec)
-    if t == "workflow.parallel":
-        return ParallelAgentCfg.model_validate(spec)
-    if t == "workflow.loop":
-        return LoopAgentCfg.model_validate(spec)
-    if t == "custom":
-        return CustomAgentCfg.model_validate(spec)
-    raise ValueError(f"Unknown agent type: {t}")
-
-
-class DeclarativeAgentRegistry:
+    cls = AGENT_TYPES.get(t)
+    if cls is None:
+        raise ValueError(f"Unknown agent type: {t}")
+    return cls.model_validate(spec)  # type: ignore[return-value]
+
+
+class DeclarativeAgentRegistry(DeclarativeRegistry[Agent]):
     """Pure config-based agent registry (no runtime side-effects).
 
     Spec format:
@@ -46,25 +33,27 @@ class DeclarativeAgentRegistry:
       "agents": [ {"id": "planner", <AgentSpec> }, ... ],
       "groups": [ {"id": "core", "include": ["planner", ...]} ]
     }
+
+    Pass ``lazy=True`` to validate entries on first ``get``/``get_group``
+    instead of in the constructor; ``validate_all()`` validates the rest.
     """
 
-    def __init__(self, spec: Dict[str, Any] | None) -> None:
-        self._agents_by_id: Dict[str, Agent] = {}
-        self._groups: Dict[str, List[str]] = {}
-        spec = spec or {}
-        for a in spec.get("agents") or []:
-            aid = a.get("id")
-            if not aid:
-                continue
-            # copy minus id
-            aspec = {k: v for k, v in a.items() if k != "id"}
-            self._agents_by_id[str(aid)] = _parse_agent(aspec)
-        for g in spec.get("groups") or []:
-            gid = g.get("id")
-            if not gid:
-                continue
-            include = g.get("include") or []
-            self._groups[str(gid)] = [str(x) for x in include]
+    section = "agents"
+    label = "Agent"
+    _parse = staticmethod(_parse_agent)
+
+    @staticmethod
+    def _facets(spec: Dict[str, Any]) -> Iterable[Tuple[str, str]]:
+        model = spec.get("model")
+        if isinstance(model, dict):
+            model = model.get("value")
+        if isinstance(model, str):
+            yield "model", model
+        for tool in spec.get("tools") or []:
+            if isinstance(tool, dict) and tool.get("kind"):
+                yield "tool_kind", str(tool["kind"])
+        if isinstance(spec.get("output_key"), str):
+            yield "output_key", spec["output_key"]
 
     def get(self, agent_id: str) -> Agent:
         """Return the parsed Agent entry for an id.
@@ -77,10 +66,9 @@ class DeclarativeAgentRegistry:
 
         Raises:
             KeyError: If the id is not present in the registry.
+            ValueError: If a lazily indexed entry fails validation.
         """
-        if agent_id not in self._agents_by_id:
-            raise KeyError(f"Agent id not found: {agent_id}")
-        return self._agents_by_id[agent_id]
+        return super().get(agent_id)
 
     def get_group(self, group_id: str) -> List[Agent]:
         """Return agents for a group id.
@@ -94,15 +82,4 @@ class DeclarativeAgentRegistry:
         Raises:
             KeyError: If the group id is not found.
         """
-        ids = self._groups.get(group_id)
-        if ids is None:
-            raise KeyError(f"Agent group id not found: {group_id}")
-        return [self.get(aid) for aid in ids]
-
-    def list_ids(self) -> List[str]:
-        """Return all agent ids in sorted order."""
-        return sorted(self._agents_by_id.keys())
-
-    def list_groups(self) -> List[str]:
-        """Return all group ids in sorted order."""
-        return sorted(self._groups.keys())
+        return super().get_group(group_id)
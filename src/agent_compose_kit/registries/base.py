@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, Generic, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+#: Facets understood by ``DeclarativeRegistry.find``.
+FACETS = ("model", "tool_kind", "ref", "output_key", "group", "label")
+
+Posting = Tuple[str, str]
+
+
+def iter_refs(value: Any) -> Iterator[str]:
+    """Yield every ``registry://`` string nested anywhere in a raw spec."""
+    if isinstance(value, str):
+        if value.startswith("registry://"):
+            yield value
+    elif isinstance(value, dict):
+        for v in value.values():
+            yield from iter_refs(v)
+    elif isinstance(value, list):
+        for v in value:
+            yield from iter_refs(v)
+
+
+def _ref_postings(spec: Dict[str, Any]) -> Iterator[Posting]:
+    for ref in iter_refs(spec):
+        yield "ref", ref
+        yield "ref", ref.split("@", 1)[0]  # any version of the same kind/key
+
+
+class DeclarativeRegistry(Generic[T]):
+    """Shared machinery of the declarative agent/tool registries.
+
+    Entries are ``{"id": ..., "labels": {...}, <spec>}`` mappings under
+    ``section``; groups are ``{"id": ..., "include": [...]}`` mappings under
+    ``groups``, where an ``include`` item is an entry id or ``{"group": id}``
+    (nested group). ``labels`` is registry metadata and is not part of the
+    parsed model. Subclasses set ``section``, ``label`` (used in error messages),
+    ``_parse`` and ``_facets``.
+
+    Args:
+        spec: Registry spec mapping.
+        lazy: Index raw entry specs and validate each one on its first
+            ``get``/``get_group`` (memoized) instead of all of them up front.
+            Use ``validate_all`` to surface every validation error (e.g., in CI).
+        parsed: Already validated models by entry id (e.g., from
+            ``registries.loader.load_shard``); adopted as-is instead of parsing
+            those entries again, lazy or not.
+    """
+
+    section = ""
+    label = ""
+    _parse: Callable[[Dict[str, Any]], T]
+
+    def __init__(
+        self, spec: Dict[str, Any] | None, *, lazy: bool = False, parsed: Optional[Dict[str, T]] = None
+    ) -> None:
+        self.lazy = lazy
+        self._raw: Dict[str, Dict[str, Any]] = {}
+        self._labels: Dict[str, Dict[str, str]] = {}
+        self._by_id: Dict[str, T] = {}
+        # group id -> include items as (is_group, id)
+        self._groups: Dict[str, List[Tuple[bool, str]]] = {}
+        # group id -> (flattened member ids, same ids as an ordered set); cleared by ``add_group``
+        self._flat: Dict[str, Tuple[List[str], Dict[str, None]]] = {}
+        self._lock = threading.RLock()
+        # facet -> value -> ids (dicts used as insertion-ordered sets); built on first ``find``
+        self._index: Optional[Dict[str, Dict[str, Dict[str, None]]]] = None
+        self._postings: Dict[str, List[Posting]] = {}
+        self._frozen = False
+        spec = spec or {}
+        parsed = parsed or {}
+        for e in spec.get(self.section) or []:
+            if e.get("id"):
+                self._store(e, parsed.get(str(e["id"])))
+        for g in spec.get("groups") or []:
+            if g.get("id"):
+                self.add_group(g)
+
+    @staticmethod
+    def _facets(spec: Dict[str, Any]) -> Iterable[Posting]:
+        """Entry-type specific ``(facet, value)`` pairs of a raw entry spec."""
+        return ()
+
+    def add(self, entry: Dict[str, Any]) -> None:
+        """Add or replace one entry (``{"id": ..., <spec>}``) and update the query index.
+
+        Raises:
+            ValueError: If ``id`` is missing or (when not lazy) the entry fails validation.
+            RuntimeError: If the registry is frozen.
+        """
+        if not entry.get("id"):
+            raise ValueError(f"{self.label} entry has no id")
+        self._check_mutable()
+        with self._lock:
+            self._store(entry)
+
+    def _store(self, entry: Dict[str, Any], parsed: Optional[T] = None) -> None:
+        eid = str(entry["id"])
+        # copy minus id and registry metadata
+        espec = {k: v for k, v in entry.items() if k != "id" and k != "labels"}
+        if parsed is None and not self.lazy:
+            parsed = self._parse(espec)
+        self._raw[eid] = espec
+        labels = entry.get("labels")
+        if labels:
+            self._labels[eid] = {str(k): str(v) for k, v in labels.items()}
+        else:
+            self._labels.pop(eid, None)
+        self._by_id.pop(eid, None)
+        if parsed is not None:
+            self._by_id[eid] = parsed
+        if self._index is not None:
+            self._unindex(eid)
+            self._index_entry(eid)
+
+    def add_group(self, group: Dict[str, Any]) -> None:
+        """Add or replace one group (``{"id": ..., "include": [...]}``).
+
+        Raises:
+            ValueError: If ``id`` is missing or the group would take part in an
+                include cycle (the registry is left unchanged).
+            RuntimeError: If the registry is frozen.
+        """
+        gid = group.get("id")
+        if not gid:
+            raise ValueError(f"{self.label} group has no id")
+        self._check_mutable()
+        gid = str(gid)
+        items = [(True, str(x["group"])) if isinstance(x, dict) else (False, str(x)) for x in group.get("include") or []]
+        with self._lock:
+            cycle = self._find_cycle(gid, items)
+            if cycle:
+                raise ValueError(f"{self.label} group cycle: {' -> '.join(cycle)}")
+            self._groups[gid] = items
+            self._flat.clear()
+
+    def freeze(self) -> "DeclarativeRegistry[T]":
+        """Disallow further ``add``/``add_group`` calls (published snapshots); returns ``self``.
+
+        Lazy validation and memoization still happen; they do not change what
+        readers observe.
+        """
+        self._frozen = True
+        return self
+
+    def _check_mutable(self) -> None:
+        if self._frozen:
+            raise RuntimeError(f"{self.label} registry is frozen (published snapshot)")
+
+    def _find_cycle(self, gid: str, items: List[Tuple[bool, str]]) -> Optional[List[str]]:
+        """Path ``gid -> ... -> gid`` if giving ``gid`` these items closes a cycle."""
+        stack = [(sub, [gid, sub]) for is_group, sub in items if is_group]
+        seen = set()
+        while stack:
+            node, path = stack.pop()
+            if node == gid:
+                return path
+            if node in seen:
+                continue
+            seen.add(node)
+            for is_group, sub in self._groups.get(node, ()):
+                if is_group:
+                    stack.append((sub, path + [sub]))
+        return None
+
+    def _flatten(self, group_id: str) -> Tuple[List[str], Dict[str, None]]:
+        hit = self._flat.get(group_id)
+        if hit is not None:
+            return hit
+        items = self._groups.get(group_id)
+        if items is None:
+            raise KeyError(f"{self.label} group id not found: {group_id}")
+        members: List[str] = []
+        for is_group, sub in items:
+            if is_group:
+                members += self._flatten(sub)[0]
+            else:
+                members.append(sub)
+        hit = self._flat[group_id] = (members, dict.fromkeys(members))
+        return hit
+
+    def _members(self, group_id: str) -> List[str]:
+        """Flattened member ids of a group, nested groups expanded in place (duplicates kept), memoized."""
+        return self._flatten(group_id)[0]
+
+    def _index_entry(self, eid: str) -> None:
+        assert self._index is not None
+        spec = self._raw[eid]
+        postings = list(dict.fromkeys([*self._facets(spec), *_ref_postings(spec)]))
+        for k, v in self._labels.get(eid, {}).items():
+            postings += [("label", k), ("label", f"{k}={v}")]
+        for facet, value in postings:
+            self._index[facet].setdefault(value, {})[eid] = None
+        self._postings[eid] = postings
+
+    def _unindex(self, eid: str) -> None:
+        assert self._index is not None
+        for facet, value in self._postings.pop(eid, ()):
+            ids = self._index[facet].get(value)
+            if ids is not None:
+                ids.pop(eid, None)
+                if not ids:
+                    del self._index[facet][value]
+
+    def _ensure_index(self) -> Dict[str, Dict[str, Dict[str, None]]]:
+        if self._index is None:
+            self._index = {f: {} for f in FACETS}
+            for eid in self._raw:
+                self._index_entry(eid)
+        return self._index
+
+    def find(self, **facets: str) -> List[str]:
+        """Return the ids matching every given facet.
+
+        Ids come in insertion order (include order for ``group``).
+
+        Facets: ``model`` (string or ``alias://`` ref), ``tool_kind``, ``ref``
+        (``registry://kind/key@version`` or, for any version,
+        ``registry://kind/key``), ``output_key``, ``group`` (members of a
+        group, nested groups flattened) and ``label`` (``key`` or
+        ``key=value``). Each lookup is a dict probe; the index is built on the
+        first call and maintained by ``add``.
+
+        Raises:
+            ValueError: On an unknown facet name.
+        """
+        unknown = set(facets) - set(FACETS)
+        if unknown:
+            raise ValueError(f"unknown facet(s): {', '.join(sorted(unknown))}; expected one of {', '.join(FACETS)}")
+        with self._lock:
+            index = self._ensure_index()
+            sets = [self._group_set(str(v)) if f == "group" else index[f].get(str(v), {}) for f, v in facets.items()]
+            if not sets:
+                return list(self._raw)
+            smallest, *rest = sorted(sets, key=len)
+            return [eid for eid in smallest if all(eid in s for s in rest)]
+
+    def _group_set(self, group_id: str) -> Dict[str, None]:
+        try:
+            return self._flatten(group_id)[1]
+        except KeyError:
+            return {}
+
+    def get(self, entry_id: str) -> T:
+        """Return the parsed entry for an id (validated on first access when lazy).
+
+        Raises:
+            KeyError: If the id is not present in the registry.
+            ValueError: If a lazily indexed entry fails validation.
+        """
+        hit = self._by_id.get(entry_id)
+        if hit is not None:
+            return hit
+        raw = self._raw.get(entry_id)
+        if raw is None:
+            raise KeyError(f"{self.label} id not found: {entry_id}")
+        parsed = self._parse(raw)
+        with self._lock:
+            # another thread may have won the race; keep a single instance
+            if self._raw.get(entry_id) is not raw:  # replaced by ``add`` meanwhile
+                return self.get(entry_id)
+            return self._by_id.setdefault(entry_id, parsed)
+
+    def get_group(self, group_id: str) -> List[T]:
+        """Return the entries of a group in declared order, nested groups expanded in place.
+
+        An id listed more than once is returned once per listing, as for flat
+        groups. Flattened membership is memoized until the next ``add_group``.
+
+        Raises:
+            KeyError: If the group id (or a member or nested group id) is not found.
+        """
+        with self._lock:
+            ids = list(self._members(group_id))
+        return [self.get(eid) for eid in ids]
+
+    def labels(self, entry_id: str) -> Dict[str, str]:
+        """Return the registry labels of an entry.
+
+        Raises:
+            KeyError: If the id is not present in the registry.
+        """
+        if entry_id not in self._raw:
+            raise KeyError(f"{self.label} id not found: {entry_id}")
+        return dict(self._labels.get(entry_id, {}))
+
+    def validate_all(self) -> int:
+        """Validate every entry not validated yet and return the number of entries.
+
+        Groups are flattened too, so unknown member or nested group ids are
+        reported alongside invalid entries.
+
+        Raises:
+            ValueError: Listing every entry that fails validation.
+        """
+        errors: List[str] = []
+        for gid in list(self._groups):
+            try:
+                with self._lock:
+                    missing = [eid for eid in self._flatten(gid)[1] if eid not in self._raw]
+            except KeyError as e:
+                errors.append(f"group {gid}: {e.args[0]}")
+                continue
+            if missing:
+                errors.append(f"group {gid}: unknown {self.label.lower()} id(s): {', '.join(missing)}")
+        for eid in list(self._raw):
+            if eid in self._by_id:
+                continue
+            try:
+                self.get(eid)
+            except ValueError as e:
+                errors.append(f"{eid}: {e}")
+        if errors:
+            raise ValueError(f"{len(errors)} invalid {self.label.lower()} entries:\n" + "\n".join(errors))
+        return len(self._raw)
+
+    def list_ids(self) -> List[str]:
+        """Return all entry ids in sorted order."""
+        return sorted(self._raw)
+
+    def list_groups(self) -> List[str]:
+        """Return all group ids in sorted order."""
+        return sorted(self._groups.keys())
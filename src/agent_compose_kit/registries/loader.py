@@ -0,0 +1,168 @@
+"""Load declarative registries from a directory of YAML shards.
+
+Each shard is a registry spec fragment (``{"agents": [...], "groups": [...]}``
+or ``{"tools": [...], ...}``). Shards are parsed and validated in a process
+pool and merged in path order; ids declared in more than one place are
+reported with their file locations instead of silently overriding each other.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .agents import DeclarativeAgentRegistry, _parse_agent
+from .tools import DeclarativeToolRegistry, _parse_tool
+
+_REGISTRIES = {"agents": (DeclarativeAgentRegistry, _parse_agent), "tools": (DeclarativeToolRegistry, _parse_tool)}
+
+# (path, entries, groups, parsed models by entry position, errors)
+ShardResult = Tuple[str, List[Dict[str, Any]], List[Dict[str, Any]], Dict[int, Any], List[str]]
+
+
+def load_shard(path: str, section: str, validate: bool = True) -> ShardResult:
+    """Parse one shard (and, with ``validate``, its entries). Runs in pool workers.
+
+    Errors are returned rather than raised so one bad shard does not hide the
+    others.
+    """
+    import yaml
+
+    from ..config.models import _YamlLoader
+
+    parse = _REGISTRIES[section][1]
+    try:
+        doc = yaml.load(Path(path).read_text(encoding="utf-8"), Loader=_YamlLoader) or {}
+    except (OSError, yaml.YAMLError) as e:
+        return path, [], [], {}, [f"{path}: {e}"]
+    if not isinstance(doc, dict):
+        return path, [], [], {}, [f"{path}: expected a mapping with '{section}' and/or 'groups'"]
+    entries = [e for e in doc.get(section) or [] if isinstance(e, dict)]
+    groups = [g for g in doc.get("groups") or [] if isinstance(g, dict)]
+    parsed: Dict[int, Any] = {}
+    errors: List[str] = []
+    for i, e in enumerate(entries):
+        if not e.get("id"):
+            errors.append(f"{path}: {section}[{i}] has no id")
+        elif validate:
+            try:
+                parsed[i] = parse({k: v for k, v in e.items() if k != "id" and k != "labels"})
+            except ValueError as exc:
+                errors.append(f"{path}: {e['id']}: {exc}")
+    return path, entries, groups, parsed, errors
+
+
+def _line_of(path: str, section: str, index: int) -> Optional[int]:
+    """1-based line of the ``id`` of the ``index``-th mapping under ``section`` in a shard.
+
+    Best effort, used for error reports only.
+    """
+    import yaml
+
+    from ..config.models import _YamlLoader
+
+    try:
+        root = yaml.compose(Path(path).read_text(encoding="utf-8"), Loader=_YamlLoader)
+    except (OSError, yaml.YAMLError):
+        return None
+    if not isinstance(root, yaml.MappingNode):
+        return None
+    seq = next((v for k, v in root.value if k.value == section), None)
+    if not isinstance(seq, yaml.SequenceNode):
+        return None
+    # same filtering as load_shard, so positions line up
+    items = [n for n in seq.value if isinstance(n, yaml.MappingNode)]
+    if index >= len(items):
+        return None
+    node = next((k for k, _ in items[index].value if k.value == "id"), items[index])
+    return node.start_mark.line + 1
+
+
+def _duplicates(seen: Dict[str, List[Tuple[str, int]]], what: str, section: str) -> List[str]:
+    out = []
+    for eid, locs in seen.items():
+        if len(locs) > 1:
+            where = ", ".join(f"{p}:{_line_of(p, section, i) or f'#{i}'}" for p, i in locs)
+            out.append(f"duplicate {what} id {eid!r}: {where}")
+    return out
+
+
+def load_registry_dir(
+    path: Union[str, Path],
+    section: str = "agents",
+    *,
+    pattern: str = "**/*.y*ml",
+    lazy: bool = False,
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Union[DeclarativeAgentRegistry, DeclarativeToolRegistry]:
+    """Build a declarative registry from every shard under ``path``.
+
+    Args:
+        path: Directory of YAML shards.
+        section: ``"agents"`` or ``"tools"``.
+        pattern: Glob (relative to ``path``) selecting shard files.
+        lazy: Skip validation while loading; the registry validates on first
+            ``get`` (see ``DeclarativeRegistry``).
+        max_workers: Process pool size (default: CPU count). ``1`` loads inline.
+        executor: Existing executor to use instead of creating a process pool.
+
+    Returns:
+        ``DeclarativeAgentRegistry`` or ``DeclarativeToolRegistry``.
+
+    Raises:
+        ValueError: For an unknown ``section``, or listing every unreadable
+            shard, invalid entry and duplicate entry/group id (with
+            ``file:line`` locations).
+    """
+    if section not in _REGISTRIES:
+        raise ValueError(f"section must be one of {', '.join(_REGISTRIES)}")
+    files = sorted(str(p) for p in Path(path).glob(pattern) if p.is_file())
+    args = (files, [section] * len(files), [not lazy] * len(files))
+    workers = max_workers or os.cpu_count() or 1
+    if executor is not None:
+        results = list(executor.map(load_shard, *args))
+    elif workers <= 1 or len(files) <= 1:
+        results = [load_shard(*a) for a in zip(*args)]
+    else:
+        chunk = max(1, len(files) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(load_shard, *args, chunksize=chunk))
+    return merge_shards(results, section, lazy=lazy, source=path)
+
+
+def merge_shards(
+    results: List[ShardResult], section: str, *, lazy: bool = False, source: Union[str, Path] = "shards"
+) -> Union[DeclarativeAgentRegistry, DeclarativeToolRegistry]:
+    """Merge ``load_shard`` results (in the given order) into a new registry.
+
+    Raises:
+        ValueError: Listing every shard error and duplicate entry/group id.
+    """
+    entries: List[Dict[str, Any]] = []
+    groups: List[Dict[str, Any]] = []
+    parsed: Dict[str, Any] = {}
+    errors: List[str] = []
+    seen: Dict[str, List[Tuple[str, int]]] = {}
+    seen_groups: Dict[str, List[Tuple[str, int]]] = {}
+    for shard, shard_entries, shard_groups, shard_parsed, shard_errors in results:
+        errors += shard_errors
+        for i, e in enumerate(shard_entries):
+            if e.get("id"):
+                seen.setdefault(str(e["id"]), []).append((shard, i))
+                entries.append(e)
+                if i in shard_parsed:
+                    parsed[str(e["id"])] = shard_parsed[i]
+        for i, g in enumerate(shard_groups):
+            if g.get("id"):
+                seen_groups.setdefault(str(g["id"]), []).append((shard, i))
+                groups.append(g)
+    errors += _duplicates(seen, section[:-1], section) + _duplicates(seen_groups, "group", "groups")
+    if errors:
+        raise ValueError(f"{len(errors)} problem(s) loading {section} from {source}:\n" + "\n".join(errors))
+
+    cls = _REGISTRIES[section][0]
+    # entries were validated by load_shard; adopt their models instead of re-parsing
+    return cls({section: entries, "groups": groups}, lazy=lazy, parsed=parsed)
@@ -0,0 +1,345 @@
+"""Hot-reloadable registry snapshots.
+
+A ``HotReloader`` holds one immutable snapshot built by a source and swaps in
+a new one, by a single reference assignment, when the source's files change.
+Readers call ``reloader.current`` and keep using whatever object they got; they
+never block on a rebuild and never see a half-built snapshot. A failed rebuild
+(e.g., a duplicate id introduced by an edit) keeps the previous snapshot and
+is recorded in ``metrics()``.
+
+Sources:
+
+- ``ShardSource`` - a directory of YAML shards (see ``registries.loader``);
+  only added or modified shards are re-parsed.
+- ``registry.snapshot.FsRegistrySource`` - a filesystem system registry.
+
+Changes are detected with inotify on Linux (via ``ctypes``, no extra
+dependency) and by polling file stats elsewhere or when ``use_inotify=False``.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .agents import DeclarativeAgentRegistry
+from .loader import ShardResult, load_shard, merge_shards
+from .tools import DeclarativeToolRegistry
+
+S = TypeVar("S")
+
+
+class SnapshotSource(Protocol[S]):
+    """What ``HotReloader`` needs from a source."""
+
+    def token(self) -> Hashable:
+        """Cheap fingerprint of the source's files (stats); a change triggers ``build``."""
+        ...
+
+    def build(self) -> S:
+        """Build a new immutable snapshot."""
+        ...
+
+    def watch_paths(self) -> List[Path]:
+        """Directories to watch for changes."""
+        ...
+
+
+@dataclass(frozen=True)
+class ReloadMetrics:
+    version: int
+    reloads: int
+    failures: int
+    last_rebuild_seconds: float
+    max_rebuild_seconds: float
+    last_publish_seconds: float  # swap, version/metrics update and ``on_reload`` of the last reload
+    last_reload_at: Optional[float]
+    last_error: Optional[str]
+    watcher: str
+
+
+def _stat_key(path: Path) -> Tuple[int, int]:
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+class ShardSource:
+    """Directory of registry shards; rebuilds re-parse only new or modified shards.
+
+    Args:
+        path: Shard directory.
+        section: ``"agents"`` or ``"tools"``.
+        pattern: Glob selecting shard files.
+        lazy: Build lazy registries (see ``DeclarativeRegistry``).
+    """
+
+    def __init__(self, path: Union[str, Path], section: str = "agents", *, pattern: str = "**/*.y*ml", lazy: bool = False) -> None:
+        self.path = Path(path)
+        self.section = section
+        self.pattern = pattern
+        self.lazy = lazy
+        self._shards: Dict[str, Tuple[Tuple[int, int], ShardResult]] = {}
+        self.reparsed: List[str] = []  # shards parsed by the last build
+
+    def _files(self) -> Dict[str, Tuple[int, int]]:
+        out = {}
+        for p in self.path.glob(self.pattern):
+            try:
+                if p.is_file():
+                    out[str(p)] = _stat_key(p)
+            except FileNotFoundError:
+                continue
+        return out
+
+    def token(self) -> Hashable:
+        return frozenset(self._files().items())
+
+    def build(self) -> Union[DeclarativeAgentRegistry, DeclarativeToolRegistry]:
+        files = self._files()
+        shards = {}
+        self.reparsed = []
+        for f, key in files.items():
+            hit = self._shards.get(f)
+            if hit is None or hit[0] != key:
+                hit = (key, load_shard(f, self.section, not self.lazy))
+                self.reparsed.append(f)
+            shards[f] = hit
+        # merge first: a failing build keeps the previous shard cache consistent with the live snapshot
+        reg = merge_shards([shards[f][1] for f in sorted(shards)], self.section, lazy=self.lazy, source=self.path)
+        self._shards = shards
+        return reg.freeze()
+
+    def watch_paths(self) -> List[Path]:
+        if not self.path.is_dir():
+            return []
+        return [self.path, *(p for p in self.path.rglob("*") if p.is_dir())]
+
+
+class _Inotify:
+    """Minimal inotify wrapper (Linux): watch directories, wait for any event."""
+
+    _MASK = 0x2 | 0x4 | 0x8 | 0x40 | 0x80 | 0x100 | 0x200 | 0x400 | 0x800  # modify, attrib, close_write, moves, create, delete, self
+
+    def __init__(self) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._libc = libc
+        self.fd = fd
+        self._watched: Dict[str, int] = {}
+
+    def watch(self, paths: List[Path]) -> None:
+        for p in paths:
+            key = str(p)
+            if key not in self._watched:
+                wd = self._libc.inotify_add_watch(self.fd, os.fsencode(key), self._MASK)
+                if wd >= 0:
+                    self._watched[key] = wd
+
+    def drain(self) -> int:
+        events = 0
+        while True:
+            try:
+                buf = os.read(self.fd, 65536)
+            except BlockingIOError:
+                return events
+            off = 0
+            while off + 16 <= len(buf):
+                _, _, _, name_len = struct.unpack_from("iIII", buf, off)
+                off += 16 + name_len
+                events += 1
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def _open_inotify() -> Optional[_Inotify]:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        return _Inotify()
+    except (OSError, AttributeError):
+        return None
+
+
+class HotReloader(Generic[S]):
+    """Keep an up-to-date immutable snapshot of a source and swap it atomically.
+
+    Args:
+        source: A ``SnapshotSource`` (``ShardSource``, ``FsRegistrySource``, ...).
+        interval: Polling period in seconds (also the inotify wait timeout).
+        debounce: After an inotify event, wait this long for related writes
+            before rebuilding.
+        use_inotify: Use inotify when available; otherwise poll.
+        on_reload: Called with the new snapshot after each swap.
+
+    Raises:
+        Exception: Whatever ``source.build()`` raises for the initial snapshot.
+    """
+
+    def __init__(
+        self,
+        source: SnapshotSource[S],
+        *,
+        interval: float = 1.0,
+        debounce: float = 0.05,
+        use_inotify: bool = True,
+        on_reload: Optional[Callable[[S], Any]] = None,
+    ) -> None:
+        self.source = source
+        self.interval = interval
+        self.debounce = debounce
+        self.use_inotify = use_inotify
+        self.on_reload = on_reload
+        self._reload_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._wake_r, self._wake_w = -1, -1
+        self._watcher = "stopped"
+        self._version = 0
+        self._reloads = 0
+        self._failures = 0
+        self._last_rebuild = 0.0
+        self._max_rebuild = 0.0
+        self._last_publish = 0.0
+        self._last_reload_at: Optional[float] = None
+        self._last_error: Optional[str] = None
+        self._token = source.token()
+        self._swap(self._timed_build())
+
+    _snapshot: S
+
+    @property
+    def current(self) -> S:
+        """The live snapshot (a plain attribute read; never blocks)."""
+        return self._snapshot
+
+    def _timed_build(self) -> S:
+        t0 = time.perf_counter()
+        snap = self.source.build()
+        self._last_rebuild = time.perf_counter() - t0
+        self._max_rebuild = max(self._max_rebuild, self._last_rebuild)
+        return snap
+
+    def _swap(self, snap: S) -> None:
+        self._snapshot = snap
+        self._version += 1
+        self._last_reload_at = time.time()
+
+    def reload(self, *, force: bool = False) -> bool:
+        """Rebuild and swap if the source changed (or ``force``); return whether a swap happened.
+
+        A failing build is recorded in ``metrics()`` and the previous snapshot
+        stays live.
+        """
+        with self._reload_lock:
+            token = self.source.token()
+            if token == self._token and not force:
+                return False
+            try:
+                snap = self._timed_build()
+            except Exception as e:  # keep serving the previous snapshot
+                self._failures += 1
+                self._last_error = f"{type(e).__name__}: {e}"
+                self._token = token  # do not retry until the files change again
+                return False
+            self._token = token
+            previous = self._snapshot  # freed after timing; deallocation is not publishing
+            t0 = time.perf_counter()
+            self._swap(snap)
+            self._reloads += 1
+            self._last_error = None
+        if self.on_reload is not None:
+            self.on_reload(snap)
+        self._last_publish = time.perf_counter() - t0
+        del previous
+        return True
+
+    def start(self) -> "HotReloader[S]":
+        """Start the background watcher thread (idempotent)."""
+        if self._thread is not None:
+            return self
+        self._stop.clear()
+        self._wake_r, self._wake_w = os.pipe()
+        self._thread = threading.Thread(target=self._run, name="registry-hot-reload", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the watcher thread."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        os.write(self._wake_w, b"x")
+        self._thread.join(timeout)
+        self._thread = None
+        for fd in (self._wake_r, self._wake_w):
+            os.close(fd)
+        self._watcher = "stopped"
+
+    def __enter__(self) -> "HotReloader[S]":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        ino = _open_inotify() if self.use_inotify else None
+        self._watcher = "inotify" if ino is not None else "poll"
+        try:
+            if ino is not None:
+                ino.watch(self.source.watch_paths())
+            while not self._stop.is_set():
+                fds = [self._wake_r] + ([ino.fd] if ino is not None else [])
+                ready, _, _ = select.select(fds, [], [], self.interval)
+                if self._stop.is_set():
+                    break
+                fired = ino is not None and ino.fd in ready
+                if fired:
+                    self._stop.wait(self.debounce)
+                    ino.drain()
+                try:
+                    self.reload()
+                    if fired:
+                        ino.watch(self.source.watch_paths())  # pick up new directories
+                except Exception as e:  # pragma: no cover - token() failures; keep watching
+                    self._failures += 1
+                    self._last_error = f"{type(e).__name__}: {e}"
+        finally:
+            if ino is not None:
+                ino.close()
+
+    def metrics(self) -> ReloadMetrics:
+        return ReloadMetrics(
+            version=self._version,
+            reloads=self._reloads,
+            failures=self._failures,
+            last_rebuild_seconds=self._last_rebuild,
+            max_rebuild_seconds=self._max_rebuild,
+            last_publish_seconds=self._last_publish,
+            last_reload_at=self._last_reload_at,
+            last_error=self._last_error,
+            watcher=self._watcher,
+        )
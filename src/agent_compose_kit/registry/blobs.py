@@ -0,0 +1,166 @@
+"""Content-addressed config storage for the filesystem registry.
+
+``save_system`` stores each config once as ``<root>/.blobs/<id[:2]>/<id>.yaml``,
+where ``id`` is ``fingerprint(cfg)`` (sha256 of the normalized config). The
+version directory keeps only ``manifest.json`` with a ``"blob"`` field, so
+versions that differ in nothing but their name share one file. Versions
+written by older releases (``<version>/config.yaml``) still load;
+``migrate_to_blobs`` converts them and ``gc_blobs`` deletes blobs no version
+references.
+
+Command line: ``python -m agent_compose_kit.registry.blobs {gc,migrate} [root]``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Iterator, List, Optional, Set
+
+from ..config.models import AppConfig
+
+BLOBS_DIR = ".blobs"
+
+
+def blob_path(root: str | Path, blob: str) -> Path:
+    """Path of blob ``blob`` under registry ``root``."""
+    return Path(root).resolve() / BLOBS_DIR / blob[:2] / f"{blob}.yaml"
+
+
+def blob_id(cfg: AppConfig) -> str:
+    """Blob id of ``cfg``: ``fingerprint`` of its JSON-mode dump."""
+    from ..quickfix.fixes import fingerprint
+
+    return fingerprint(cfg.model_dump(mode="json"))
+
+
+def write_blob(root: str | Path, cfg: AppConfig) -> str:
+    """Store ``cfg`` unless an identical config is already stored; return its blob id.
+
+    An existing blob has its mtime refreshed so a concurrent ``gc_blobs``
+    treats it as recently written.
+    """
+    import yaml
+
+    from .fs import _atomic_write_text
+
+    blob = blob_id(cfg)
+    path = blob_path(root, blob)
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        _atomic_write_text(path, yaml.safe_dump(cfg.model_dump(), sort_keys=False))
+    return blob
+
+
+def _manifests(rootp: Path) -> Iterator[Path]:
+    if not rootp.exists():
+        return
+    for base in rootp.iterdir():
+        if base.is_dir() and not base.name.startswith("."):
+            for entry in base.iterdir():
+                if entry.is_dir() and not entry.name.startswith("."):
+                    yield entry / "manifest.json"
+
+
+def referenced_blobs(root: str | Path = "registry") -> Set[str]:
+    """Blob ids referenced by any version manifest under ``root``."""
+    refs: Set[str] = set()
+    for path in _manifests(Path(root).resolve()):
+        try:
+            blob = json.loads(path.read_text(encoding="utf-8")).get("blob")
+        except (FileNotFoundError, ValueError):
+            continue
+        if blob:
+            refs.add(blob)
+    return refs
+
+
+def gc_blobs(root: str | Path = "registry", *, grace: float = 3600.0, dry_run: bool = False) -> List[str]:
+    """Delete blobs that no version references.
+
+    Args:
+        root: Registry root.
+        grace: Keep unreferenced blobs modified within this many seconds, so a
+            ``save_system`` that has written its blob but not yet its manifest
+            is not collected.
+        dry_run: Only report what would be deleted.
+
+    Returns:
+        Sorted ids of the deleted (or, with ``dry_run``, deletable) blobs.
+    """
+    rootp = Path(root).resolve()
+    blobs_dir = rootp / BLOBS_DIR
+    if not blobs_dir.is_dir():
+        return []
+    refs = referenced_blobs(rootp)
+    cutoff = time.time() - grace
+    removed: List[str] = []
+    for path in blobs_dir.glob("*/*.yaml"):
+        if path.stem in refs:
+            continue
+        try:
+            if path.stat().st_mtime > cutoff:
+                continue
+            if not dry_run:
+                path.unlink()
+        except FileNotFoundError:
+            continue
+        removed.append(path.stem)
+    return sorted(removed)
+
+
+def migrate_to_blobs(root: str | Path = "registry") -> int:
+    """Move ``<version>/config.yaml`` files written by older releases into blobs.
+
+    Legacy copied tag directories are left alone (the next ``promote`` of the
+    tag replaces them). Returns the number of versions converted.
+    """
+    from ..config.models import load_config_file
+    from .fs import _atomic_write_text, _is_legacy_tag
+    from .index import record
+
+    rootp = Path(root).resolve()
+    converted = 0
+    for manifest_path in list(_manifests(rootp)):
+        entry = manifest_path.parent
+        cfg_path = entry / "config.yaml"
+        if not cfg_path.is_file() or _is_legacy_tag(entry):
+            continue
+        blob = write_blob(rootp, load_config_file(cfg_path))
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            manifest = {"name": entry.parent.name, "version": entry.name}
+        manifest["blob"] = blob
+        _atomic_write_text(manifest_path, json.dumps(manifest, indent=2))
+        cfg_path.unlink()
+        sha = hashlib.sha256(blob_path(rootp, blob).read_bytes()).hexdigest()
+        record(rootp, {"op": "save", "name": entry.parent.name, "version": entry.name, "sha256": sha, "blob": blob, "manifest": manifest})
+        converted += 1
+    return converted
+
+
+def _main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    ap = argparse.ArgumentParser(prog="python -m agent_compose_kit.registry.blobs")
+    ap.add_argument("command", choices=["gc", "migrate"])
+    ap.add_argument("root", nargs="?", default="registry")
+    ap.add_argument("--dry-run", action="store_true")
+    ap.add_argument("--grace", type=float, default=3600.0)
+    args = ap.parse_args(argv)
+    if args.command == "migrate":
+        print(f"converted {migrate_to_blobs(args.root)} versions")
+        return 0
+    removed = gc_blobs(args.root, grace=args.grace, dry_run=args.dry_run)
+    for blob in removed:
+        print(blob)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(_main())
@@ -1,75 +1,264 @@
+"""Filesystem registry of system configs.
+
+Layout::
+
+    <root>/<name>/<version>/manifest.json  # saved versions: {"name", "version", "blob"}
+    <root>/.blobs/<id[:2]>/<id>.yaml       # configs, stored once per content (``registry.blobs``)
+    <root>/<name>/.tags/<tag>.json         # tag pointers: {"version": "<version>"}
+
+Tags are small pointer files replaced with an atomic rename, so promotion is
+O(1) and readers always see either the old or the new target. Version
+directories holding their own ``config.yaml`` and tag directories written by
+older releases (full copies) are still readable.
+"""
+
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import tempfile
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from ..config.models import AppConfig
 
+if TYPE_CHECKING:
+    from ..config.cache import ConfigCache
+
+
+_TAGS_DIR = ".tags"
+
 
 def _sys_dir(root: Path, name: str) -> Path:
     return (root / name).resolve()
 
 
+def _atomic_write_text(path: Path, text: str) -> None:
+    """Write ``text`` to ``path`` via a temp file + ``os.replace`` (atomic on POSIX/NTFS)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _tag_path(base: Path, tag: str) -> Path:
+    return base / _TAGS_DIR / f"{tag}.json"
+
+
+def _read_tag(base: Path, tag: str) -> Optional[str]:
+    """Target version of a tag pointer, or ``None`` when the tag does not exist.
+
+    Raises:
+        ValueError: When the pointer file is truncated or malformed.
+    """
+    path = _tag_path(base, tag)
+    try:
+        version = json.loads(path.read_text(encoding="utf-8"))["version"]
+    except FileNotFoundError:
+        return None
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"corrupt tag pointer {path}: {type(e).__name__}: {e}") from e
+    if not isinstance(version, str) or not version:
+        raise ValueError(f"corrupt tag pointer {path}: 'version' must be a non-empty string")
+    return version
+
+
+def _is_legacy_tag(entry: Path) -> bool:
+    """A copied tag directory from older releases: its manifest names another version."""
+    try:
+        manifest = json.loads((entry / "manifest.json").read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return False
+    return manifest.get("version") not in (None, entry.name)
+
+
+def _config_path(base: Path, version: str) -> Path:
+    """Config file of a saved version: its own ``config.yaml`` (older releases) or its blob."""
+    legacy = base / version / "config.yaml"
+    if legacy.exists():
+        return legacy
+    try:
+        manifest = json.loads((base / version / "manifest.json").read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return legacy
+    if not manifest.get("blob"):
+        return legacy
+    from .blobs import blob_path
+
+    return blob_path(base.parent, manifest["blob"])
+
+
 def save_system(cfg: AppConfig, *, name: str, version: str, root: str | Path = "registry") -> Path:
-    """Save a system config under registry/<name>/<version>/config.yaml.
+    """Save a system config as registry/<name>/<version>/manifest.json pointing at its blob.
+
+    Identical configs share one blob (see ``registry.blobs``).
 
-    Returns the path to the saved config file.
+    Returns the path to the stored config (blob) file.
     """
-    import yaml
+    from .blobs import blob_path, write_blob
 
     rootp = Path(root).resolve()
     target = _sys_dir(rootp, name) / version
     target.mkdir(parents=True, exist_ok=True)
-    cfg_path = target / "config.yaml"
-    cfg_path.write_text(yaml.safe_dump(cfg.model_dump(), sort_keys=False), encoding="utf-8")
-    # write manifest
+    blob = write_blob(rootp, cfg)
     manifest = {
         "name": name,
         "version": version,
+        "blob": blob,
     }
-    (target / "manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
-    return cfg_path
+    _atomic_write_text(target / "manifest.json", json.dumps(manifest, indent=2))
+    legacy = target / "config.yaml"
+    if legacy.exists():  # re-save over a version written by an older release
+        legacy.unlink()
+    from .index import record
+
+    path = blob_path(rootp, blob)
+    sha = hashlib.sha256(path.read_bytes()).hexdigest()
+    record(rootp, {"op": "save", "name": name, "version": version, "sha256": sha, "blob": blob, "manifest": manifest})
+    return path
 
 
 def list_systems(*, root: str | Path = "registry") -> List[str]:
-    """List system names available under the registry root."""
+    """List system names available under the registry root.
+
+    Reads ``<root>/.index.jsonl`` when present (see ``registry.index``);
+    registries without an index are scanned.
+    """
+    from .index import read_index
+
+    state = read_index(root)
+    if state is not None:
+        return sorted(state)
     rootp = Path(root).resolve()
     if not rootp.exists():
         return []
-    return sorted([p.name for p in rootp.iterdir() if p.is_dir()])
+    return sorted([p.name for p in rootp.iterdir() if p.is_dir() and not p.name.startswith(".")])
 
 
 def list_versions(name: str, *, root: str | Path = "registry") -> List[str]:
-    """List versions/tags available for a given system name."""
+    """List versions/tags available for a given system name.
+
+    Semantic versions come first in semver order (``2.0.0`` before ``10.0.0``),
+    followed by other names such as tags, sorted lexically.
+    """
+    from .index import read_index
+    from .semver import version_sort_key
+
+    state = read_index(root)
+    if state is not None:
+        entry = state.get(name) or {"versions": {}, "tags": {}}
+        return sorted(set(entry["versions"]).union(entry["tags"]), key=version_sort_key)
     base = _sys_dir(Path(root).resolve(), name)
     if not base.exists():
         return []
-    return sorted([p.name for p in base.iterdir() if p.is_dir()])
+    names = {p.name for p in base.iterdir() if p.is_dir() and not p.name.startswith(".")}
+    names.update(list_tags(name, root=root))
+    return sorted(names, key=version_sort_key)
+
+
+def list_tags(name: str, *, root: str | Path = "registry") -> Dict[str, str]:
+    """Map tag name → version for a system (pointer tags only; index first).
+
+    Raises:
+        ValueError: When a tag pointer file is corrupt (unindexed registries only).
+    """
+    from .index import read_index
+
+    state = read_index(root)
+    if state is not None:
+        return dict(sorted(((state.get(name) or {}).get("tags") or {}).items()))
+    tags_dir = _sys_dir(Path(root).resolve(), name) / _TAGS_DIR
+    if not tags_dir.exists():
+        return {}
+    out: Dict[str, str] = {}
+    for p in tags_dir.iterdir():
+        if p.suffix == ".json" and not p.name.startswith("."):
+            v = _read_tag(tags_dir.parent, p.stem)
+            if v is not None:
+                out[p.stem] = v
+    return dict(sorted(out.items()))
+
+
+def resolve_version(name: str, version: str, *, root: str | Path = "registry") -> str:
+    """Return the version directory name that ``version`` (a version or tag) refers to.
+
+    Raises:
+        FileNotFoundError: When neither a version directory nor a tag exists.
+        ValueError: When the tag pointer file is corrupt.
+    """
+    base = _sys_dir(Path(root).resolve(), name)
+    if (base / version).is_dir():
+        return version
+    target = _read_tag(base, version)
+    if target is None:
+        raise FileNotFoundError(str(base / version))
+    return target
+
 
+def load_system(
+    name: str, version: str, *, root: str | Path = "registry", cache: Optional["ConfigCache"] = None
+) -> AppConfig:
+    """Load a saved AppConfig for system/version from the filesystem registry.
 
-def load_system(name: str, version: str, *, root: str | Path = "registry") -> AppConfig:
-    """Load a saved AppConfig for system/version from the filesystem registry."""
+    ``version`` may be a tag created by ``promote``. When ``cache`` is given,
+    unchanged versions are served from it without re-parsing.
 
-    cfg_path = _sys_dir(Path(root).resolve(), name) / version / "config.yaml"
+    Raises:
+        FileNotFoundError: When the version or tag does not exist.
+        ValueError: When the tag pointer file is corrupt or the config is invalid.
+    """
+
+    base = _sys_dir(Path(root).resolve(), name)
+    try:
+        cfg_path = _config_path(base, resolve_version(name, version, root=root))
+    except FileNotFoundError:
+        cfg_path = base / version / "config.yaml"
     if not cfg_path.exists():
         raise FileNotFoundError(str(cfg_path))
     from ..config.models import load_config_file
 
-    return load_config_file(cfg_path)
+    return load_config_file(cfg_path, cache=cache)
 
 
 def promote(name: str, version: str, tag: str, *, root: str | Path = "registry") -> Path:
-    """Create/update a tag (alias) as a copy of the version directory."""
+    """Point ``tag`` at ``version`` by atomically replacing a small pointer file.
+
+    Constant time regardless of config size; concurrent ``load_system`` calls
+    see either the previous or the new target, never a missing tag. ``version``
+    may itself be a tag (it is resolved first). A tag directory left by older
+    releases is swapped out after the pointer is written.
+
+    Returns:
+        Path to the tag pointer file.
+
+    Raises:
+        FileNotFoundError: When ``version`` does not exist.
+        ValueError: When ``tag`` is not a plain name or names a saved version.
+    """
+    if not tag or "/" in tag or "\\" in tag or tag.startswith("."):
+        raise ValueError(f"invalid tag name: {tag!r}")
     base = _sys_dir(Path(root).resolve(), name)
-    src = base / version
-    if not src.exists():
-        raise FileNotFoundError(str(src))
-    dst = base / tag
-    # Remove old tag if exists, then copytree
-    import shutil
-
-    if dst.exists():
-        shutil.rmtree(dst)
-    shutil.copytree(src, dst)
+    target = resolve_version(name, version, root=root)
+    if not (base / target).is_dir():
+        raise FileNotFoundError(str(base / target))
+    legacy = base / tag
+    if legacy.is_dir() and not _is_legacy_tag(legacy):
+        raise ValueError(f"tag {tag!r} would shadow saved version {tag!r}")
+    dst = _tag_path(base, tag)
+    _atomic_write_text(dst, json.dumps({"version": target}))
+    from .index import record
+
+    record(base.parent, {"op": "tag", "name": name, "tag": tag, "version": target})
+    if legacy.is_dir():
+        import shutil
+
+        trash = Path(tempfile.mkdtemp(dir=base, prefix=f".{tag}.old."))
+        os.replace(legacy, trash / tag)
+        shutil.rmtree(trash, ignore_errors=True)
     return dst
@@ -0,0 +1,246 @@
+"""Registry index so listings avoid directory scans.
+
+``save_system`` and ``promote`` append one JSON line per change to
+``<root>/.index.jsonl``; ``list_systems`` / ``list_versions`` / ``list_tags``
+read only that file. Readers keep the parsed state per process and parse just
+the bytes appended since their last read. ``compact_index`` rewrites the log as
+a single snapshot line, ``rebuild_index`` regenerates it from the tree and
+``fsck_index`` reports where index and tree disagree.
+
+Records::
+
+    {"op": "save", "name": ..., "version": ..., "sha256": ..., "blob": ..., "manifest": {...}}
+
+``sha256`` is the hash of the stored config file's bytes; ``blob`` is the
+blob id (``None`` for versions with their own ``config.yaml``).
+    {"op": "tag", "name": ..., "tag": ..., "version": ...}
+    {"op": "snapshot", "systems": {name: {"versions": {...}, "tags": {...}}}}
+
+Command line: ``python -m agent_compose_kit.registry.index {rebuild,fsck,compact} [root]``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:  # POSIX advisory lock serializes index writers; best effort elsewhere
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+INDEX_FILE = ".index.jsonl"
+_LOCK_FILE = ".index.lock"
+
+State = Dict[str, Dict[str, Dict[str, Any]]]
+
+# path -> (inode, parsed offset, last parsed bytes, state); the tail detects a
+# file replaced in place (compaction, rebuild) that happens to reuse the inode.
+_cache: Dict[Path, Tuple[int, int, bytes, State]] = {}
+_TAIL = 64
+_cache_lock = threading.Lock()
+
+
+def _index_path(root: str | Path) -> Path:
+    return Path(root).resolve() / INDEX_FILE
+
+
+@contextlib.contextmanager
+def _writer_lock(root: Path) -> Iterator[None]:
+    root.mkdir(parents=True, exist_ok=True)
+    with open(root / _LOCK_FILE, "a") as fh:
+        if fcntl is not None:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+def _apply(state: State, rec: Dict[str, Any], copied: set) -> None:
+    """Apply one record; systems already published to readers are copied before mutation."""
+    op = rec.get("op")
+    if op == "snapshot":
+        state.clear()
+        state.update(rec.get("systems") or {})
+        copied.update(state)
+        return
+    name = rec["name"]
+    if name not in copied:
+        old = state.get(name) or {}
+        state[name] = {"versions": dict(old.get("versions") or {}), "tags": dict(old.get("tags") or {})}
+        copied.add(name)
+    sys_ = state[name]
+    if op == "save":
+        sys_["versions"][rec["version"]] = {
+            "sha256": rec.get("sha256"),
+            "blob": rec.get("blob"),
+            "manifest": rec.get("manifest") or {},
+        }
+    elif op == "tag":
+        sys_["tags"][rec["tag"]] = rec["version"]
+        sys_["versions"].pop(rec["tag"], None)  # a copied legacy tag directory was replaced
+
+
+def read_index(root: str | Path = "registry") -> Optional[State]:
+    """Return the indexed state ``{name: {"versions": {v: {sha256, blob, manifest}}, "tags": {t: v}}}``.
+
+    Returns ``None`` when the registry has no index yet. The returned mapping is
+    shared; treat it as read-only.
+    """
+    path = _index_path(root)
+    try:
+        fh = open(path, "rb")
+    except FileNotFoundError:
+        return None
+    with fh:
+        st = os.fstat(fh.fileno())
+        with _cache_lock:
+            hit = _cache.get(path)
+        offset, tail, state = 0, b"", {}
+        if hit is not None and hit[0] == st.st_ino and hit[1] <= st.st_size:
+            fh.seek(hit[1] - len(hit[2]))
+            if fh.read(len(hit[2])) == hit[2]:  # same file, possibly appended to
+                if hit[1] == st.st_size:
+                    return hit[3]
+                offset, tail, state = hit[1], hit[2], dict(hit[3])
+        fh.seek(offset)
+        data = fh.read()
+    end = data.rfind(b"\n") + 1  # ignore a partially written trailing line
+    copied: set = set()
+    for line in data[:end].splitlines():
+        if line.strip():
+            _apply(state, json.loads(line), copied)
+    with _cache_lock:
+        _cache[path] = (st.st_ino, offset + end, (tail + data[:end])[-_TAIL:], state)
+    return state
+
+
+def _write_snapshot(root: Path, state: State) -> None:
+    from .fs import _atomic_write_text
+
+    line = json.dumps({"op": "snapshot", "systems": state}, sort_keys=True, separators=(",", ":"))
+    _atomic_write_text(root / INDEX_FILE, line + "\n")
+
+
+def _scan(root: Path) -> State:
+    from .fs import _TAGS_DIR, _config_path, _read_tag
+
+    state: State = {}
+    if not root.exists():
+        return state
+    for base in sorted(p for p in root.iterdir() if p.is_dir() and not p.name.startswith(".")):
+        versions: Dict[str, Any] = {}
+        for entry in sorted(p for p in base.iterdir() if p.is_dir() and not p.name.startswith(".")):
+            cfg = _config_path(base, entry.name)
+            if not cfg.exists():
+                continue
+            try:
+                manifest = json.loads((entry / "manifest.json").read_text(encoding="utf-8"))
+            except (FileNotFoundError, ValueError):
+                manifest = {}
+            sha = hashlib.sha256(cfg.read_bytes()).hexdigest()
+            blob = cfg.stem if cfg.name != "config.yaml" else None
+            versions[entry.name] = {"sha256": sha, "blob": blob, "manifest": manifest}
+        tags: Dict[str, str] = {}
+        tags_dir = base / _TAGS_DIR
+        if tags_dir.is_dir():
+            for p in sorted(tags_dir.iterdir()):
+                if p.suffix == ".json" and not p.name.startswith("."):
+                    try:
+                        target = _read_tag(base, p.stem)
+                    except ValueError:  # corrupt pointer: leave it out of the index
+                        continue
+                    if target is not None:
+                        tags[p.stem] = target
+        state[base.name] = {"versions": versions, "tags": tags}
+    return state
+
+
+def record(root: str | Path, rec: Dict[str, Any]) -> None:
+    """Append one change record; the first write to an unindexed registry rebuilds from the tree."""
+    rootp = Path(root).resolve()
+    with _writer_lock(rootp):
+        path = rootp / INDEX_FILE
+        if not path.exists():
+            _write_snapshot(rootp, _scan(rootp))
+            return
+        with open(path, "a", encoding="utf-8") as fh:
+            fh.write(json.dumps(rec, sort_keys=True, separators=(",", ":")) + "\n")
+
+
+def rebuild_index(root: str | Path = "registry") -> State:
+    """Regenerate the index from the directory tree and return the new state."""
+    rootp = Path(root).resolve()
+    with _writer_lock(rootp):
+        state = _scan(rootp)
+        _write_snapshot(rootp, state)
+    return state
+
+
+def compact_index(root: str | Path = "registry") -> None:
+    """Rewrite the append log as one snapshot line (no directory scan)."""
+    rootp = Path(root).resolve()
+    with _writer_lock(rootp):
+        state = read_index(rootp)
+        if state is not None:
+            _write_snapshot(rootp, state)
+
+
+def fsck_index(root: str | Path = "registry") -> Dict[str, List[str]]:
+    """Compare the index with the tree.
+
+    Returns:
+        ``{"missing_from_index", "missing_on_disk", "hash_mismatch", "tag_mismatch"}``
+        lists of ``name@version`` / ``name#tag`` entries; all empty when consistent
+        (a registry without an index reports every entry as missing).
+    """
+    rootp = Path(root).resolve()
+    disk = _scan(rootp)
+    idx = read_index(rootp) or {}
+    report: Dict[str, List[str]] = {"missing_from_index": [], "missing_on_disk": [], "hash_mismatch": [], "tag_mismatch": []}
+    for name in sorted(set(disk) | set(idx)):
+        d = disk.get(name, {"versions": {}, "tags": {}})
+        i = idx.get(name, {"versions": {}, "tags": {}})
+        for v in sorted(set(d["versions"]) | set(i["versions"])):
+            if v not in i["versions"]:
+                report["missing_from_index"].append(f"{name}@{v}")
+            elif v not in d["versions"]:
+                report["missing_on_disk"].append(f"{name}@{v}")
+            elif d["versions"][v]["sha256"] != i["versions"][v].get("sha256"):
+                report["hash_mismatch"].append(f"{name}@{v}")
+        for t in sorted(set(d["tags"]) | set(i["tags"])):
+            if d["tags"].get(t) != i["tags"].get(t):
+                report["tag_mismatch"].append(f"{name}#{t}")
+    return report
+
+
+def _main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    ap = argparse.ArgumentParser(prog="python -m agent_compose_kit.registry.index")
+    ap.add_argument("command", choices=["rebuild", "fsck", "compact"])
+    ap.add_argument("root", nargs="?", default="registry")
+    args = ap.parse_args(argv)
+    if args.command == "rebuild":
+        state = rebuild_index(args.root)
+        print(f"indexed {sum(len(s['versions']) for s in state.values())} versions in {len(state)} systems")
+        return 0
+    if args.command == "compact":
+        compact_index(args.root)
+        return 0
+    report = fsck_index(args.root)
+    for kind, items in report.items():
+        for item in items:
+            print(f"{kind}: {item}")
+    return 1 if any(report.values()) else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(_main())
@@ -0,0 +1,119 @@
+"""Offline ``registry_resolves`` callback backed by the filesystem registry.
+
+``FsRegistryResolver`` keeps a per-system version index (re-scanned only when
+the system directory's mtime changes) and answers ``(kind, key, range)`` with
+the highest matching version, a content-hash ETag and a ``file://`` URI, so it
+can be passed straight to ``plan_lock``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .fs import _TAGS_DIR, _config_path, list_tags
+from .semver import parse_range, version_sort_key
+
+
+def _mtime(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+class FsRegistryResolver:
+    """Resolve registry refs against the versions and tag pointers under ``root/<key>``.
+
+    Args:
+        root: Registry root used by ``registry.fs``.
+        by_kind: Look systems up under ``root/<kind>/<key>`` instead of ``root/<key>``.
+        include_prerelease: Let ranges match prereleases of other versions.
+    """
+
+    def __init__(self, root: str | Path = "registry", *, by_kind: bool = False, include_prerelease: bool = False) -> None:
+        self.root = Path(root).resolve()
+        self.by_kind = by_kind
+        self.include_prerelease = include_prerelease
+        self._lock = threading.Lock()
+        self._index: Dict[Path, Tuple[Tuple[int, int], List[str], Dict[str, str]]] = {}
+        self._etags: Dict[Tuple[Path, str], Tuple[int, int, str]] = {}
+
+    def _system_dir(self, kind: str, key: str) -> Path:
+        return self.root / kind / key if self.by_kind else self.root / key
+
+    def versions(self, kind: str, key: str) -> List[str]:
+        """Entries (versions and tags) of one system, semver-sorted, from the cached index."""
+        return list(self._entries(kind, key)[0])
+
+    def _entries(self, kind: str, key: str) -> Tuple[List[str], Dict[str, str]]:
+        base = self._system_dir(kind, key)
+        try:
+            stamp = (base.stat().st_mtime_ns, _mtime(base / _TAGS_DIR))
+        except FileNotFoundError:
+            return [], {}
+        with self._lock:
+            hit = self._index.get(base)
+            if hit is not None and hit[0] == stamp:
+                return hit[1], hit[2]
+        tags = list_tags(base.name, root=base.parent)
+        names = {p.name for p in base.iterdir() if p.is_dir() and not p.name.startswith(".")}
+        ordered = sorted(names.union(tags), key=version_sort_key)
+        with self._lock:
+            self._index[base] = (stamp, ordered, tags)
+        return ordered, tags
+
+    def etag(self, path: Path, version: Optional[str] = None) -> str:
+        """Content hash of a pinned config: sha256 over its version name and bytes.
+
+        ``version`` defaults to the name of the directory holding ``path``.
+        Memoized on ``(mtime_ns, size)``. Including the name keeps two versions
+        with identical content (or a shared blob) from answering each other's
+        revalidation.
+        """
+        version = path.parent.name if version is None else version
+        st = path.stat()
+        with self._lock:
+            hit = self._etags.get((path, version))
+            if hit is not None and hit[:2] == (st.st_mtime_ns, st.st_size):
+                return hit[2]
+        digest = hashlib.sha256(version.encode("utf-8") + b"\0" + path.read_bytes()).hexdigest()
+        with self._lock:
+            self._etags[(path, version)] = (st.st_mtime_ns, st.st_size, digest)
+        return digest
+
+    def resolve(self, kind: str, key: str, rng: str) -> str:
+        """Return the entry name ``rng`` pins to.
+
+        An exact version or tag name wins (tags pin the version they point
+        to); otherwise ``rng`` is matched as a semver range (``latest`` =
+        highest stable version).
+
+        Raises:
+            LookupError: When the system is unknown or nothing matches.
+            ValueError: When ``rng`` is neither an entry nor a valid range.
+        """
+        names, tags = self._entries(kind, key)
+        if not names:
+            raise LookupError(f"unknown registry system: {kind}/{key}")
+        if rng in names:
+            return rng if (self._system_dir(kind, key) / rng).is_dir() else tags[rng]
+        best = parse_range(rng).max_satisfying(names, include_prerelease=self.include_prerelease)
+        if best is None:
+            raise LookupError(f"no version of {kind}/{key} matches {rng!r}")
+        return best
+
+    def __call__(self, kind: str, key: str, rng: str, etag: Optional[str] = None) -> Dict[str, Any]:
+        """``registry_resolves`` callback: ``{version, etag, uri}``.
+
+        When ``etag`` (from a ``ResolverCache``) still matches the resolved
+        config, returns ``{"not_modified": True}`` instead.
+        """
+        version = self.resolve(kind, key, rng)
+        cfg_path = _config_path(self._system_dir(kind, key), version)
+        tag = self.etag(cfg_path, version)
+        if etag is not None and etag == tag:
+            return {"not_modified": True}
+        return {"version": version, "etag": tag, "uri": cfg_path.as_uri()}
@@ -0,0 +1,230 @@
+"""Semantic versions and npm-style ranges for registry refs.
+
+Supports ``MAJOR.MINOR.PATCH[-pre][+build]`` versions (a leading ``v`` is
+accepted) and ranges built from comparators (``>=1.2``, ``<2``, ``=1.0.0``),
+caret/tilde ranges (``^1.2``, ``~1.2.3``), x-ranges (``1``, ``1.x``, ``*``),
+hyphen ranges (``1.0 - 2.0``), whitespace/comma conjunctions, ``||``
+disjunctions and ``latest``. Prereleases only match a range that names a
+prerelease of the same ``MAJOR.MINOR.PATCH`` (npm semantics) unless
+``include_prerelease`` is set.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+
+_VERSION_RE = re.compile(
+    r"^v?(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)"
+    r"(?:-([0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?(?:\+[0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*)?$"
+)
+_PARTIAL_RE = re.compile(
+    r"^v?(\d+|[xX*])(?:\.(\d+|[xX*]))?(?:\.(\d+|[xX*]))?"
+    r"(?:-([0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?(?:\+[0-9A-Za-z-.]+)?$"
+)
+_COMPARATOR_RE = re.compile(r"^(>=|<=|>|<|=|\^|~>?)?\s*(.+)$")
+
+
+@dataclass(frozen=True)
+class Version:
+    major: int
+    minor: int
+    patch: int
+    prerelease: Tuple[str, ...] = ()
+
+    @property
+    def key(self) -> Tuple:
+        """Total-order sort key (prereleases sort before their release)."""
+        if not self.prerelease:
+            return (self.major, self.minor, self.patch, (1,))
+        pre = tuple((0, int(p), "") if p.isdigit() else (1, 0, p) for p in self.prerelease)
+        return (self.major, self.minor, self.patch, (0, pre))
+
+    def __lt__(self, other: "Version") -> bool:
+        return self.key < other.key
+
+    def __le__(self, other: "Version") -> bool:
+        return self.key <= other.key
+
+    def __gt__(self, other: "Version") -> bool:
+        return self.key > other.key
+
+    def __ge__(self, other: "Version") -> bool:
+        return self.key >= other.key
+
+    def __str__(self) -> str:
+        base = f"{self.major}.{self.minor}.{self.patch}"
+        return f"{base}-{'.'.join(self.prerelease)}" if self.prerelease else base
+
+
+@lru_cache(maxsize=65536)
+def parse_version(text: str) -> Optional[Version]:
+    """Parse a full semantic version; return ``None`` when ``text`` is not one."""
+    m = _VERSION_RE.match(text.strip()) if isinstance(text, str) else None
+    if m is None:
+        return None
+    pre = tuple(m.group(4).split(".")) if m.group(4) else ()
+    return Version(int(m.group(1)), int(m.group(2)), int(m.group(3)), pre)
+
+
+def version_sort_key(name: str) -> Tuple:
+    """Sort key placing semantic versions first (semver order), then other names."""
+    v = parse_version(name)
+    return (0, v.key, name) if v is not None else (1, (), name)
+
+
+def _floor(parts: List[Optional[int]], pre: Tuple[str, ...] = ()) -> Version:
+    return Version(parts[0] or 0, parts[1] or 0, parts[2] or 0, pre if parts[2] is not None else ())
+
+
+def _ceiling(major: int, minor: int = 0, patch: int = 0) -> Version:
+    """Lowest version of ``major.minor.patch`` (``-0``), used as an exclusive upper bound."""
+    return Version(major, minor, patch, ("0",))
+
+
+_Cmp = Tuple[str, Version]
+
+
+class VersionRange:
+    """A parsed range expression; see the module docstring for the grammar.
+
+    Args:
+        spec: Range expression such as ``>=0.2``, ``^1.4 || ~2.0`` or ``latest``.
+
+    Raises:
+        ValueError: If ``spec`` cannot be parsed.
+    """
+
+    def __init__(self, spec: str) -> None:
+        self.spec = spec
+        self._sets: List[Tuple[List[_Cmp], set]] = []
+        text = (spec or "").strip()
+        if text.lower() in ("latest", ""):
+            text = "*"
+        for alt in text.split("||"):
+            self._sets.append(self._parse_set(alt.strip()))
+
+    def _parse_set(self, text: str) -> Tuple[List[_Cmp], set]:
+        cmps: List[_Cmp] = []
+        pre_bases: set = set()
+        if not text or text in ("*", "x", "X"):
+            return cmps, pre_bases
+        hy = re.match(r"^(\S+)\s+-\s+(\S+)$", text)
+        if hy:
+            lo, hi = self._partial(hy.group(1)), self._partial(hy.group(2))
+            cmps += self._desugar(">=", *lo, pre_bases)
+            cmps += self._desugar("<=", *hi, pre_bases)
+            return cmps, pre_bases
+        tokens = re.sub(r"(>=|<=|>|<|=|\^|~>?)\s+", r"\1", text).replace(",", " ").split()
+        for tok in tokens:
+            m = _COMPARATOR_RE.match(tok)
+            if m is None:
+                raise ValueError(f"invalid version range: {self.spec!r}")
+            op = m.group(1) or ""
+            cmps += self._desugar("~" if op == "~>" else op, *self._partial(m.group(2)), pre_bases)
+        return cmps, pre_bases
+
+    def _partial(self, text: str) -> Tuple[List[Optional[int]], Tuple[str, ...]]:
+        m = _PARTIAL_RE.match(text)
+        if m is None:
+            raise ValueError(f"invalid version range: {self.spec!r}")
+        parts: List[Optional[int]] = []
+        for g in m.group(1, 2, 3):
+            parts.append(None if g is None or g in ("x", "X", "*") or (parts and parts[-1] is None) else int(g))
+        pre = tuple(m.group(4).split(".")) if m.group(4) else ()
+        if pre and parts[2] is None:
+            raise ValueError(f"invalid version range: {self.spec!r}")
+        return parts, pre
+
+    @staticmethod
+    def _desugar(op: str, parts: List[Optional[int]], pre: Tuple[str, ...], pre_bases: set) -> List[_Cmp]:
+        major, minor, patch = parts
+        if pre:
+            pre_bases.add((major, minor, patch))
+        if major is None:
+            # "*" matches everything; "<*" / ">*" match nothing
+            return [] if op in ("", "=", ">=", "<=", "^", "~") else [("<", _ceiling(0))]
+        lo = _floor(parts, pre)
+        full = patch is not None
+        if op == "^":
+            if major > 0 or minor is None:
+                hi = _ceiling(major + 1)
+            elif minor > 0 or patch is None:
+                hi = _ceiling(0, minor + 1)
+            else:
+                hi = _ceiling(0, 0, patch + 1)
+            return [(">=", lo), ("<", hi)]
+        if op == "~":
+            hi = _ceiling(major + 1) if minor is None else _ceiling(major, minor + 1)
+            return [(">=", lo), ("<", hi)]
+        if op in ("", "="):
+            if full:
+                return [("=", lo)]
+            hi = _ceiling(major + 1) if minor is None else _ceiling(major, minor + 1)
+            return [(">=", lo), ("<", hi)]
+        if op == ">=":
+            return [(">=", lo)]
+        if op == "<":
+            return [("<", lo if full else _ceiling(major, minor or 0))]
+        if op == ">":
+            if full:
+                return [(">", lo)]
+            return [(">=", _ceiling(major + 1) if minor is None else _ceiling(major, minor + 1))]
+        # "<="
+        if full:
+            return [("<=", lo)]
+        return [("<", _ceiling(major + 1) if minor is None else _ceiling(major, minor + 1))]
+
+    def matches(self, version: Version | str, *, include_prerelease: bool = False) -> bool:
+        """Return whether ``version`` satisfies the range."""
+        v = parse_version(version) if isinstance(version, str) else version
+        if v is None:
+            return False
+        k = v.key
+        for cmps, pre_bases in self._sets:
+            ok = True
+            for op, bound in cmps:
+                b = bound.key
+                if not (
+                    (op == ">=" and k >= b)
+                    or (op == ">" and k > b)
+                    or (op == "<" and k < b)
+                    or (op == "<=" and k <= b)
+                    or (op == "=" and k == b)
+                ):
+                    ok = False
+                    break
+            if not ok:
+                continue
+            if v.prerelease and not include_prerelease and (v.major, v.minor, v.patch) not in pre_bases:
+                continue
+            return True
+        return False
+
+    def max_satisfying(self, versions: Iterable[str], *, include_prerelease: bool = False) -> Optional[str]:
+        """Return the highest entry of ``versions`` matching the range (non-semver names are skipped)."""
+        best: Optional[Tuple[Tuple, str]] = None
+        for name in versions:
+            v = parse_version(name)
+            if v is None or (best is not None and v.key <= best[0]):
+                continue
+            if self.matches(v, include_prerelease=include_prerelease):
+                best = (v.key, name)
+        return best[1] if best else None
+
+
+@lru_cache(maxsize=4096)
+def parse_range(spec: str) -> VersionRange:
+    """Parse (and memoize) a range expression."""
+    return VersionRange(spec)
+
+
+def max_satisfying(versions: Iterable[str], spec: str, *, include_prerelease: bool = False) -> Optional[str]:
+    """Highest version in ``versions`` satisfying ``spec``; ``None`` when nothing matches.
+
+    Raises:
+        ValueError: If ``spec`` is not a valid range.
+    """
+    return parse_range(spec).max_satisfying(versions, include_prerelease=include_prerelease)
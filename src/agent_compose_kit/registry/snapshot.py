@@ -0,0 +1,122 @@
+"""Immutable snapshots of a filesystem system registry, for ``HotReloader``.
+
+``FsRegistrySnapshot`` freezes the listing state (versions and tag targets)
+at build time, so a reader holding a snapshot sees one consistent registry even
+while ``save_system``/``promote`` run. Configs are content-addressed blobs and
+the snapshot keeps each version's blob id, so loading through a snapshot
+returns exactly the config a version or tag pointed to when the snapshot was
+taken, even if the version is saved again later. Versions written by older
+releases (their own ``config.yaml``, no blob) are read from the live tree.
+
+    from agent_compose_kit.registries.reload import HotReloader
+    from agent_compose_kit.registry.snapshot import FsRegistrySource
+
+    systems = HotReloader(FsRegistrySource("registry")).start()
+    cfg = systems.current.load_system("demo", "prod")
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Mapping, Optional
+
+from ..config.models import AppConfig
+
+if TYPE_CHECKING:
+    from ..config.cache import ConfigCache
+
+
+class FsRegistrySnapshot:
+    """Read-only view of a filesystem registry at one point in time.
+
+    Args:
+        root: Registry root.
+        state: ``{name: {"versions": {...}, "tags": {...}}}`` as returned by
+            ``registry.index.read_index``; it must not be mutated afterwards.
+    """
+
+    def __init__(self, root: Path, state: Mapping[str, Mapping[str, Any]]) -> None:
+        self.root = root
+        self._state = MappingProxyType(dict(state))
+
+    def list_systems(self) -> List[str]:
+        return sorted(self._state)
+
+    def list_versions(self, name: str) -> List[str]:
+        from .semver import version_sort_key
+
+        entry = self._state.get(name) or {"versions": {}, "tags": {}}
+        return sorted(set(entry["versions"]).union(entry["tags"]), key=version_sort_key)
+
+    def list_tags(self, name: str) -> Dict[str, str]:
+        return dict(sorted(((self._state.get(name) or {}).get("tags") or {}).items()))
+
+    def resolve_version(self, name: str, version: str) -> str:
+        """Version ``version`` (a version or tag) referred to when the snapshot was built.
+
+        Raises:
+            FileNotFoundError: When neither a version nor a tag exists.
+        """
+        entry = self._state.get(name) or {"versions": {}, "tags": {}}
+        if version in entry["versions"]:
+            return version
+        target = entry["tags"].get(version)
+        if target is None:
+            raise FileNotFoundError(str(self.root / name / version))
+        return target
+
+    def load_system(self, name: str, version: str, *, cache: Optional["ConfigCache"] = None) -> AppConfig:
+        """Load ``name@version`` as of the snapshot (tags and blobs resolved from the snapshot).
+
+        Raises:
+            FileNotFoundError: When the version or its config no longer exists
+                (e.g., its blob was garbage-collected).
+        """
+        from ..config.models import load_config_file
+        from .blobs import blob_path
+        from .fs import _config_path
+
+        resolved = self.resolve_version(name, version)
+        entry = (self._state.get(name) or {"versions": {}})["versions"].get(resolved) or {}
+        blob = entry.get("blob") or (entry.get("manifest") or {}).get("blob")
+        cfg_path = blob_path(self.root, blob) if blob else _config_path(self.root / name, resolved)
+        if not cfg_path.exists():
+            raise FileNotFoundError(str(cfg_path))
+        return load_config_file(cfg_path, cache=cache)
+
+
+class FsRegistrySource:
+    """``HotReloader`` source for ``registry.fs``: the index when present, else a tree scan."""
+
+    def __init__(self, root: str | Path = "registry") -> None:
+        self.root = Path(root).resolve()
+
+    def token(self) -> Hashable:
+        from .index import INDEX_FILE
+
+        try:
+            st = (self.root / INDEX_FILE).stat()
+            return ("index", st.st_ino, st.st_size, st.st_mtime_ns)
+        except FileNotFoundError:
+            pass
+        return ("scan", tuple((str(p), p.stat().st_mtime_ns) for p in self.watch_paths() if p.exists()))
+
+    def build(self) -> FsRegistrySnapshot:
+        from .index import _scan, read_index
+
+        state = read_index(self.root)
+        return FsRegistrySnapshot(self.root, state if state is not None else _scan(self.root))
+
+    def watch_paths(self) -> List[Path]:
+        from .fs import _TAGS_DIR
+
+        if not self.root.is_dir():
+            return []
+        paths = [self.root]
+        for base in self.root.iterdir():
+            if base.is_dir() and not base.name.startswith("."):
+                paths.append(base)
+                if (base / _TAGS_DIR).is_dir():
+                    paths.append(base / _TAGS_DIR)
+        return paths
@@ -0,0 +1,282 @@
+"""SQLite backend for the system registry (same API as ``registry.fs``).
+
+All versions and tags live in one database file in WAL mode, so readers never
+block the writer and listings/loads are indexed primary-key lookups instead of
+directory walks. Configs are stored as YAML (like ``registry.fs``) or, with
+``store_json=True``, as JSON so ``load_system`` takes the JSON ingestion path.
+
+Module-level functions mirror ``registry.fs`` with ``root`` naming the
+database file::
+
+    from agent_compose_kit.registry import sqlite as registry
+
+    registry.save_system(cfg, name="demo", version="1.0.0", root="registry.db")
+    registry.promote("demo", "1.0.0", "prod", root="registry.db")
+    cfg = registry.load_system("demo", "prod", root="registry.db")
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ..config.models import AppConfig
+
+# ``versions`` keeps its rowid so the (name, version) primary-key index covers
+# listings without touching the config bodies.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS versions (
+    name TEXT NOT NULL,
+    version TEXT NOT NULL,
+    format TEXT NOT NULL,
+    body BLOB NOT NULL,
+    sha256 TEXT NOT NULL,
+    manifest TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (name, version)
+);
+CREATE TABLE IF NOT EXISTS tags (
+    name TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    version TEXT NOT NULL,
+    PRIMARY KEY (name, tag)
+) WITHOUT ROWID;
+"""
+
+
+def _dump(cfg: AppConfig, fmt: str) -> bytes:
+    if fmt == "json":
+        return json.dumps(cfg.model_dump(mode="json"), separators=(",", ":")).encode("utf-8")
+    import yaml
+
+    return yaml.safe_dump(cfg.model_dump(), sort_keys=False).encode("utf-8")
+
+
+class SqliteRegistry:
+    """System registry stored in a single SQLite database.
+
+    Args:
+        path: Database file (created when missing).
+        store_json: Store new versions as JSON instead of YAML.
+    """
+
+    def __init__(self, path: str | Path = "registry.db", *, store_json: bool = False) -> None:
+        self.path = Path(path).resolve()
+        self.store_json = store_json
+        self._local = threading.local()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._conn() as db:
+            db.executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=30.0)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        db = getattr(self._local, "db", None)
+        if db is not None:
+            db.close()
+            self._local.db = None
+
+    def save_system(self, cfg: AppConfig, *, name: str, version: str) -> str:
+        """Insert or replace ``name@version``; returns a ``sqlite://`` locator.
+
+        Raises:
+            ValueError: When ``version`` names an existing tag.
+        """
+        fmt = "json" if self.store_json else "yaml"
+        body = _dump(cfg, fmt)
+        manifest = {"name": name, "version": version}
+        with self._conn() as db:
+            # take the write lock before the check so a concurrent promote cannot slip in
+            db.execute("BEGIN IMMEDIATE")
+            if db.execute("SELECT 1 FROM tags WHERE name = ? AND tag = ?", (name, version)).fetchone():
+                raise ValueError(f"version {version!r} would shadow tag {version!r}")
+            db.execute(
+                "INSERT OR REPLACE INTO versions VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (name, version, fmt, body, hashlib.sha256(body).hexdigest(), json.dumps(manifest), time.time()),
+            )
+        return f"sqlite://{self.path}#{name}@{version}"
+
+    def list_systems(self) -> List[str]:
+        """List system names."""
+        rows = self._conn().execute("SELECT DISTINCT name FROM versions ORDER BY name").fetchall()
+        return [r[0] for r in rows]
+
+    def list_versions(self, name: str) -> List[str]:
+        """List versions (semver order) followed by tags, like ``registry.fs.list_versions``."""
+        from .semver import version_sort_key
+
+        db = self._conn()
+        names = [r[0] for r in db.execute("SELECT version FROM versions WHERE name = ?", (name,))]
+        names += [r[0] for r in db.execute("SELECT tag FROM tags WHERE name = ?", (name,))]
+        return sorted(set(names), key=version_sort_key)
+
+    def list_tags(self, name: str) -> Dict[str, str]:
+        """Map tag name → version for a system."""
+        rows = self._conn().execute("SELECT tag, version FROM tags WHERE name = ? ORDER BY tag", (name,))
+        return {t: v for t, v in rows}
+
+    def resolve_version(self, name: str, version: str) -> str:
+        """Return the version ``version`` (a version or tag) refers to.
+
+        Raises:
+            FileNotFoundError: When neither a version nor a tag exists.
+        """
+        db = self._conn()
+        if db.execute("SELECT 1 FROM versions WHERE name = ? AND version = ?", (name, version)).fetchone():
+            return version
+        row = db.execute("SELECT version FROM tags WHERE name = ? AND tag = ?", (name, version)).fetchone()
+        if row is None:
+            raise FileNotFoundError(f"{self.path}#{name}@{version}")
+        return row[0]
+
+    def load_system(self, name: str, version: str) -> AppConfig:
+        """Load ``name@version`` (``version`` may be a tag).
+
+        Raises:
+            FileNotFoundError: When the version or tag does not exist.
+            ValueError: When the stored config fails validation.
+        """
+        from ..config.models import load_config, load_config_json
+
+        row = self._conn().execute(
+            "SELECT format, body FROM versions WHERE name = ? AND version = COALESCE("
+            "(SELECT version FROM tags WHERE name = ?1 AND tag = ?2), ?2)",
+            (name, version),
+        ).fetchone()
+        if row is None:
+            raise FileNotFoundError(f"{self.path}#{name}@{version}")
+        if row[0] == "json":
+            return load_config_json(bytes(row[1]))
+        return load_config(bytes(row[1]).decode("utf-8"))
+
+    def promote(self, name: str, version: str, tag: str) -> str:
+        """Point ``tag`` at ``version`` (resolved if it is a tag) in one transaction.
+
+        Raises:
+            FileNotFoundError: When ``version`` does not exist.
+            ValueError: When ``tag`` is not a plain name or names a saved version.
+        """
+        if not tag or "/" in tag or "\\" in tag or tag.startswith("."):
+            raise ValueError(f"invalid tag name: {tag!r}")
+        with self._conn() as db:
+            # take the write lock before reading so the checks and the insert are atomic
+            db.execute("BEGIN IMMEDIATE")
+            target = self.resolve_version(name, version)
+            if db.execute("SELECT 1 FROM versions WHERE name = ? AND version = ?", (name, tag)).fetchone():
+                raise ValueError(f"tag {tag!r} would shadow saved version {tag!r}")
+            db.execute("INSERT OR REPLACE INTO tags VALUES (?, ?, ?)", (name, tag, target))
+        return f"sqlite://{self.path}#{name}@{tag}"
+
+    def import_fs(self, root: str | Path = "registry", *, store_json: Optional[bool] = None) -> int:
+        """Bulk-import a ``registry.fs`` tree (versions and tags) in one transaction.
+
+        Args:
+            root: Filesystem registry root.
+            store_json: Convert configs to JSON (validates each one); defaults
+                to this registry's ``store_json``. YAML is imported byte-for-byte.
+
+        Returns:
+            Number of versions imported.
+
+        Raises:
+            ValueError: When a tag would shadow a saved version (in the import
+                or against the database); nothing is imported then.
+        """
+        from ..config.models import load_config_bytes
+        from .fs import _config_path, _is_legacy_tag, list_systems, list_tags
+
+        as_json = self.store_json if store_json is None else store_json
+        rootp = Path(root).resolve()
+        rows = []
+        tag_rows = []
+        now = time.time()
+        for name in list_systems(root=rootp):
+            base = rootp / name
+            if not base.is_dir():
+                continue
+            for entry in base.iterdir():
+                if entry.name.startswith(".") or not entry.is_dir():
+                    continue
+                cfg_path = _config_path(base, entry.name)
+                if not cfg_path.is_file():
+                    continue
+                if _is_legacy_tag(entry):
+                    manifest = json.loads((entry / "manifest.json").read_text(encoding="utf-8"))
+                    tag_rows.append((name, entry.name, manifest["version"]))
+                    continue
+                body = cfg_path.read_bytes()
+                fmt = "yaml"
+                if as_json:
+                    body, fmt = _dump(load_config_bytes(body), "json"), "json"
+                try:
+                    manifest_text = (entry / "manifest.json").read_text(encoding="utf-8")
+                except FileNotFoundError:
+                    manifest_text = json.dumps({"name": name, "version": entry.name})
+                rows.append((name, entry.name, fmt, body, hashlib.sha256(body).hexdigest(), manifest_text, now))
+            tag_rows += [(name, t, v) for t, v in list_tags(name, root=rootp).items()]
+        with self._conn() as db:
+            db.execute("BEGIN IMMEDIATE")
+            db.executemany("INSERT OR REPLACE INTO versions VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            db.executemany("INSERT OR REPLACE INTO tags VALUES (?, ?, ?)", tag_rows)
+            clashes = db.execute(
+                "SELECT t.name, t.tag FROM tags t JOIN versions v ON v.name = t.name AND v.version = t.tag ORDER BY 1, 2"
+            ).fetchall()
+            if clashes:  # raising inside ``with`` rolls the whole import back
+                raise ValueError("tags would shadow saved versions: " + ", ".join(f"{n}@{t}" for n, t in clashes))
+        return len(rows)
+
+
+_registries: Dict[Path, SqliteRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def _registry(root: str | Path) -> SqliteRegistry:
+    p = Path(root).resolve()
+    with _registries_lock:
+        reg = _registries.get(p)
+        if reg is None:
+            reg = _registries[p] = SqliteRegistry(p)
+        return reg
+
+
+def save_system(cfg: AppConfig, *, name: str, version: str, root: str | Path = "registry.db") -> str:
+    """Save ``cfg`` as ``name@version`` in the database at ``root``."""
+    return _registry(root).save_system(cfg, name=name, version=version)
+
+
+def list_systems(*, root: str | Path = "registry.db") -> List[str]:
+    """List system names in the database at ``root``."""
+    return _registry(root).list_systems()
+
+
+def list_versions(name: str, *, root: str | Path = "registry.db") -> List[str]:
+    """List versions and tags of ``name``."""
+    return _registry(root).list_versions(name)
+
+
+def list_tags(name: str, *, root: str | Path = "registry.db") -> Dict[str, str]:
+    """Map tag name → version for ``name``."""
+    return _registry(root).list_tags(name)
+
+
+def load_system(name: str, version: str, *, root: str | Path = "registry.db") -> AppConfig:
+    """Load ``name@version`` (or a tag) from the database at ``root``."""
+    return _registry(root).load_system(name, version)
+
+
+def promote(name: str, version: str, tag: str, *, root: str | Path = "registry.db") -> str:
+    """Point ``tag`` at ``version``."""
+    return _registry(root).promote(name, version, tag)
@@ -0,0 +1,359 @@
+"""Pluggable timing/tracing hooks (no-op unless a sink is installed).
+
+Public compose functions run inside spans named ``compose.<function>`` (nested
+calls nest), and quick-fix/lint rules report counters. Nothing is recorded
+until a sink is installed::
+
+    from agent_compose_kit import tracing
+
+    stats = tracing.StatsSink()
+    with tracing.use_sink(stats):
+        cfg = compose.load_config_file("system.yaml")
+        compose.get_quick_fixes(raw_cfg=raw)
+    stats.spans()     # {"compose.load_config_file": SpanStats(...), ...}
+
+Sinks:
+
+- ``CallbackSink`` - calls ``on_span(SpanRecord)`` / ``on_count(name, value, attrs)``.
+- ``StatsSink`` - per-name call counts and total/max seconds, counter totals.
+- ``OpenTelemetrySink`` - forwards to an OpenTelemetry-style tracer (and
+  optional meter); duck-typed, ``opentelemetry`` is not a dependency.
+
+Counters:
+
+- ``quickfix.rule.seconds`` / ``quickfix.rule.fixes`` (attribute ``rule``):
+  time spent in and fixes produced by each quick-fix rule per run.
+- ``lint.rule.findings`` (attribute ``rule``): findings per lint rule.
+- ``lock.registry_refs`` / ``lock.aliases``: distinct items a lock plan resolves.
+
+The sink is process-wide (spans from worker threads reach it too). Span
+nesting follows the ``contextvars`` context, so concurrent asyncio tasks and
+threads each see their own parent span. When no
+sink is installed, ``span`` returns a shared no-op object and ``traced``
+wrappers make one global lookup before calling through.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import inspect
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class TraceSink:
+    """Receiver of spans and counters. The base class ignores everything.
+
+    ``start_span`` returns an opaque handle that is passed back to
+    ``set_attribute`` and ``end_span``.
+    """
+
+    def start_span(self, name: str, attrs: Dict[str, Any]) -> Any:
+        return None
+
+    def set_attribute(self, handle: Any, key: str, value: Any) -> None:
+        pass
+
+    def end_span(self, handle: Any, error: Optional[BaseException]) -> None:
+        pass
+
+    def count(self, name: str, value: float, attrs: Dict[str, Any]) -> None:
+        pass
+
+
+_sink: Optional[TraceSink] = None
+
+
+def set_sink(sink: Optional[TraceSink]) -> Optional[TraceSink]:
+    """Install ``sink`` process-wide (``None`` disables tracing); return the previous sink."""
+    global _sink
+    previous, _sink = _sink, sink
+    return previous
+
+
+def get_sink() -> Optional[TraceSink]:
+    """Return the installed sink, or ``None`` when tracing is disabled."""
+    return _sink
+
+
+def enabled() -> bool:
+    """Whether a sink is installed (use to skip building costly attributes)."""
+    return _sink is not None
+
+
+@contextmanager
+def use_sink(sink: TraceSink) -> Iterator[TraceSink]:
+    """Install ``sink`` for the duration of the block and restore the previous one."""
+    previous = set_sink(sink)
+    try:
+        yield sink
+    finally:
+        set_sink(previous)
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc: Any) -> bool:
+        return False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+_NOOP = _NoopSpan()
+
+
+class _Span:
+    __slots__ = ("sink", "name", "attrs", "handle")
+
+    def __init__(self, sink: TraceSink, name: str, attrs: Dict[str, Any]) -> None:
+        self.sink = sink
+        self.name = name
+        self.attrs = attrs
+        self.handle = None
+
+    def __enter__(self) -> "_Span":
+        self.handle = self.sink.start_span(self.name, self.attrs)
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Optional[BaseException], tb: Any) -> bool:
+        self.sink.end_span(self.handle, exc)
+        return False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.sink.set_attribute(self.handle, key, value)
+
+
+def span(name: str, **attrs: Any) -> Any:
+    """Context manager timing a block as span ``name`` (no-op without a sink).
+
+    The returned object has ``set_attribute(key, value)``.
+    """
+    sink = _sink
+    if sink is None:
+        return _NOOP
+    return _Span(sink, name, attrs)
+
+
+def count(name: str, value: float = 1, **attrs: Any) -> None:
+    """Add ``value`` to counter ``name`` (no-op without a sink)."""
+    sink = _sink
+    if sink is not None:
+        sink.count(name, value, attrs)
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """Decorator running every call of a function (sync or async) inside span ``name``."""
+
+    def deco(fn: F) -> F:
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def awrapper(*args: Any, **kwargs: Any) -> Any:
+                sink = _sink
+                if sink is None:
+                    return await fn(*args, **kwargs)
+                with _Span(sink, name, {}):
+                    return await fn(*args, **kwargs)
+
+            return awrapper  # type: ignore[return-value]
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            sink = _sink
+            if sink is None:
+                return fn(*args, **kwargs)
+            with _Span(sink, name, {}):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return deco
+
+
+# =====================
+# Sinks
+# =====================
+
+
+@dataclass(frozen=True)
+class SpanRecord:
+    """A finished span as seen by ``CallbackSink``.
+
+    Attributes:
+        name: Span name.
+        attrs: Attributes given at start plus ``set_attribute`` calls.
+        start: ``time.perf_counter()`` at start.
+        seconds: Duration.
+        parent: Name of the enclosing span in the same context (thread or
+            asyncio task), if any.
+        error: Exception that escaped the span, if any.
+    """
+
+    name: str
+    attrs: Dict[str, Any]
+    start: float
+    seconds: float
+    parent: Optional[str]
+    error: Optional[BaseException]
+
+
+class CallbackSink(TraceSink):
+    """Calls ``on_span(record)`` when a span ends and ``on_count(name, value, attrs)`` per counter.
+
+    Args:
+        on_span: Receives a ``SpanRecord``.
+        on_count: Receives counter updates.
+    """
+
+    def __init__(
+        self,
+        on_span: Optional[Callable[[SpanRecord], Any]] = None,
+        on_count: Optional[Callable[[str, float, Dict[str, Any]], Any]] = None,
+    ) -> None:
+        self.on_span = on_span
+        self.on_count = on_count
+        # name of the innermost open span; per thread and asyncio task
+        self._current: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("callback_span", default=None)
+
+    def start_span(self, name: str, attrs: Dict[str, Any]) -> Any:
+        handle = (name, dict(attrs), self._current.get(), time.perf_counter())
+        self._current.set(name)
+        return handle
+
+    def set_attribute(self, handle: Any, key: str, value: Any) -> None:
+        handle[1][key] = value
+
+    def end_span(self, handle: Any, error: Optional[BaseException]) -> None:
+        end = time.perf_counter()
+        name, attrs, parent, start = handle
+        self._current.set(parent)
+        if self.on_span is not None:
+            self.on_span(SpanRecord(name, attrs, start, end - start, parent, error))
+
+    def count(self, name: str, value: float, attrs: Dict[str, Any]) -> None:
+        if self.on_count is not None:
+            self.on_count(name, value, attrs)
+
+
+@dataclass(frozen=True)
+class SpanStats:
+    calls: int
+    errors: int
+    total_seconds: float
+    max_seconds: float
+
+
+class StatsSink(TraceSink):
+    """Aggregate spans per name and counters per ``(name, sorted attrs)``; thread-safe."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._spans: Dict[str, List[float]] = {}  # name -> [calls, errors, total, max]
+        self._counters: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], float] = {}
+
+    def start_span(self, name: str, attrs: Dict[str, Any]) -> Any:
+        return name, time.perf_counter()
+
+    def end_span(self, handle: Any, error: Optional[BaseException]) -> None:
+        name, start = handle
+        seconds = time.perf_counter() - start
+        with self._lock:
+            s = self._spans.setdefault(name, [0, 0, 0.0, 0.0])
+            s[0] += 1
+            s[1] += error is not None
+            s[2] += seconds
+            s[3] = max(s[3], seconds)
+
+    def count(self, name: str, value: float, attrs: Dict[str, Any]) -> None:
+        key = (name, tuple(sorted(attrs.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def spans(self) -> Dict[str, SpanStats]:
+        """Span stats by name, slowest total first."""
+        with self._lock:
+            items = sorted(self._spans.items(), key=lambda kv: -kv[1][2])
+            return {n: SpanStats(int(c), int(e), t, m) for n, (c, e, t, m) in items}
+
+    def counters(self) -> Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], float]:
+        """Counter totals keyed by ``(name, ((attr, value), ...))``."""
+        with self._lock:
+            return dict(self._counters)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._spans.clear()
+            self._counters.clear()
+
+
+class OpenTelemetrySink(TraceSink):
+    """Forward spans to an OpenTelemetry-style tracer.
+
+    Spans are opened with ``tracer.start_as_current_span(name, attributes=...)``
+    and closed with the escaping exception, so the tracer records errors.
+    Counters go to ``meter.create_counter(name).add(value, attributes)`` when a
+    meter is given, otherwise they become events on the innermost open span.
+
+    Args:
+        tracer: e.g. ``opentelemetry.trace.get_tracer("agent_compose_kit")``.
+        meter: e.g. ``opentelemetry.metrics.get_meter("agent_compose_kit")``.
+    """
+
+    def __init__(self, tracer: Any, meter: Any = None) -> None:
+        self.tracer = tracer
+        self.meter = meter
+        self._instruments: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        # innermost open span (target of meterless counters); per thread and asyncio task
+        self._current: contextvars.ContextVar[Any] = contextvars.ContextVar("otel_span", default=None)
+
+    def start_span(self, name: str, attrs: Dict[str, Any]) -> Any:
+        cm = self.tracer.start_as_current_span(name, attributes=_otel_attrs(attrs))
+        otel_span = cm.__enter__()
+        parent = self._current.get()
+        self._current.set(otel_span)
+        return cm, otel_span, parent
+
+    def set_attribute(self, handle: Any, key: str, value: Any) -> None:
+        handle[1].set_attribute(key, _otel_value(value))
+
+    def end_span(self, handle: Any, error: Optional[BaseException]) -> None:
+        cm, _, parent = handle
+        self._current.set(parent)
+        if error is None:
+            cm.__exit__(None, None, None)
+        else:
+            cm.__exit__(type(error), error, error.__traceback__)
+
+    def count(self, name: str, value: float, attrs: Dict[str, Any]) -> None:
+        if self.meter is None:
+            current = self._current.get()
+            if current is not None:
+                current.add_event(name, attributes={"value": value, **_otel_attrs(attrs)})
+            return
+        counter = self._instruments.get(name)
+        if counter is None:
+            with self._lock:
+                counter = self._instruments.get(name)
+                if counter is None:
+                    counter = self._instruments[name] = self.meter.create_counter(name)
+        counter.add(value, _otel_attrs(attrs))
+
+
+def _otel_value(value: Any) -> Any:
+    return value if isinstance(value, (str, bool, int, float)) else str(value)
+
+
+def _otel_attrs(attrs: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: _otel_value(v) for k, v in attrs.items()}
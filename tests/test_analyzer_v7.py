@@ -0,0 +1,54 @@
+import pytest
+
+from agent_compose_kit.compose import (
+    analyze,
+    build_system_graph,
+    get_quick_fixes,
+    lint,
+    list_dependencies,
+    load_config,
+    validate_aliases,
+)
+
+RAW = {
+    "schema_version": "0.1.0",
+    "metadata": {"name": "demo"},
+    "defaults": {"model_alias": "chat"},
+    "model_aliases": {"aliases": [{"id": "chat", "resolver": "direct", "model": "m"}]},
+    "agents": [
+        {"type": "llm", "name": "a", "instruction": "i", "model": "alias://fast"},
+        {
+            "type": "llm",
+            "name": "b",
+            "instruction": "i",
+            "tools": [{"kind": "openapi", "spec": {"ref": {"value": "registry://openapi/pets@1"}}, "operationId": "x"}],
+        },
+        {"type": "workflow.sequential", "name": "s", "sub_agents": ["a", "b", {"value": "registry://agent/r@1"}]},
+        {"type": "workflow.parallel", "name": "p", "sub_agents": ["a", "b", "a", "b", "a", "b", "a"]},
+    ],
+}
+
+
+def test_analyze_matches_individual_functions():
+    cfg = load_config(RAW)
+    res = analyze(RAW, cfg=cfg)
+    assert res.dependencies == list_dependencies(RAW) == {
+        "registryRefs": ["registry://agent/r@1", "registry://openapi/pets@1"],
+        "modelAliases": ["chat", "fast"],
+        "agentRefs": ["a", "b"],
+    }
+    assert res.aliases == validate_aliases(RAW) == {"unknown_aliases": ["fast"]}
+    assert res.lint == lint(RAW)
+    assert res.lint["warnings"][0].startswith("Agent 'a' is referenced by 5 parents")
+    assert res.lint["infos"] == ["Parallel agent 'p' fans out to 7 sub_agents; ensure downstream synthesis"]
+    assert res.quick_fixes == get_quick_fixes(raw_cfg=RAW)
+    assert res.graph == build_system_graph(cfg)
+
+
+def test_analyze_include_subset():
+    res = analyze(RAW, include=("lint",))
+    assert res.lint is not None
+    assert res.dependencies is None and res.quick_fixes is None and res.graph is None
+    assert analyze(RAW).graph is None  # graph needs a validated cfg
+    with pytest.raises(ValueError):
+        analyze(RAW, include=("nope",))
@@ -0,0 +1,84 @@
+import os
+import threading
+
+from agent_compose_kit.config.cache import ConfigCache
+from agent_compose_kit.config.models import load_config, load_config_file
+from agent_compose_kit.registry.fs import load_system, save_system
+
+YAML = """
+schema_version: 0.1.0
+metadata: { name: demo }
+agents:
+  - { type: llm, name: a, instruction: i }
+"""
+
+
+def test_cache_hits_until_content_changes(tmp_path):
+    p = tmp_path / "app.yaml"
+    p.write_text(YAML, encoding="utf-8")
+    cache = ConfigCache()
+    c1 = load_config_file(p, cache=cache)
+    c2 = load_config_file(p, cache=cache)
+    assert c1 is c2
+    # touched without content change: still a hit
+    st = os.stat(p)
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert load_config_file(p, cache=cache) is c1
+    assert cache.stats().hits == 2 and cache.stats().misses == 1
+    p.write_text(YAML.replace("name: a", "name: b"), encoding="utf-8")
+    c3 = load_config_file(p, cache=cache)
+    assert c3 is not c1 and c3.agents[0].name == "b"  # type: ignore[union-attr]
+    assert cache.load(p, copy=True) == c3 and cache.load(p, copy=True) is not c3
+
+
+def test_cache_skips_files_changed_during_read(tmp_path, monkeypatch):
+    from pathlib import Path
+
+    p = tmp_path / "app.yaml"
+    p.write_text(YAML, encoding="utf-8")
+    real_read = Path.read_bytes
+
+    def racing_read(self):
+        data = real_read(self)
+        p.write_text(YAML.replace("name: a", "name: bb"), encoding="utf-8")  # writer lands mid-load
+        return data
+
+    cache = ConfigCache()
+    with monkeypatch.context() as m:
+        m.setattr(Path, "read_bytes", racing_read)
+        assert cache.load(p).agents[0].name == "a"  # type: ignore[union-attr]
+    assert cache.stats().entries == 0
+    assert cache.load(p).agents[0].name == "bb"  # type: ignore[union-attr]
+    assert cache.stats().entries == 1
+
+
+def test_cache_lru_eviction_by_entries_and_bytes(tmp_path):
+    paths = []
+    for i in range(3):
+        p = tmp_path / f"c{i}.yaml"
+        p.write_text(YAML, encoding="utf-8")
+        paths.append(p)
+    cache = ConfigCache(max_entries=2)
+    for p in paths:
+        cache.load(p)
+    s = cache.stats()
+    assert s.entries == 2 and s.evictions == 1 and s.bytes == 2 * len(YAML.encode())
+    small = ConfigCache(max_bytes=len(YAML.encode()))
+    for p in paths:
+        small.load(p)
+    assert small.stats().entries == 1
+
+
+def test_cache_threads_and_load_system(tmp_path):
+    save_system(load_config(YAML), name="demo", version="1.0.0", root=tmp_path)
+    cache = ConfigCache()
+    out = []
+    ts = [threading.Thread(target=lambda: out.append(load_system("demo", "1.0.0", root=tmp_path, cache=cache))) for _ in range(8)]
+    for t in ts:
+        t.start()
+    for t in ts:
+        t.join()
+    assert len(out) == 8 and all(c == out[0] for c in out)
+    assert cache.stats().hits + cache.stats().misses == 8
+    cache.invalidate()
+    assert cache.stats().entries == 0
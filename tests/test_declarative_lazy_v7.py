@@ -0,0 +1,53 @@
+import threading
+
+import pytest
+
+from agent_compose_kit.registries.agents import DeclarativeAgentRegistry
+from agent_compose_kit.registries.tools import DeclarativeToolRegistry
+
+
+def _spec(bad=False):
+    agents = [{"id": f"a{i}", "type": "llm", "name": f"a{i}", "instruction": "x"} for i in range(50)]
+    if bad:
+        agents.append({"id": "broken", "type": "nope", "name": "broken"})
+        agents.append({"id": "no_name", "type": "llm"})
+    return {"agents": agents, "groups": [{"id": "core", "include": ["a1", "a2"]}]}
+
+
+def test_lazy_agent_registry_validates_on_first_access():
+    with pytest.raises(ValueError):
+        DeclarativeAgentRegistry(_spec(bad=True))  # eager mode fails in the constructor
+    reg = DeclarativeAgentRegistry(_spec(bad=True), lazy=True)
+    assert reg._by_id == {}
+    assert "broken" in reg.list_ids() and len(reg.list_ids()) == 52
+    a = reg.get("a3")
+    assert a is reg.get("a3")  # memoized
+    assert [x.name for x in reg.get_group("core")] == ["a1", "a2"]
+    assert sorted(reg._by_id) == ["a1", "a2", "a3"]
+    with pytest.raises(ValueError, match="Unknown agent type"):
+        reg.get("broken")
+    with pytest.raises(KeyError):
+        reg.get("ghost")
+    with pytest.raises(ValueError) as exc:
+        reg.validate_all()
+    assert str(exc.value).startswith("2 invalid agent entries") and "broken:" in str(exc.value) and "no_name:" in str(exc.value)
+    assert DeclarativeAgentRegistry(_spec(), lazy=True).validate_all() == 50
+
+
+def test_lazy_get_is_thread_safe_and_tools_support_lazy():
+    reg = DeclarativeAgentRegistry(_spec(), lazy=True)
+    out = []
+    ts = [threading.Thread(target=lambda: out.append(reg.get("a7"))) for _ in range(8)]
+    for t in ts:
+        t.start()
+    for t in ts:
+        t.join()
+    assert all(x is reg.get("a7") for x in out)
+
+    tools = DeclarativeToolRegistry(
+        {"tools": [{"id": "sum", "kind": "function", "function": {"import": "tests.helpers:sample_tool"}}, {"id": "bad", "kind": "?"}]},
+        lazy=True,
+    )
+    assert tools.get("sum").kind == "function"
+    with pytest.raises(ValueError, match="1 invalid tool entries"):
+        tools.validate_all()
@@ -0,0 +1,72 @@
+import pytest
+
+from agent_compose_kit.config.models import load_config
+from agent_compose_kit.registries.tools import DeclarativeToolRegistry
+
+
+def _raw():
+    return {
+        "schema_version": "0.1.0",
+        "metadata": {"name": "demo"},
+        "agents": [
+            {
+                "type": "llm",
+                "name": "a",
+                "instruction": "i",
+                "tools": [
+                    {"kind": "function", "function": {"import": "pkg.mod:fn"}},
+                    {"kind": "mcp", "server": {"ref": {"value": "registry://mcp/files@latest"}}, "tool": "read_file"},
+                    {"kind": "builtin", "name": "google_search"},
+                ],
+            },
+            {"type": "workflow.sequential", "name": "seq", "sub_agents": ["a"]},
+            {"type": "custom", "name": "c", "class": "pkg.mod:Class"},
+        ],
+    }
+
+
+def test_discriminated_mode_matches_default_mode():
+    assert load_config(_raw(), discriminated=True) == load_config(_raw())
+
+
+def test_discriminated_mode_reports_tag_and_field_errors_with_location():
+    raw = _raw()
+    raw["agents"][0]["tools"][1]["tool"] = None
+    raw["agents"][1] = {"type": "workflow.nope", "name": "seq"}
+    with pytest.raises(ValueError) as ei:
+        load_config(raw, discriminated=True)
+    msg = str(ei.value)
+    assert "agents.0.tools.1.tool" in msg
+    assert "union_tag_invalid" in msg and "workflow.nope" in msg
+
+
+@pytest.mark.parametrize("tag", [["llm"], {"t": "llm"}, 3])
+def test_discriminated_mode_rejects_non_string_tags(tag):
+    bad_agent, bad_tool = _raw(), _raw()
+    bad_agent["agents"][1]["type"] = tag
+    bad_tool["agents"][0]["tools"][0]["kind"] = tag
+    for raw, loc in ((bad_agent, "agents.1"), (bad_tool, "agents.0.tools.0")):
+        with pytest.raises(ValueError, match="union_tag_invalid") as ei:
+            load_config(raw, discriminated=True)
+        assert loc in str(ei.value)
+        with pytest.raises(ValueError):
+            load_config(raw)
+
+
+def test_discriminated_mode_requires_tags():
+    raw = _raw()
+    del raw["agents"][2]["type"]
+    with pytest.raises(ValueError, match="union_tag_not_found"):
+        load_config(raw, discriminated=True)
+
+
+def test_discriminated_mode_keeps_cross_agent_checks():
+    raw = _raw()
+    raw["agents"][2]["name"] = "a"
+    with pytest.raises(ValueError, match="duplicate agent names"):
+        load_config(raw, discriminated=True)
+
+
+def test_tool_registry_accepts_all_tool_kinds():
+    reg = DeclarativeToolRegistry({"tools": [{"id": "s", "kind": "builtin", "name": "google_search"}]})
+    assert getattr(reg.get("s"), "kind") == "builtin"
@@ -0,0 +1,47 @@
+import copy
+
+from agent_compose_kit.quickfix import PatchOp, apply_ops
+from agent_compose_kit.quickfix.fingerprints import fingerprint_tree, update_fingerprint_tree
+from agent_compose_kit.quickfix.fixes import fingerprint
+
+RAW = {
+    "schema_version": "0.1.0",
+    "metadata": {"name": "demo", "labels": {"b": "2", "a": "1"}},
+    "model_aliases": {"aliases": [{"id": "chat", "resolver": "direct", "model": "m"}]},
+    "agents": [
+        {"type": "llm", "name": "a", "instruction": "i", "tools": [{"kind": "function", "function": {"import": "p:m"}}]},
+        {"type": "llm", "name": "b", "instruction": "i"},
+        {"type": "workflow.sequential", "name": "seq", "sub_agents": ["a", "b"]},
+    ],
+}
+
+
+def test_fingerprint_is_key_order_independent():
+    shuffled = {k: RAW[k] for k in reversed(list(RAW))}
+    assert fingerprint(shuffled) == fingerprint(RAW)
+    assert fingerprint_tree(shuffled) == fingerprint_tree(RAW)
+
+
+def test_tree_localizes_changes():
+    t1 = fingerprint_tree(RAW)
+    assert len(t1.agents) == 3 and len(t1.tools[0]) == 1 and len(t1.aliases) == 1
+    raw2 = copy.deepcopy(RAW)
+    raw2["agents"][1]["model"] = "x"
+    t2 = fingerprint_tree(raw2)
+    assert t2.root != t1.root
+    assert t1.diff(t2) == {"sections": ["agents"], "agents": ["b"]}
+    assert t2.agents[0] == t1.agents[0] and t2.agents[2] == t1.agents[2]
+
+
+def test_update_matches_full_recompute():
+    t = fingerprint_tree(RAW)
+    cases = [
+        [PatchOp(op="replace", path="/agents/0/tools/0/function/import", value="p:n")],
+        [PatchOp(op="add", path="/agents/1", value={"type": "llm", "name": "n", "instruction": "i"}), PatchOp(op="remove", path="/agents/3")],
+        [PatchOp(op="add", path="/model_aliases/aliases/-", value={"id": "x", "resolver": "direct", "model": "m"})],
+        [PatchOp(op="add", path="/defaults", value={"model_alias": "chat"}), PatchOp(op="remove", path="/metadata/labels/a")],
+        [PatchOp(op="replace", path="/agents", value=[])],
+    ]
+    for ops in cases:
+        raw2 = apply_ops(RAW, ops)
+        assert update_fingerprint_tree(t, raw2, ops) == fingerprint_tree(raw2), ops
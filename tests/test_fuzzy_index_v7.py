@@ -0,0 +1,28 @@
+import difflib
+import random
+
+from agent_compose_kit.quickfix import get_quick_fixes
+from agent_compose_kit.quickfix.fuzzy import FuzzyIndex
+
+
+def test_fuzzy_index_matches_difflib_top_match():
+    rng = random.Random(7)
+    alphabet = "abcdeGPst_01"
+    names = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 12))) for _ in range(300)]
+    idx = FuzzyIndex(names)
+    for _ in range(300):
+        w = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        expected = difflib.get_close_matches(w, names, n=1, cutoff=0.6)
+        assert idx.closest(w) == (expected[0] if expected else None)
+
+
+def test_prebuilt_operation_id_index_is_reused():
+    ops = FuzzyIndex(["getPet", "listPets", "createPet"])
+    raw = {
+        "agents": [
+            {"type": "llm", "name": "a", "instruction": "i", "tools": [{"kind": "openapi", "operationId": "listPet"}]},
+        ]
+    }
+    fixes = get_quick_fixes(raw_cfg=raw, indexes={"openapi_operationIds": ops})
+    assert any(f.id == "fix-opid-0-0" and f.ops[0].value == "listPets" for f in fixes)
+    assert "getPet" in ops and len(ops) == 3
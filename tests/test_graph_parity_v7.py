@@ -0,0 +1,81 @@
+import random
+
+import pytest
+from graph_baseline import baseline_build_system_graph
+
+from agent_compose_kit.config.models import load_config
+from agent_compose_kit.graph.build import build_system_graph
+from benchmarks.bench_graph import synth as bench_graph_config
+from benchmarks.synth import synth_config
+
+KINDS = ["llm", "llm", "llm", "workflow.sequential", "workflow.parallel", "workflow.loop", "custom"]
+REFS = [{"value": f"registry://agent/helper{k}@{v}"} for k in range(3) for v in ("1.0.0", "^2")]
+
+
+def _sub(rng, names):
+    roll = rng.random()
+    if roll < 0.3:
+        return rng.choice(REFS)
+    if roll < 0.4:
+        return "nobody"
+    return rng.choice(names)
+
+
+def _config(seed):
+    rng = random.Random(seed)
+    names = [f"a{i}" for i in range(rng.randrange(1, 12))]
+    agents = []
+    for name in names:
+        kind = rng.choice(KINDS)
+        subs = [_sub(rng, names) for _ in range(rng.randrange(0 if kind in ("llm", "custom") else 1, 4))]
+        if kind == "llm":
+            a = {"type": "llm", "name": name, "instruction": "i", "sub_agents": subs}
+            if rng.random() < 0.5:
+                a["model"] = "m"
+            if rng.random() < 0.4:
+                a["output_key"] = f"{name}_out"
+            if rng.random() < 0.3:
+                a["tools"] = [{"kind": "builtin", "name": "google_search"}]
+                a["output_schema"] = "pkg:Schema" if rng.random() < 0.5 else None
+            if rng.random() < 0.2:
+                a["planner"] = {"type": "plan_react"}
+        elif kind == "custom":
+            a = {"type": "custom", "name": name, "class": "pkg:Agent", "sub_agents": subs}
+        else:
+            a = {"type": kind, "name": name, "sub_agents": subs}
+        agents.append(a)
+    raw = {"schema_version": "0.1.0", "metadata": {"name": "p"}, "agents": agents}
+    if rng.random() < 0.5:
+        raw["defaults"] = {"model_alias": "chat"}
+    return raw
+
+
+def _dedupe_registry_nodes(nodes):
+    seen, out = set(), []
+    for n in nodes:
+        if n["type"] == "agent.registry":
+            if n["id"] in seen:
+                continue
+            seen.add(n["id"])
+        out.append(n)
+    return out
+
+
+def _assert_same_graph(raw):
+    cfg = load_config(raw)
+    new, old = build_system_graph(cfg), baseline_build_system_graph(cfg)
+    assert new["nodes"] == _dedupe_registry_nodes(old["nodes"])
+    assert new["edges"] == old["edges"]
+    assert new["hints"] == old["hints"]
+
+
+@pytest.mark.parametrize("chunk", range(4))
+def test_matches_baseline_on_random_configs(chunk):
+    for seed in range(chunk * 100, (chunk + 1) * 100):
+        _assert_same_graph(_config(seed))
+
+
+@pytest.mark.parametrize("n", [1, 50, 300])
+def test_matches_baseline_on_benchmark_configs(n):
+    _assert_same_graph(bench_graph_config(n))
+    _assert_same_graph(synth_config(n, registry_keys=5))
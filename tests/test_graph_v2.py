@@ -77,3 +77,24 @@ def test_hints_missing_model_and_unknown_subagent():
     g = build_system_graph(cfg)
     assert any("no model" in h for h in g["hints"])  # missing model and no defaults
     assert any("unknown sub_agent" in h for h in g["hints"])  # unresolved
+
+
+def test_registry_agent_nodes_are_deduplicated():
+    ref = {"value": "registry://agent/helper@1.0.0"}
+    cfg = load_config(
+        {
+            "schema_version": "0.1.0",
+            "metadata": {"name": "demo"},
+            "agents": [
+                {"type": "llm", "name": "a", "instruction": "i", "sub_agents": [ref]},
+                {"type": "workflow.sequential", "name": "seq", "sub_agents": ["a", ref]},
+                {"type": "workflow.parallel", "name": "par", "sub_agents": [ref]},
+            ],
+        }
+    )
+    g = build_system_graph(cfg)
+    reg = [n for n in g["nodes"] if n["type"] == "agent.registry"]
+    assert [n["id"] for n in reg] == ["registry:agent:helper@1.0.0"]
+    targets = [e for e in g["edges"] if e["target"] == "registry:agent:helper@1.0.0"]
+    assert len(targets) == 4  # edges are kept per reference; only the node is shared
+    assert any("upstream agent 'a' has no output_key" in h for h in g["hints"])
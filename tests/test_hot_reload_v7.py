@@ -0,0 +1,127 @@
+import itertools
+import os
+import threading
+import time
+
+import pytest
+
+from agent_compose_kit.config.models import load_config
+from agent_compose_kit.registries.reload import HotReloader, ShardSource
+from agent_compose_kit.registry.fs import promote, save_system
+from agent_compose_kit.registry.snapshot import FsRegistrySource
+
+_bump = itertools.count(1)
+
+
+def _shard(root, name, ids, instruction="x"):
+    body = "agents:\n" + "".join(f"  - {{ id: {i}, type: llm, name: {i}, instruction: {instruction} }}\n" for i in ids)
+    path = root / name
+    path.write_text(body)
+    st = path.stat()  # make every rewrite visible even within one mtime tick
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000 * next(_bump)))
+
+
+def _wait(pred, timeout=5.0):
+    end = time.time() + timeout
+    while time.time() < end:
+        if pred():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_shard_source_rebuilds_only_changed_shards_and_swaps(tmp_path):
+    for s in range(4):
+        _shard(tmp_path, f"s{s}.yaml", [f"a{s}"])
+    source = ShardSource(tmp_path)
+    hot = HotReloader(source)
+    old = hot.current
+    assert old.list_ids() == ["a0", "a1", "a2", "a3"] and len(source.reparsed) == 4
+    with pytest.raises(RuntimeError, match="frozen"):
+        old.add({"id": "z", "type": "llm", "name": "z", "instruction": "x"})
+    assert hot.reload() is False  # nothing changed
+
+    _shard(tmp_path, "s2.yaml", ["a2", "b2"], instruction="y")
+    assert hot.reload() is True
+    assert [os.path.basename(p) for p in source.reparsed] == ["s2.yaml"]
+    assert hot.current.get("b2").instruction == "y"
+    assert "b2" not in old.list_ids()  # readers holding the old snapshot are unaffected
+
+    _shard(tmp_path, "s3.yaml", ["a3", "a0"], instruction="dup")  # duplicate id: keep serving
+    live = hot.current
+    assert hot.reload() is False and hot.current is live
+    m = hot.metrics()
+    assert m.failures == 1 and "duplicate agent id 'a0'" in m.last_error
+    assert m.version == 2 and m.reloads == 1 and m.last_rebuild_seconds > 0
+
+    (tmp_path / "s3.yaml").unlink()
+    assert hot.reload() is True and "a3" not in hot.current.list_ids()
+    assert hot.metrics().last_error is None
+
+
+def test_publish_time_covers_on_reload(tmp_path):
+    _shard(tmp_path, "s.yaml", ["a"])
+    hot = HotReloader(ShardSource(tmp_path), on_reload=lambda snap: time.sleep(0.02))
+    _shard(tmp_path, "s.yaml", ["a", "b"])
+    assert hot.reload() is True
+    assert hot.metrics().last_publish_seconds >= 0.02
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_watcher_swaps_in_background_without_blocking_readers(tmp_path, use_inotify):
+    _shard(tmp_path, "s0.yaml", ["a0"])
+    seen = []
+    hot = HotReloader(ShardSource(tmp_path), interval=0.05, debounce=0.01, use_inotify=use_inotify, on_reload=seen.append)
+    stop = threading.Event()
+    errors = []
+
+    def reader():
+        while not stop.is_set():
+            snap = hot.current
+            try:
+                assert snap.get("a0").name == "a0"
+            except Exception as e:  # pragma: no cover - failure path
+                errors.append(e)
+
+    t = threading.Thread(target=reader)
+    with hot:
+        t.start()
+        (tmp_path / "sub").mkdir()
+        _shard(tmp_path / "sub", "s1.yaml", ["a1"])
+        assert _wait(lambda: "a1" in hot.current.list_ids())
+        assert hot.metrics().watcher in (("inotify", "poll") if use_inotify else ("poll",))
+    stop.set()
+    t.join()
+    assert errors == [] and seen and seen[-1] is hot.current
+    assert hot.metrics().watcher == "stopped"
+
+
+def test_fs_registry_snapshots(tmp_path):
+    cfg = lambda label: load_config({"schema_version": "0.1.0", "metadata": {"name": label}, "agents": []})  # noqa: E731
+    save_system(cfg("one"), name="demo", version="1.0.0", root=tmp_path)
+    save_system(cfg("two"), name="demo", version="2.0.0", root=tmp_path)
+    promote("demo", "1.0.0", "prod", root=tmp_path)
+    hot = HotReloader(FsRegistrySource(tmp_path))
+    old = hot.current
+    assert old.load_system("demo", "prod").metadata.name == "one"
+
+    promote("demo", "2.0.0", "prod", root=tmp_path)
+    save_system(cfg("three"), name="other", version="0.1.0", root=tmp_path)
+    assert old.resolve_version("demo", "prod") == "1.0.0"  # frozen view
+    assert hot.reload() is True
+    assert hot.current.load_system("demo", "prod").metadata.name == "two"
+    assert hot.current.list_systems() == ["demo", "other"]
+    assert hot.current.list_versions("demo") == ["1.0.0", "2.0.0", "prod"]
+    with pytest.raises(FileNotFoundError):
+        hot.current.load_system("demo", "nope")
+
+
+def test_fs_registry_snapshot_ignores_later_resave(tmp_path):
+    cfg = lambda label: load_config({"schema_version": "0.1.0", "metadata": {"name": label}, "agents": []})  # noqa: E731
+    save_system(cfg("one"), name="demo", version="1.0.0", root=tmp_path)
+    promote("demo", "1.0.0", "prod", root=tmp_path)
+    snap = FsRegistrySource(tmp_path).build()
+    save_system(cfg("two"), name="demo", version="1.0.0", root=tmp_path)
+    assert snap.load_system("demo", "prod").metadata.name == "one"
+    assert snap.load_system("demo", "1.0.0").metadata.name == "one"
+    assert FsRegistrySource(tmp_path).build().load_system("demo", "prod").metadata.name == "two"
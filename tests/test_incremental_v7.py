@@ -0,0 +1,65 @@
+import pytest
+
+from agent_compose_kit.config.incremental import IncrementalConfig, apply_patch
+from agent_compose_kit.config.models import load_config
+from agent_compose_kit.quickfix import PatchOp, apply_ops
+
+
+def _raw():
+    return {
+        "schema_version": "0.1.0",
+        "metadata": {"name": "demo"},
+        "agents": [
+            {"type": "llm", "name": "a", "instruction": "i", "tools": [{"kind": "function", "function": {"import": "p:m"}}]},
+            {"type": "llm", "name": "b", "instruction": "i"},
+            {"type": "workflow.sequential", "name": "seq", "sub_agents": ["a", "b"]},
+            {"type": "custom", "name": "c", "class": "pkg.mod:Class"},
+        ],
+    }
+
+
+@pytest.mark.parametrize(
+    "ops",
+    [
+        [PatchOp(op="add", path="/agents/1/model", value="gemini-2.0-flash")],
+        [PatchOp(op="replace", path="/agents/0/tools/0/function/import", value="p:n")],
+        [PatchOp(op="remove", path="/agents/2"), PatchOp(op="add", path="/agents/-", value={"type": "llm", "name": "d", "instruction": "x"})],
+        [PatchOp(op="add", path="/agents/0", value={"type": "workflow.loop", "name": "lp", "sub_agents": ["a"]})],
+        [PatchOp(op="replace", path="/agents/3/class", value="other:Cls")],
+        [PatchOp(op="add", path="/defaults", value={"model_alias": "chat"}), PatchOp(op="replace", path="/agents/1/name", value="bb")],
+        [PatchOp(op="replace", path="/agents", value=[{"type": "llm", "name": "z", "instruction": "i"}])],
+    ],
+)
+def test_incremental_matches_full_revalidation(ops):
+    cfg = load_config(_raw())
+    assert apply_patch(cfg, ops) == load_config(apply_ops(_raw(), ops))
+    assert cfg == load_config(_raw())  # input untouched
+
+
+def test_incremental_errors_and_state_preserved():
+    inc = IncrementalConfig(load_config(_raw()))
+    before = inc.cfg
+    with pytest.raises(ValueError, match="agents.1.instruction"):
+        inc.apply([PatchOp(op="replace", path="/agents/1/instruction", value="  ")])
+    with pytest.raises(ValueError, match="duplicate agent names: a"):
+        inc.apply([PatchOp(op="replace", path="/agents/1/name", value="a")])
+    with pytest.raises(ValueError, match="does not resolve"):
+        inc.apply([PatchOp(op="replace", path="/agents/9/name", value="q")])
+    assert inc.cfg is before
+    # renaming then reusing the freed name is allowed via the maintained index
+    inc.apply([PatchOp(op="replace", path="/agents/0/name", value="a2")])
+    cfg = inc.apply([PatchOp(op="replace", path="/agents/1/name", value="a")])
+    assert [getattr(a, "name") for a in cfg.agents] == ["a2", "a", "seq", "c"]
+    assert cfg.agents[2] is before.agents[2]  # untouched agents reused
+
+
+def test_apply_ops_pointer_escapes():
+    doc = {"metadata": {"labels": {"a/b": "1"}}}
+    out = apply_ops(doc, [PatchOp(op="replace", path="/metadata/labels/a~1b", value="2")])
+    assert out["metadata"]["labels"]["a/b"] == "2" and doc["metadata"]["labels"]["a/b"] == "1"
+
+
+def test_incremental_rejects_non_string_type():
+    cfg = load_config(_raw())
+    with pytest.raises(ValueError):
+        apply_patch(cfg, [PatchOp(op="replace", path="/agents/1/type", value=["llm"])])
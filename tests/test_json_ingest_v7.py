@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from agent_compose_kit.config.models import (
+    load_config,
+    load_config_bytes,
+    load_config_file,
+    load_config_json,
+)
+
+RAW = {
+    "schema_version": "0.1.0",
+    "metadata": {"name": "demo"},
+    "agents": [
+        {"type": "llm", "name": "a", "instruction": "i", "tools": [{"kind": "function", "function": {"import": "p:m"}}]},
+        {"type": "workflow.sequential", "name": "seq", "sub_agents": ["a"]},
+    ],
+}
+
+
+def test_json_paths_match_dict_path():
+    expected = load_config(RAW)
+    doc = json.dumps(RAW)
+    assert load_config_json(doc) == expected
+    assert load_config_json(doc.encode(), discriminated=True) == expected
+    assert load_config_bytes(doc.encode()) == expected
+    assert load_config_bytes(doc.encode(), discriminated=True) == expected
+
+
+def test_bytes_falls_back_to_yaml_for_flow_mappings():
+    flow = "{schema_version: 0.1.0, metadata: {name: demo}, agents: [{type: llm, name: a, instruction: i}]}"
+    assert load_config_bytes(flow.encode()).metadata.name == "demo"
+
+
+def test_json_errors_are_value_errors():
+    with pytest.raises(ValueError):
+        load_config_json(b'{"schema_version": "0.1.0"}')
+    with pytest.raises(ValueError):
+        load_config_json(b"{not json")
+    bad = dict(RAW, schema_version="one")
+    with pytest.raises(ValueError, match="semver"):
+        load_config_bytes(json.dumps(bad))
+
+
+def test_load_config_file_accepts_json(tmp_path):
+    p = tmp_path / "app.json"
+    p.write_text(json.dumps(RAW), encoding="utf-8")
+    assert load_config_file(p) == load_config(RAW)
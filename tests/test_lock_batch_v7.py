@@ -0,0 +1,144 @@
+import json
+import threading
+import urllib.parse
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from agent_compose_kit.lock import ResolverCache, plan_lock
+
+
+class FakeRegistry(BaseHTTPRequestHandler):
+    """Local registry: GET /resolve?kind&key&range, POST /resolve_many, GET /alias?name."""
+
+    requests = 0
+    fail_batches = 0
+
+    def _reply(self, code, body):
+        data = json.dumps(body).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    @staticmethod
+    def answer(kind, key, rng):
+        if key == "missing":
+            return {"error": f"{kind}/{key} not found"}
+        return {"version": f"{rng.lstrip('^')}.0.1", "etag": f"{key}-etag"}
+
+    def do_GET(self):
+        type(self).requests += 1
+        url = urllib.parse.urlparse(self.path)
+        q = dict(urllib.parse.parse_qsl(url.query))
+        if url.path == "/alias":
+            self._reply(200, {"provider": "p", "model": q["name"].upper()})
+        else:
+            self._reply(200, self.answer(q["kind"], q["key"], q["range"]))
+
+    def do_POST(self):
+        type(self).requests += 1
+        if type(self).fail_batches:
+            type(self).fail_batches -= 1
+            self._reply(503, {"error": "busy"})
+            return
+        items = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self._reply(200, [self.answer(*item) for item in items])
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    FakeRegistry.requests = 0
+    FakeRegistry.fail_batches = 0
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), FakeRegistry)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{srv.server_address[1]}"
+    srv.shutdown()
+    srv.server_close()
+
+
+def _get(url):
+    with urllib.request.urlopen(url) as r:
+        return json.loads(r.read())
+
+
+def clients(base):
+    def registry(kind, key, rng):
+        body = _get(f"{base}/resolve?" + urllib.parse.urlencode({"kind": kind, "key": key, "range": rng}))
+        if "error" in body:
+            raise LookupError(body["error"])
+        return body
+
+    def registry_many(triples):
+        req = urllib.request.Request(f"{base}/resolve_many", data=json.dumps(triples).encode(), method="POST")
+        with urllib.request.urlopen(req) as r:
+            bodies = json.loads(r.read())
+        return {t: LookupError(b["error"]) if "error" in b else b for t, b in zip(triples, bodies)}
+
+    def alias(name):
+        return _get(f"{base}/alias?name={name}")
+
+    return registry, registry_many, alias
+
+
+def _raw(n):
+    keys = [f"s{i:03d}" for i in range(n)] + ["missing"]
+    return {
+        "schema_version": "0.1.0",
+        "metadata": {"name": "demo"},
+        "defaults": {"model_alias": "chat"},
+        "agents": [
+            {
+                "type": "llm",
+                "name": "a",
+                "instruction": "i",
+                "tools": [{"kind": "mcp", "server": {"ref": {"value": f"registry://mcp/{k}@^1"}}, "tool": "t"} for k in keys],
+            }
+        ],
+    }
+
+
+def test_batch_resolver_cuts_round_trips(server):
+    registry, registry_many, alias = clients(server)
+    raw = _raw(250)
+    per_item = plan_lock(raw, registry, alias)
+    assert FakeRegistry.requests == 252
+
+    FakeRegistry.requests = 0
+    batched = plan_lock(raw, registry, alias, registry_resolves_many=registry_many, batch_size=100)
+    assert batched == per_item
+    assert FakeRegistry.requests == 3 + 1  # three registry batches + one alias call
+    assert next(p for p in batched.registryPins if p.key == "missing").error == "mcp/missing not found"
+
+
+def test_failed_batch_falls_back_per_item(server):
+    registry, registry_many, alias = clients(server)
+    raw = _raw(10)
+    expected = plan_lock(raw, registry, alias)
+    FakeRegistry.requests = 0
+    FakeRegistry.fail_batches = 1
+    assert plan_lock(raw, registry, alias, registry_resolves_many=registry_many, batch_size=6) == expected
+    # batch 1 failed -> 6 single calls; batch 2 answered; 1 alias call
+    assert FakeRegistry.requests == 2 + 6 + 1
+
+
+def test_cache_sends_only_misses_to_batch(server, tmp_path):
+    registry, registry_many, alias = clients(server)
+    cache = ResolverCache(tmp_path / "c.json")
+    plan_lock(_raw(5), registry, alias, registry_resolves_many=registry_many, cache=cache)
+    FakeRegistry.requests = 0
+    seen = []
+
+    def spy(triples):
+        seen.append(list(triples))
+        return registry_many(triples)
+
+    plan_lock(_raw(7), registry, alias, registry_resolves_many=spy, cache=cache)
+    # the "missing" error is not cached, so it is asked again with the two new refs
+    assert seen == [[("mcp", "missing", "^1"), ("mcp", "s005", "^1"), ("mcp", "s006", "^1")]]
+    assert FakeRegistry.requests == 1
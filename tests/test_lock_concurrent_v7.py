@@ -0,0 +1,105 @@
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import CancelledError
+
+import pytest
+
+from agent_compose_kit.lock import plan_lock, plan_lock_async, plan_lock_threaded
+
+
+def _raw(n: int) -> dict:
+    tools = [{"kind": "mcp", "server": {"ref": {"value": f"registry://mcp/s{i}@^1"}}, "tool": "t"} for i in range(n)]
+    tools.append({"kind": "mcp", "server": {"ref": {"value": "registry://bad"}}, "tool": "t"})
+    return {
+        "schema_version": "0.1.0",
+        "metadata": {"name": "demo"},
+        "defaults": {"model_alias": "chat"},
+        "agents": [{"type": "llm", "name": "a", "instruction": "i", "model": "alias://broken", "tools": tools}],
+    }
+
+
+class Resolver:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def registry(self, kind, key, rng):
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(random.random() * self.delay)
+            if key == "s3":
+                raise RuntimeError("registry down")
+            return {"version": f"1.{key[1:]}.0", "etag": key}
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    def alias(self, alias):
+        if alias == "broken":
+            raise KeyError(alias)
+        return {"provider": "p", "model": "m", "params": {"t": 1}}
+
+
+def test_threaded_matches_sequential_and_bounds_concurrency():
+    raw = _raw(40)
+    expected = plan_lock(raw, Resolver().registry, Resolver().alias)
+    res = Resolver(delay=0.005)
+    plan = plan_lock_threaded(raw, res.registry, res.alias, max_workers=4)
+    assert plan == expected
+    assert 1 < res.peak <= 4
+    assert [p.error for p in plan.registryPins if p.error] == ["registry down", "invalid registry ref path"]
+    assert [a.model for a in plan.aliasPins] == [None, "m"]
+
+
+def test_threaded_timeout_and_cancel():
+    def slow(kind, key, rng):
+        if key == "s1":
+            time.sleep(0.5)
+        return {"version": "1"}
+
+    t0 = time.monotonic()
+    plan = plan_lock_threaded(_raw(3), slow, lambda a: {}, timeout=0.05)
+    assert time.monotonic() - t0 < 0.4
+    errors = {p.key: p.error for p in plan.registryPins}
+    assert errors["s1"] == "resolver timed out after 0.05s"
+    assert errors["s0"] is None and errors["s2"] is None
+
+    cancel = threading.Event()
+    cancel.set()
+    with pytest.raises(CancelledError):
+        plan_lock_threaded(_raw(3), slow, lambda a: {}, cancel=cancel)
+
+
+def test_async_matches_sequential_with_timeout_and_cancellation():
+    raw = _raw(20)
+    expected = plan_lock(raw, Resolver().registry, Resolver().alias)
+    res = Resolver()
+
+    async def registry(kind, key, rng):
+        await asyncio.sleep(random.random() * 0.005)
+        return res.registry(kind, key, rng)
+
+    assert asyncio.run(plan_lock_async(raw, registry, res.alias, concurrency=3)) == expected
+
+    async def hang(kind, key, rng):
+        if key == "s0":
+            await asyncio.sleep(10)
+        return {"version": "1"}
+
+    plan = asyncio.run(plan_lock_async(_raw(2), hang, res.alias, timeout=0.05))
+    assert {p.key: p.error for p in plan.registryPins}["s0"] == "resolver timed out after 0.05s"
+
+    async def cancelled() -> None:
+        task = asyncio.ensure_future(plan_lock_async(_raw(2), hang, res.alias))
+        await asyncio.sleep(0.02)
+        task.cancel()
+        await task
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(cancelled())
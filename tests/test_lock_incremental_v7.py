@@ -0,0 +1,81 @@
+import copy
+import dataclasses
+import json
+
+from agent_compose_kit.lock import LockfilePlan, plan_lock, plan_lock_incremental
+
+
+def _raw(refs, alias="chat"):
+    return {
+        "schema_version": "0.1.0",
+        "metadata": {"name": "demo"},
+        "defaults": {"model_alias": alias},
+        "agents": [
+            {
+                "type": "llm",
+                "name": "a",
+                "instruction": "i",
+                "tools": [{"kind": "mcp", "server": {"ref": {"value": r}}, "tool": "t"} for r in refs],
+            }
+        ],
+    }
+
+
+class Resolver:
+    def __init__(self):
+        self.calls = []
+
+    def registry(self, kind, key, rng):
+        self.calls.append((kind, key, rng))
+        if key == "down":
+            raise RuntimeError("unavailable")
+        return {"version": f"{key}-{rng}", "etag": f"e-{key}"}
+
+    def alias(self, alias):
+        self.calls.append(alias)
+        return {"provider": "p", "model": alias.upper(), "params": {"t": 0.1}}
+
+
+def test_only_changed_refs_are_resolved_and_result_matches_full_plan():
+    refs = [f"registry://mcp/s{i}@1" for i in range(20)] + ["registry://nope", "registry://mcp/down@1"]
+    r = Resolver()
+    prev = plan_lock(_raw(refs), r.registry, r.alias)
+
+    new_refs = copy.copy(refs)
+    new_refs[3] = "registry://mcp/s3@2"  # range changed
+    new_refs[4] = "registry://mcp/new@1"  # added (s4 removed)
+    raw2 = _raw(new_refs, alias="fast")
+
+    r.calls.clear()
+    inc = plan_lock_incremental(prev, raw2, r.registry, r.alias)
+    assert sorted(r.calls, key=str) == [("mcp", "down", "1"), ("mcp", "new", "1"), ("mcp", "s3", "2"), "fast"]
+    assert inc == plan_lock(raw2, Resolver().registry, Resolver().alias)
+
+    # carried pins are the same objects; errored pins can be kept as-is
+    kept = {p.key: p for p in prev.registryPins}
+    assert next(p for p in inc.registryPins if p.key == "s0") is kept["s0"]
+    r.calls.clear()
+    plan_lock_incremental(inc, raw2, r.registry, r.alias, retry_errors=False)
+    assert r.calls == []
+
+
+def test_from_dict_round_trip():
+    r = Resolver()
+    plan = plan_lock(_raw(["registry://mcp/a@1"]), r.registry, r.alias)
+    stored = json.loads(json.dumps(dataclasses.asdict(plan)))
+    assert LockfilePlan.from_dict(stored) == plan
+
+
+def test_failed_alias_pins_are_retried():
+    raw = _raw(["registry://mcp/s@1"])
+
+    def broken(alias):
+        raise RuntimeError("alias backend down")
+
+    first = plan_lock(raw, Resolver().registry, broken)
+    assert first.aliasPins[0].model is None
+    r = Resolver()
+    kept = plan_lock_incremental(first, raw, r.registry, r.alias, retry_errors=False)
+    assert r.calls == [] and kept == first
+    again = plan_lock_incremental(first, raw, r.registry, r.alias)
+    assert r.calls == ["chat"] and again == plan_lock(raw, Resolver().registry, Resolver().alias)
@@ -0,0 +1,62 @@
+import pytest
+
+from agent_compose_kit.registries.tools import DeclarativeToolRegistry
+
+
+def _tool(tid):
+    return {"id": tid, "kind": "builtin", "name": "google_search"}
+
+
+def _spec(groups):
+    return {"tools": [_tool(t) for t in "abcde"], "groups": groups}
+
+
+def test_nested_groups_flatten_in_order_and_keep_duplicates():
+    reg = DeclarativeToolRegistry(
+        _spec(
+            [
+                {"id": "all", "include": [{"group": "base"}, "e", {"group": "extra"}]},  # forward refs are fine
+                {"id": "base", "include": ["a", {"group": "core"}]},
+                {"id": "core", "include": ["b", "c"]},
+                {"id": "extra", "include": [{"group": "core"}, "d", "a"]},
+            ]
+        )
+    )
+    assert reg._members("all") == ["a", "b", "c", "e", "b", "c", "d", "a"]
+    assert len(reg.get_group("all")) == 8
+    assert reg.find(group="all", tool_kind="builtin") == ["a", "b", "c", "e", "d"]
+    assert reg.get_group("all")[0] is reg.get("a")
+    memo = reg._members("all")
+    assert reg._members("all") is memo  # no re-traversal
+
+    reg.add_group({"id": "core", "include": ["b"]})  # invalidates memoized flattening
+    assert reg._members("all") == ["a", "b", "e", "b", "d", "a"]
+    assert reg.find(group="extra") == ["b", "d", "a"]
+
+
+def test_flat_group_duplicates_are_kept():
+    reg = DeclarativeToolRegistry(_spec([{"id": "twice", "include": ["a", "a"]}]))
+    assert [t.name for t in reg.get_group("twice")] == ["google_search", "google_search"]
+    assert reg.find(group="twice") == ["a"]
+
+
+def test_cycles_are_rejected():
+    with pytest.raises(ValueError, match="group cycle: y -> x -> y"):
+        DeclarativeToolRegistry(_spec([{"id": "x", "include": [{"group": "y"}]}, {"id": "y", "include": [{"group": "x"}]}]))
+    with pytest.raises(ValueError, match="group cycle: s -> s"):
+        DeclarativeToolRegistry(_spec([{"id": "s", "include": ["a", {"group": "s"}]}]))
+    reg = DeclarativeToolRegistry(_spec([{"id": "p", "include": [{"group": "q"}]}, {"id": "q", "include": ["a"]}]))
+    with pytest.raises(ValueError, match="cycle"):
+        reg.add_group({"id": "q", "include": [{"group": "p"}]})
+    assert [t.name for t in reg.get_group("p")] == ["google_search"]  # unchanged
+
+
+def test_unknown_members_surface_in_get_group_and_validate_all():
+    reg = DeclarativeToolRegistry(_spec([{"id": "g", "include": [{"group": "ghost"}]}, {"id": "h", "include": ["zz"]}]), lazy=True)
+    with pytest.raises(KeyError):
+        reg.get_group("g")
+    assert reg.find(group="g") == []
+    with pytest.raises(ValueError) as exc:
+        reg.validate_all()
+    msg = str(exc.value)
+    assert "group g: Tool group id not found: ghost" in msg and "group h: unknown tool id(s): zz" in msg
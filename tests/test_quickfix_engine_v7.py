@@ -0,0 +1,39 @@
+from agent_compose_kit.quickfix import QuickFix, get_quick_fixes
+from agent_compose_kit.quickfix.engine import QuickFixEngine, QuickFixRule, default_engine
+
+RAW = {
+    "schema_version": "0.1.0",
+    "metadata": {"name": "demo"},
+    "agents": [
+        {"type": "llm", "name": "a", "instruction": "i", "model": "alias://fast", "tools": [{"kind": "openapi", "operationId": "getPett"}]},
+        {"type": "llm", "name": "b", "instruction": "i", "tools": [{"kind": "openapi", "operationId": "listPet"}]},
+        {"type": "workflow.sequential", "name": "seq", "sub_agents": ["a", "b", "bb"]},
+    ],
+}
+
+
+def test_enabled_rules_and_timings():
+    timings: dict = {}
+    fixes = default_engine.run(RAW, enabled=["sequential-output-key"], timings=timings)
+    assert [f.id for f in fixes] == ["add-output-key-0", "add-output-key-1"]
+    assert list(timings) == ["sequential-output-key"]
+    assert set(default_engine.rule_ids()) >= {"unknown-sub-agent", "declare-missing-aliases"}
+
+
+def test_operation_ids_checked_on_every_llm_and_alias_rule_still_runs():
+    fixes = get_quick_fixes(raw_cfg=RAW, indexes={"openapi_operationIds": ["getPet", "listPets"]})
+    ids = [f.id for f in fixes]
+    assert "fix-opid-0-0" in ids and "fix-opid-1-0" in ids
+    assert "add-alias-fast" in ids
+
+
+def test_custom_rule_plugs_in():
+    class NoDescription(QuickFixRule):
+        id = "no-description"
+
+        def visit(self, ctx, idx, agent, out):
+            if not agent.get("description"):
+                out.append(QuickFix(id=f"desc-{idx}", title="t", description="d"))
+
+    engine = QuickFixEngine([NoDescription()])
+    assert [f.id for f in engine.run(RAW)] == ["desc-0", "desc-1", "desc-2"]
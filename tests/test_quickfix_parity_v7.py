@@ -0,0 +1,72 @@
+import random
+
+import pytest
+from quickfix_baseline import baseline_get_quick_fixes
+
+from agent_compose_kit.quickfix import get_quick_fixes
+
+NAMES = ["planner", "writer", "critic", "search", "summarizer", "router"]
+OPS = ["getPet", "listPets", "createPet", "deletePet"]
+
+
+def _agent(rng, i):
+    kind = rng.choice(["llm", "llm", "llm", "workflow.sequential", "workflow.parallel", "workflow.loop", "custom"])
+    name = NAMES[i % len(NAMES)] + ("" if i < len(NAMES) else str(i))
+    a = {"type": kind, "name": name}
+    if kind == "llm":
+        a["instruction"] = "i"
+        a["model"] = rng.choice([None, "gemini-2.0-flash", "alias://fast", "alias://chat", ""])
+        if a["model"] is None:
+            del a["model"]
+        if rng.random() < 0.3:
+            a["output_key"] = f"{name}_out"
+        if rng.random() < 0.2:
+            a["generate_content_config"] = {"thinking_config": {"budget": 10}}
+        if rng.random() < 0.2:
+            a["planner"] = {"type": "plan_react"}
+            a["output_schema"] = "pkg:Schema"
+        a["tools"] = [
+            {"kind": "openapi", "operationId": rng.choice(OPS + ["getPett", "listPet", "zzz"])}
+            for _ in range(rng.randrange(3))
+        ]
+    elif kind.startswith("workflow"):
+        pool = NAMES + ["plannr", "writr", "nobody", "critc"]
+        a["sub_agents"] = rng.sample(pool, rng.randrange(4))
+    return a
+
+
+def _config(seed):
+    rng = random.Random(seed)
+    agents = [_agent(rng, i) for i in range(rng.randrange(1, 9))]
+    if rng.random() < 0.1:
+        agents.append("not-a-dict")
+    raw = {"schema_version": "0.1.0", "metadata": {"name": "p"}, "agents": agents}
+    if rng.random() < 0.5:
+        raw["defaults"] = {"model_alias": rng.choice(["chat", "fast"])}
+    if rng.random() < 0.5:
+        raw["model_aliases"] = {"aliases": [{"id": "chat", "resolver": "direct", "model": "m"}]}
+    return raw
+
+
+@pytest.mark.parametrize("chunk", range(4))
+def test_engine_matches_nine_pass_baseline(chunk):
+    for seed in range(chunk * 250, (chunk + 1) * 250):
+        raw = _config(seed)
+        assert get_quick_fixes(raw_cfg=raw) == baseline_get_quick_fixes(raw_cfg=raw), seed
+
+
+def test_indexes_differ_only_by_documented_early_return_fix():
+    # 0.5.0 returned from inside the agent loop after the first LLM agent when
+    # ``indexes`` was given: later agents' operationIds and the alias rule were skipped.
+    indexes = {"openapi_operationIds": OPS}
+    for seed in range(500):
+        raw = _config(seed)
+        old = baseline_get_quick_fixes(raw_cfg=raw, indexes=indexes)
+        new = get_quick_fixes(raw_cfg=raw, indexes=indexes)
+        llm = [i for i, a in enumerate(raw["agents"]) if isinstance(a, dict) and a.get("type") == "llm"]
+        if not llm:
+            assert new == old, seed
+            continue
+        skipped = {f"fix-opid-{i}-" for i in llm[1:]}
+        kept = [f for f in new if not f.id.startswith("add-alias-") and not any(f.id.startswith(p) for p in skipped)]
+        assert kept == old, seed
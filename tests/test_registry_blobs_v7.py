@@ -0,0 +1,64 @@
+import json
+import os
+import time
+
+from agent_compose_kit.config.models import load_config
+from agent_compose_kit.quickfix.fixes import fingerprint
+from agent_compose_kit.registry import blobs
+from agent_compose_kit.registry.blobs import BLOBS_DIR, blob_id, gc_blobs, migrate_to_blobs
+from agent_compose_kit.registry.fs import load_system, promote, save_system
+from agent_compose_kit.registry.index import fsck_index
+
+
+def _cfg(label):
+    return load_config({"schema_version": "0.1.0", "metadata": {"name": label}, "agents": []})
+
+
+def _blob_files(root):
+    return sorted(p.stem for p in (root / BLOBS_DIR).glob("*/*.yaml"))
+
+
+def test_identical_configs_share_one_blob(tmp_path):
+    p1 = save_system(_cfg("same"), name="demo", version="1.0.0", root=tmp_path)
+    p2 = save_system(_cfg("same"), name="demo", version="1.0.1", root=tmp_path)
+    save_system(_cfg("other"), name="demo", version="2.0.0", root=tmp_path)
+    assert p1 == p2 and p1.stem == fingerprint(_cfg("same").model_dump(mode="json"))
+    assert len(_blob_files(tmp_path)) == 2
+    assert not (tmp_path / "demo" / "1.0.0" / "config.yaml").exists()
+    manifest = json.loads((tmp_path / "demo" / "1.0.1" / "manifest.json").read_text())
+    assert manifest == {"name": "demo", "version": "1.0.1", "blob": p1.stem}
+    promote("demo", "1.0.1", "prod", root=tmp_path)
+    assert load_system("demo", "prod", root=tmp_path).metadata.name == "same"
+    assert load_system("demo", "2.0.0", root=tmp_path).metadata.name == "other"
+    assert not any(fsck_index(tmp_path).values())
+
+
+def test_gc_removes_only_unreferenced_blobs_after_grace(tmp_path):
+    save_system(_cfg("a"), name="demo", version="1.0.0", root=tmp_path)
+    save_system(_cfg("b"), name="demo", version="1.0.0", root=tmp_path)  # a is now orphaned
+    orphan = blob_id(_cfg("a"))
+    assert gc_blobs(tmp_path) == []  # still inside the grace period
+    path = blobs.blob_path(tmp_path, orphan)
+    old = time.time() - 7200
+    os.utime(path, (old, old))
+    assert gc_blobs(tmp_path, dry_run=True) == [orphan] and path.exists()
+    assert gc_blobs(tmp_path) == [orphan]
+    assert _blob_files(tmp_path) == [blob_id(_cfg("b"))]
+    assert load_system("demo", "1.0.0", root=tmp_path).metadata.name == "b"
+
+
+def test_migrate_legacy_versions(tmp_path):
+    import yaml
+
+    for v in ("1.0.0", "1.1.0"):
+        d = tmp_path / "demo" / v
+        d.mkdir(parents=True)
+        (d / "config.yaml").write_text(yaml.safe_dump(_cfg("same").model_dump(), sort_keys=False))
+        (d / "manifest.json").write_text(json.dumps({"name": "demo", "version": v}))
+    assert load_system("demo", "1.0.0", root=tmp_path).metadata.name == "same"  # legacy layout loads
+    assert migrate_to_blobs(tmp_path) == 2
+    assert blobs._main(["migrate", str(tmp_path)]) == 0  # idempotent
+    assert len(_blob_files(tmp_path)) == 1
+    assert not (tmp_path / "demo" / "1.0.0" / "config.yaml").exists()
+    assert load_system("demo", "1.1.0", root=tmp_path).metadata.name == "same"
+    assert not any(fsck_index(tmp_path).values())
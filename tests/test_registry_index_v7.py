@@ -0,0 +1,82 @@
+import hashlib
+import shutil
+
+from agent_compose_kit.config.models import load_config
+from agent_compose_kit.registry import index as registry_index
+from agent_compose_kit.registry.blobs import blob_path
+from agent_compose_kit.registry.fs import (
+    list_systems,
+    list_tags,
+    list_versions,
+    promote,
+    save_system,
+)
+from agent_compose_kit.registry.index import (
+    INDEX_FILE,
+    compact_index,
+    fsck_index,
+    read_index,
+    rebuild_index,
+)
+
+
+def _cfg(label):
+    return load_config({"schema_version": "0.1.0", "metadata": {"name": label}, "agents": []})
+
+
+def test_listings_come_from_the_index(tmp_path, monkeypatch):
+    save_system(_cfg("a"), name="alpha", version="1.0.0", root=tmp_path)
+    save_system(_cfg("b"), name="alpha", version="10.0.0", root=tmp_path)
+    save_system(_cfg("c"), name="beta", version="0.1.0", root=tmp_path)
+    promote("alpha", "10.0.0", "prod", root=tmp_path)
+    assert (tmp_path / INDEX_FILE).exists()
+
+    # listings must not touch the tree once indexed
+    monkeypatch.setattr(type(tmp_path), "iterdir", lambda self: (_ for _ in ()).throw(AssertionError("scan")))
+    assert list_systems(root=tmp_path) == ["alpha", "beta"]
+    assert list_versions("alpha", root=tmp_path) == ["1.0.0", "10.0.0", "prod"]
+    assert list_tags("alpha", root=tmp_path) == {"prod": "10.0.0"}
+    monkeypatch.undo()
+
+    state = read_index(tmp_path)
+    entry = state["alpha"]["versions"]["1.0.0"]
+    assert entry["manifest"] == {"name": "alpha", "version": "1.0.0", "blob": entry["blob"]}
+    assert entry["sha256"] == hashlib.sha256(blob_path(tmp_path, entry["blob"]).read_bytes()).hexdigest()
+    assert fsck_index(tmp_path) == {"missing_from_index": [], "missing_on_disk": [], "hash_mismatch": [], "tag_mismatch": []}
+
+    lines_before = (tmp_path / INDEX_FILE).read_text().count("\n")
+    compact_index(tmp_path)
+    assert (tmp_path / INDEX_FILE).read_text().count("\n") == 1 < lines_before
+    assert read_index(tmp_path) == state
+
+
+def test_existing_registry_is_indexed_on_first_write_and_fsck_finds_drift(tmp_path):
+    save_system(_cfg("a"), name="alpha", version="1.0.0", root=tmp_path)
+    (tmp_path / INDEX_FILE).unlink()  # registry created before indexing existed
+    shutil.copytree(tmp_path / "alpha" / "1.0.0", tmp_path / "alpha" / "2.0.0")
+    assert read_index(tmp_path) is None
+    assert list_versions("alpha", root=tmp_path) == ["1.0.0", "2.0.0"]  # scan fallback
+
+    save_system(_cfg("g"), name="gamma", version="1.0.0", root=tmp_path)
+    assert list_versions("alpha", root=tmp_path) == ["1.0.0", "2.0.0"]
+    assert list_systems(root=tmp_path) == ["alpha", "gamma"]
+
+    shutil.rmtree(tmp_path / "alpha" / "2.0.0")
+    (tmp_path / "gamma" / "1.0.0" / "config.yaml").write_text("schema_version: '0.1.0'\n")
+    shutil.copytree(tmp_path / "alpha" / "1.0.0", tmp_path / "alpha" / "3.0.0")
+    report = fsck_index(tmp_path)
+    assert report["missing_on_disk"] == ["alpha@2.0.0"]
+    assert report["missing_from_index"] == ["alpha@3.0.0"]
+    assert report["hash_mismatch"] == ["gamma@1.0.0"]
+
+    rebuild_index(tmp_path)
+    assert not any(fsck_index(tmp_path).values())
+    assert list_versions("alpha", root=tmp_path) == ["1.0.0", "3.0.0"]
+
+
+def test_cli_fsck_exit_code(tmp_path, capsys):
+    save_system(_cfg("a"), name="alpha", version="1.0.0", root=tmp_path)
+    assert registry_index._main(["fsck", str(tmp_path)]) == 0
+    shutil.rmtree(tmp_path / "alpha" / "1.0.0")
+    assert registry_index._main(["fsck", str(tmp_path)]) == 1
+    assert "missing_on_disk: alpha@1.0.0" in capsys.readouterr().out
@@ -0,0 +1,107 @@
+import textwrap
+
+import pytest
+
+from agent_compose_kit.registries.agents import DeclarativeAgentRegistry
+from agent_compose_kit.registries.loader import load_registry_dir
+
+
+def _write(root, name, text):
+    p = root / name
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_text(textwrap.dedent(text))
+    return p
+
+
+def _catalog(tmp_path, n=6):
+    for s in range(n):
+        _write(
+            tmp_path,
+            f"team{s % 2}/shard{s}.yaml",
+            f"""
+            agents:
+              - {{ id: a{s}, type: llm, name: a{s}, instruction: x, model: "alias://fast-chat" }}
+              - id: b{s}
+                type: llm
+                name: b{s}
+                instruction: y
+            groups:
+              - {{ id: g{s}, include: [a{s}, b{s}] }}
+            """,
+        )
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_loads_and_merges_shards(tmp_path, workers):
+    _catalog(tmp_path)
+    reg = load_registry_dir(tmp_path, "agents", max_workers=workers)
+    assert reg.list_ids() == sorted(f"{c}{s}" for c in "ab" for s in range(6))
+    assert reg.get("b3").instruction == "y" and len(reg._by_id) == 12  # validated in the workers
+    assert [a.name for a in reg.get_group("g4")] == ["a4", "b4"]
+    assert reg.find(model="alias://fast-chat") == [f"a{s}" for s in (0, 2, 4, 1, 3, 5)]  # path order
+
+    lazy = load_registry_dir(tmp_path, "agents", lazy=True, max_workers=workers)
+    assert lazy._by_id == {} and lazy.get("a1").name == "a1"
+
+
+def test_reports_duplicates_with_locations_and_invalid_entries(tmp_path):
+    _catalog(tmp_path, n=2)
+    _write(tmp_path, "zz/dupe.yml", """
+        # copied by mistake
+        agents:
+          - id: c
+            type: llm
+            name: c
+            instruction: z
+          - id: a1
+            type: nope
+        groups:
+          - { id: g0, include: [c] }
+        """)
+    with pytest.raises(ValueError) as exc:
+        load_registry_dir(tmp_path, "agents", max_workers=1)
+    msg = str(exc.value)
+    assert "3 problem(s)" in msg
+    assert "zz/dupe.yml: a1: Unknown agent type: nope" in msg
+    assert f"duplicate agent id 'a1': {tmp_path}/team1/shard1.yaml:3, {tmp_path}/zz/dupe.yml:8" in msg
+    assert f"duplicate group id 'g0': {tmp_path}/team0/shard0.yaml:9, {tmp_path}/zz/dupe.yml:11" in msg
+
+
+def test_tools_section_and_bad_shards(tmp_path):
+    _write(tmp_path, "t.yaml", "tools:\n  - { id: s, kind: builtin, name: google_search }\n")
+    assert load_registry_dir(tmp_path, "tools").get("s").kind == "builtin"
+    _write(tmp_path, "broken.yaml", "tools: [\n")
+    with pytest.raises(ValueError, match="broken.yaml"):
+        load_registry_dir(tmp_path, "tools")
+    with pytest.raises(ValueError, match="section"):
+        load_registry_dir(tmp_path, "widgets")
+
+
+def test_duplicate_locations_are_scoped_to_their_section(tmp_path):
+    _write(tmp_path, "s.yaml", """
+        agents:
+          - { id: shared, type: llm, name: s, instruction: x }
+          - { id: twice, type: llm, name: t, instruction: x }
+          - { id: twice, type: llm, name: t, instruction: y }
+        groups:
+          - { id: twice, include: [shared] }
+          - { id: shared, include: [shared] }
+          - { id: shared, include: [twice] }
+        """)
+    with pytest.raises(ValueError) as exc:
+        load_registry_dir(tmp_path, "agents", max_workers=1)
+    msg = str(exc.value)
+    assert f"duplicate agent id 'twice': {tmp_path}/s.yaml:4, {tmp_path}/s.yaml:5" in msg
+    assert f"duplicate group id 'shared': {tmp_path}/s.yaml:8, {tmp_path}/s.yaml:9" in msg
+    assert "2 problem(s)" in msg
+
+
+def test_registry_adopts_prevalidated_models():
+    spec = {"agents": [{"id": "a", "type": "llm", "name": "a", "instruction": "x"}, {"id": "b", "type": "nope"}]}
+    model = object()
+    with pytest.raises(ValueError):
+        DeclarativeAgentRegistry(spec)
+    reg = DeclarativeAgentRegistry(spec, parsed={"b": model})
+    assert reg._by_id["b"] is model and reg.get("a").name == "a"
+    lazy = DeclarativeAgentRegistry(spec, lazy=True, parsed={"b": model})
+    assert list(lazy._by_id) == ["b"]
@@ -0,0 +1,56 @@
+import pytest
+
+from agent_compose_kit.registries.agents import DeclarativeAgentRegistry
+from agent_compose_kit.registries.tools import DeclarativeToolRegistry
+
+MCP = {"kind": "mcp", "server": {"ref": {"value": "registry://mcp/files@1.2.0"}}, "tool": "read"}
+
+
+def _agents(lazy=False):
+    return DeclarativeAgentRegistry(
+        {
+            "agents": [
+                {"id": "p", "type": "llm", "name": "p", "instruction": "x", "model": {"value": "alias://fast-chat"}, "tools": [MCP], "labels": {"team": "search"}},
+                {"id": "w", "type": "llm", "name": "w", "instruction": "x", "model": "gpt-4o", "output_key": "draft"},
+                {"id": "s", "type": "workflow.sequential", "name": "s", "sub_agents": ["p", {"value": "registry://agent/critic@^1"}]},
+            ],
+            "groups": [{"id": "core", "include": ["w", "p"]}],
+        },
+        lazy=lazy,
+    )
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_find_by_facets(lazy):
+    reg = _agents(lazy)
+    assert reg.find(model="alias://fast-chat") == ["p"]
+    assert reg.find(tool_kind="mcp") == ["p"]
+    assert reg.find(ref="registry://mcp/files") == ["p"] == reg.find(ref="registry://mcp/files@1.2.0")
+    assert reg.find(ref="registry://agent/critic") == ["s"]
+    assert reg.find(output_key="draft") == ["w"]
+    assert reg.find(group="core") == ["w", "p"]
+    assert reg.find(label="team") == ["p"] == reg.find(label="team=search")
+    assert reg.find(group="core", model="gpt-4o") == ["w"]
+    assert reg.find(model="nope") == [] and reg.find() == ["p", "w", "s"]
+    assert reg.labels("p") == {"team": "search"} and reg.get("p").model.value == "alias://fast-chat"
+    with pytest.raises(ValueError, match="unknown facet"):
+        reg.find(colour="red")
+
+
+def test_index_follows_add_and_add_group():
+    reg = _agents()
+    assert reg.find(model="gpt-4o") == ["w"]
+    reg.add({"id": "w", "type": "llm", "name": "w", "instruction": "x", "model": "alias://fast-chat"})
+    reg.add({"id": "n", "type": "llm", "name": "n", "instruction": "x", "model": "gpt-4o", "labels": {"team": "ads"}})
+    reg.add_group({"id": "core", "include": ["n"]})
+    assert reg.find(model="gpt-4o") == ["n"]
+    assert reg.find(model="alias://fast-chat") == ["p", "w"]
+    assert reg.find(output_key="draft") == []
+    assert reg.find(group="core") == ["n"] and reg.find(label="team=ads") == ["n"]
+    assert reg.get("w").model == "alias://fast-chat"
+    with pytest.raises(ValueError):
+        reg.add({"id": "bad", "type": "?"})
+    assert "bad" not in reg.list_ids()
+
+    tools = DeclarativeToolRegistry({"tools": [{"id": "files", **MCP}]})
+    assert tools.find(tool_kind="mcp", ref="registry://mcp/files") == ["files"]
@@ -0,0 +1,129 @@
+import shutil
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from agent_compose_kit.config.models import load_config
+from agent_compose_kit.registry import fs
+from agent_compose_kit.registry import sqlite as sq
+from agent_compose_kit.registry.sqlite import SqliteRegistry
+
+
+def _cfg(label):
+    return load_config({"schema_version": "0.1.0", "metadata": {"name": label}, "agents": []})
+
+
+@pytest.mark.parametrize("store_json", [False, True])
+def test_sqlite_registry_matches_fs_api(tmp_path, store_json):
+    reg = SqliteRegistry(tmp_path / "reg.db", store_json=store_json)
+    for v in ("10.0.0", "2.0.0", "1.0.0"):
+        reg.save_system(_cfg(v), name="demo", version=v)
+    reg.save_system(_cfg("x"), name="other", version="0.1.0")
+    reg.promote("demo", "2.0.0", "prod")
+    reg.promote("demo", "prod", "canary")
+
+    assert reg.list_systems() == ["demo", "other"]
+    assert reg.list_versions("demo") == ["1.0.0", "2.0.0", "10.0.0", "canary", "prod"]
+    assert reg.list_tags("demo") == {"canary": "2.0.0", "prod": "2.0.0"}
+    assert reg.load_system("demo", "canary").metadata.name == "2.0.0"
+    assert reg.load_system("demo", "10.0.0").metadata.name == "10.0.0"
+    fmt = sqlite3.connect(reg.path).execute("SELECT DISTINCT format FROM versions").fetchall()
+    assert fmt == [("json" if store_json else "yaml",)]
+
+    with pytest.raises(FileNotFoundError):
+        reg.load_system("demo", "nope")
+    with pytest.raises(FileNotFoundError):
+        reg.promote("demo", "9.9.9", "prod")
+    with pytest.raises(ValueError):
+        reg.promote("demo", "1.0.0", "2.0.0")
+    with pytest.raises(ValueError):
+        reg.promote("demo", "1.0.0", ".hidden")
+    with pytest.raises(ValueError):
+        reg.save_system(_cfg("y"), name="demo", version="prod")
+
+
+def test_module_functions_and_concurrent_readers(tmp_path):
+    db = tmp_path / "reg.db"
+    for v in ("1.0.0", "2.0.0"):
+        sq.save_system(_cfg(v), name="demo", version=v, root=db)
+    sq.promote("demo", "1.0.0", "prod", root=db)
+    stop = threading.Event()
+    errors = []
+
+    def reader():
+        while not stop.is_set():
+            try:
+                assert sq.load_system("demo", "prod", root=db).metadata.name in ("1.0.0", "2.0.0")
+            except Exception as e:  # pragma: no cover - failure path
+                errors.append(e)
+
+    threads = [threading.Thread(target=reader) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for i in range(30):
+        sq.promote("demo", "2.0.0" if i % 2 else "1.0.0", "prod", root=db)
+    stop.set()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert sq.list_tags("demo", root=db) == {"prod": "2.0.0"}
+    assert sq.list_versions("demo", root=db) == ["1.0.0", "2.0.0", "prod"]
+    assert sq.list_systems(root=db) == ["demo"]
+
+
+def test_import_fs_copies_versions_and_tags(tmp_path):
+    root = tmp_path / "fsreg"
+    for v in ("1.0.0", "2.0.0"):
+        fs.save_system(_cfg(v), name="demo", version=v, root=root)
+    fs.promote("demo", "2.0.0", "prod", root=root)
+    shutil.copytree(root / "demo" / "1.0.0", root / "demo" / "old")  # legacy copied tag
+
+    reg = SqliteRegistry(tmp_path / "reg.db")
+    assert reg.import_fs(root) == 2
+    assert reg.list_tags("demo") == {"old": "1.0.0", "prod": "2.0.0"}
+    assert reg.load_system("demo", "prod").metadata.name == "2.0.0"
+    assert reg.load_system("demo", "old").metadata.name == "1.0.0"
+
+    as_json = SqliteRegistry(tmp_path / "json.db")
+    as_json.import_fs(root, store_json=True)
+    assert as_json.load_system("demo", "1.0.0") == reg.load_system("demo", "1.0.0")
+
+
+def test_import_fs_rejects_tags_shadowing_versions(tmp_path):
+    root = tmp_path / "fsreg"
+    fs.save_system(_cfg("a"), name="demo", version="1.0.0", root=root)
+    fs.promote("demo", "1.0.0", "prod", root=root)
+    reg = SqliteRegistry(tmp_path / "reg.db")
+    reg.save_system(_cfg("b"), name="demo", version="2.0.0")
+    reg.promote("demo", "2.0.0", "1.0.0-rc")
+
+    fs.save_system(_cfg("c"), name="demo", version="1.0.0-rc", root=root)
+    with pytest.raises(ValueError, match="shadow saved versions: demo@1.0.0-rc"):
+        reg.import_fs(root)
+    assert reg.list_versions("demo") == ["1.0.0-rc", "2.0.0"]  # rolled back
+    assert reg.list_tags("demo") == {"1.0.0-rc": "2.0.0"}
+
+
+def test_promote_checks_shadowing_under_the_write_lock(tmp_path):
+    reg = SqliteRegistry(tmp_path / "reg.db")
+    reg.save_system(_cfg("a"), name="demo", version="1.0.0")
+    other = sqlite3.connect(tmp_path / "reg.db", isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")  # a concurrent save_system(version="prod") in flight
+    other.execute("INSERT INTO versions VALUES ('demo', 'prod', 'yaml', x'', '', '{}', 0)")
+    errors = []
+
+    def promote():
+        try:
+            reg.promote("demo", "1.0.0", "prod")
+        except ValueError as e:
+            errors.append(e)
+
+    t = threading.Thread(target=promote)
+    t.start()
+    time.sleep(0.2)  # promote is now waiting for the write lock
+    other.execute("COMMIT")
+    t.join()
+    assert len(errors) == 1 and "shadow saved version" in str(errors[0])
+    assert reg.list_tags("demo") == {}
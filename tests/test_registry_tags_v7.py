@@ -0,0 +1,96 @@
+import json
+import shutil
+import threading
+
+import pytest
+
+from agent_compose_kit.config.models import load_config
+from agent_compose_kit.registry.fs import (
+    list_tags,
+    list_versions,
+    load_system,
+    promote,
+    resolve_version,
+    save_system,
+)
+
+
+def _cfg(label):
+    return load_config({"schema_version": "0.1.0", "metadata": {"name": label}, "agents": []})
+
+
+def test_promote_writes_pointer_and_load_resolves_tags(tmp_path):
+    save_system(_cfg("one"), name="demo", version="1.0.0", root=tmp_path)
+    save_system(_cfg("two"), name="demo", version="2.0.0", root=tmp_path)
+    ptr = promote("demo", "1.0.0", "prod", root=tmp_path)
+    assert json.loads(ptr.read_text()) == {"version": "1.0.0"}
+    assert not (tmp_path / "demo" / "prod").exists()  # no copy
+    assert load_system("demo", "prod", root=tmp_path).metadata.name == "one"
+
+    promote("demo", "2.0.0", "prod", root=tmp_path)
+    promote("demo", "prod", "canary", root=tmp_path)  # tag of a tag pins the version
+    assert list_tags("demo", root=tmp_path) == {"canary": "2.0.0", "prod": "2.0.0"}
+    assert list_versions("demo", root=tmp_path) == ["1.0.0", "2.0.0", "canary", "prod"]
+    assert resolve_version("demo", "prod", root=tmp_path) == "2.0.0"
+    assert load_system("demo", "prod", root=tmp_path).metadata.name == "two"
+
+    with pytest.raises(FileNotFoundError):
+        promote("demo", "9.9.9", "prod", root=tmp_path)
+    with pytest.raises(ValueError):
+        promote("demo", "1.0.0", "2.0.0", root=tmp_path)
+    with pytest.raises(FileNotFoundError):
+        load_system("demo", "nope", root=tmp_path)
+
+
+@pytest.mark.parametrize("content", ['{"vers', "{}", '{"version": 3}', "[]"])
+def test_corrupt_tag_pointer_raises_value_error_naming_the_file(tmp_path, content):
+    from agent_compose_kit.registry.index import INDEX_FILE, rebuild_index
+
+    save_system(_cfg("one"), name="demo", version="1.0.0", root=tmp_path)
+    ptr = promote("demo", "1.0.0", "prod", root=tmp_path)
+    ptr.write_text(content)
+    (tmp_path / INDEX_FILE).unlink()
+    for call in (
+        lambda: load_system("demo", "prod", root=tmp_path),
+        lambda: resolve_version("demo", "prod", root=tmp_path),
+        lambda: list_tags("demo", root=tmp_path),
+    ):
+        with pytest.raises(ValueError, match="prod.json"):
+            call()
+    assert rebuild_index(tmp_path)["demo"]["tags"] == {}  # skipped, not fatal
+
+
+def test_legacy_tag_directory_is_replaced(tmp_path):
+    save_system(_cfg("one"), name="demo", version="1.0.0", root=tmp_path)
+    save_system(_cfg("two"), name="demo", version="2.0.0", root=tmp_path)
+    shutil.copytree(tmp_path / "demo" / "1.0.0", tmp_path / "demo" / "prod")  # old-style tag
+    assert load_system("demo", "prod", root=tmp_path).metadata.name == "one"
+    promote("demo", "2.0.0", "prod", root=tmp_path)
+    assert not (tmp_path / "demo" / "prod").exists()
+    assert load_system("demo", "prod", root=tmp_path).metadata.name == "two"
+    assert sorted(p.name for p in (tmp_path / "demo").iterdir()) == [".tags", "1.0.0", "2.0.0"]
+
+
+def test_readers_never_miss_the_tag_during_promotion(tmp_path):
+    for v in ("1.0.0", "2.0.0"):
+        save_system(_cfg(v), name="demo", version=v, root=tmp_path)
+    promote("demo", "1.0.0", "prod", root=tmp_path)
+    stop = threading.Event()
+    errors = []
+
+    def reader():
+        while not stop.is_set():
+            try:
+                assert load_system("demo", "prod", root=tmp_path).metadata.name in ("1.0.0", "2.0.0")
+            except Exception as e:  # pragma: no cover - failure path
+                errors.append(e)
+
+    threads = [threading.Thread(target=reader) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for i in range(200):
+        promote("demo", "2.0.0" if i % 2 else "1.0.0", "prod", root=tmp_path)
+    stop.set()
+    for t in threads:
+        t.join()
+    assert errors == []
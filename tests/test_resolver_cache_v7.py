@@ -0,0 +1,144 @@
+import asyncio
+import json
+import os
+
+import pytest
+
+from agent_compose_kit.lock import ResolverCache, plan_lock, plan_lock_async, plan_lock_threaded
+
+RAW = {
+    "schema_version": "0.1.0",
+    "metadata": {"name": "demo"},
+    "defaults": {"model_alias": "chat"},
+    "agents": [
+        {
+            "type": "llm",
+            "name": "a",
+            "instruction": "i",
+            "tools": [
+                {"kind": "mcp", "server": {"ref": {"value": "registry://mcp/files@^1"}}, "tool": "t"},
+                {"kind": "openapi", "spec": {"ref": {"value": "registry://openapi/pets@1"}}, "operationId": "x"},
+            ],
+        }
+    ],
+}
+
+
+class Backend:
+    def __init__(self):
+        self.calls = []
+        self.version = "1.0.0"
+
+    def registry(self, kind, key, rng, etag=None):
+        self.calls.append((key, etag))
+        tag = f"{key}-{self.version}"
+        if etag == tag:
+            return {"not_modified": True}
+        return {"version": self.version, "etag": tag}
+
+    def alias(self, alias):
+        self.calls.append((alias, None))
+        return {"provider": "p", "model": "m"}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_second_run_hits_cache_and_survives_reload(tmp_path):
+    path = tmp_path / "resolvers.json"
+    be = Backend()
+    first = plan_lock(RAW, be.registry, be.alias, cache=ResolverCache(path))
+    assert len(be.calls) == 3
+    assert json.loads(path.read_text())["version"] == 1
+
+    cache = ResolverCache(path)
+    assert plan_lock_threaded(RAW, be.registry, be.alias, cache=cache) == first
+    assert len(be.calls) == 3
+    assert cache.stats().hits == 3 and cache.stats().misses == 0
+
+
+def test_expired_entries_revalidate_with_etag(tmp_path):
+    clock = Clock()
+    be = Backend()
+    cache = ResolverCache(tmp_path / "c.json", ttl=60, clock=clock)
+    plan_lock(RAW, be.registry, be.alias, cache=cache)
+    be.calls.clear()
+
+    clock.now += 61
+    plan = plan_lock(RAW, be.registry, be.alias, cache=cache)
+    assert sorted(be.calls) == [("chat", None), ("files", "files-1.0.0"), ("pets", "pets-1.0.0")]
+    assert cache.stats().not_modified == 2
+    assert {p.pinned for p in plan.registryPins} == {"1.0.0"}
+
+    clock.now += 61
+    be.version = "1.1.0"
+    plan = plan_lock(RAW, be.registry, be.alias, cache=cache)
+    assert {p.pinned for p in plan.registryPins} == {"1.1.0"}
+    assert {p.etag for p in plan.registryPins} == {"files-1.1.0", "pets-1.1.0"}
+
+
+def test_offline_mode_never_calls_resolvers(tmp_path):
+    path = tmp_path / "c.json"
+    be = Backend()
+    plan_lock({**RAW, "defaults": {}}, be.registry, be.alias, cache=ResolverCache(path))
+    be.calls.clear()
+
+    offline = ResolverCache(path, ttl=0, offline=True)
+    plan = plan_lock(RAW, be.registry, be.alias, cache=offline)
+    assert be.calls == []
+    assert all(p.pinned == "1.0.0" and p.error is None for p in plan.registryPins)
+    # "chat" was never cached: the alias pin is empty, as for any resolver failure
+    assert plan.aliasPins[0].model is None
+
+
+def test_async_planner_uses_cache_with_async_and_sync_resolvers(tmp_path):
+    path = tmp_path / "resolvers.json"
+    be, clock = Backend(), Clock()
+
+    async def aregistry(kind, key, rng, etag=None):
+        return be.registry(kind, key, rng, etag=etag)
+
+    first = asyncio.run(plan_lock_async(RAW, aregistry, be.alias, cache=ResolverCache(path, clock=clock)))
+    assert first == plan_lock(RAW, Backend().registry, Backend().alias)
+    assert len(be.calls) == 3
+    cache = ResolverCache(path, clock=clock)
+    assert asyncio.run(plan_lock_async(RAW, aregistry, be.alias, cache=cache)) == first
+    assert len(be.calls) == 3 and cache.stats().hits == 3
+    clock.now += 7200  # expired: registry entries revalidate by etag
+    cache = ResolverCache(path, clock=clock)
+    asyncio.run(plan_lock_async(RAW, aregistry, be.alias, cache=cache))
+    assert cache.stats().not_modified == 2
+
+
+@pytest.mark.parametrize("content", ["", '{"version": 1, "entr', "[1, 2]", '{"version": 1, "entries": {"k": 3}}', "\xff\xfe"])
+def test_corrupt_cache_file_is_treated_as_empty(tmp_path, content):
+    path = tmp_path / "resolvers.json"
+    path.write_text(content, encoding="latin-1")
+    be = Backend()
+    cache = ResolverCache(path)
+    assert cache.stats().entries == 0
+    plan_lock(RAW, be.registry, be.alias, cache=cache)
+    assert len(be.calls) == 3
+    assert ResolverCache(path).stats().entries == 3
+
+
+def test_failed_save_is_retried(tmp_path, monkeypatch):
+    path = tmp_path / "resolvers.json"
+    cache = ResolverCache(path)
+    real_replace = os.replace
+
+    def full_disk(src, dst):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(os, "replace", full_disk)
+    with pytest.raises(OSError):
+        plan_lock(RAW, Backend().registry, Backend().alias, cache=cache)
+    assert not path.exists() and list(tmp_path.iterdir()) == []
+    monkeypatch.setattr(os, "replace", real_replace)
+    cache.save()
+    assert len(json.loads(path.read_text())["entries"]) == 3
@@ -0,0 +1,97 @@
+import pytest
+
+from agent_compose_kit.config.models import load_config
+from agent_compose_kit.lock import ResolverCache, plan_lock
+from agent_compose_kit.registry.fs import list_versions, promote, save_system
+from agent_compose_kit.registry.resolver import FsRegistryResolver
+from agent_compose_kit.registry.semver import max_satisfying, parse_version, version_sort_key
+
+VERSIONS = ["0.1.0", "0.2.0", "0.2.5", "0.3.0-rc.1", "0.3.0", "1.2.0", "1.10.0", "2.0.0-beta.2", "2.0.0-beta.10", "10.0.0"]
+
+
+@pytest.mark.parametrize(
+    "spec,expected",
+    [
+        ("latest", "10.0.0"),
+        (">=0.2", "10.0.0"),
+        ("^0.2", "0.2.5"),
+        ("~1.2", "1.2.0"),
+        ("1", "1.10.0"),
+        ("1.x", "1.10.0"),
+        ("<1", "0.3.0"),
+        ("<=0.2", "0.2.5"),
+        ("0.2.0 - 1.2", "1.2.0"),
+        (">=0.2, <0.3", "0.2.5"),
+        ("^1 || ^10", "10.0.0"),
+        ("=1.2.0", "1.2.0"),
+        (">=2.0.0-beta.1 <3", "2.0.0-beta.10"),
+        ("^0.3.0-rc.0", "0.3.0"),
+        ("<0.3.0", "0.2.5"),
+        ("^3", None),
+    ],
+)
+def test_ranges(spec, expected):
+    assert max_satisfying(VERSIONS, spec) == expected
+
+
+def test_ordering_and_prereleases():
+    assert sorted(["10.0.0", "2.0.0", "prod", "2.0.0-rc.1", "1.0.0-alpha", "1.0.0-alpha.1", "1.0.0-1"], key=version_sort_key) == [
+        "1.0.0-1",
+        "1.0.0-alpha",
+        "1.0.0-alpha.1",
+        "2.0.0-rc.1",
+        "2.0.0",
+        "10.0.0",
+        "prod",
+    ]
+    assert parse_version("v1.2.3+build.5") == parse_version("1.2.3")
+    assert parse_version("1.2") is None
+    assert max_satisfying(["1.0.0", "1.1.0-rc.1"], ">=1") == "1.0.0"
+    assert max_satisfying(["1.0.0", "1.1.0-rc.1"], ">=1", include_prerelease=True) == "1.1.0-rc.1"
+    with pytest.raises(ValueError):
+        max_satisfying(VERSIONS, ">=banana")
+
+
+def _cfg(label):
+    return load_config({"schema_version": "0.1.0", "metadata": {"name": label}, "agents": []})
+
+
+def test_fs_resolver_pins_ranges_for_plan_lock(tmp_path):
+    for v in ["0.2.0", "0.10.0", "1.0.0-rc.1"]:
+        save_system(_cfg(v), name="planner", version=v, root=tmp_path)
+    promote("planner", "0.2.0", "stable", root=tmp_path)
+    assert list_versions("planner", root=tmp_path) == ["0.2.0", "0.10.0", "1.0.0-rc.1", "stable"]
+
+    resolver = FsRegistryResolver(tmp_path)
+    raw = {
+        "schema_version": "0.1.0",
+        "metadata": {"name": "app"},
+        "agents": [
+            {
+                "type": "llm",
+                "name": "a",
+                "instruction": "i",
+                "sub_agents": [
+                    {"value": "registry://agent/planner@>=0.2"},
+                    {"value": "registry://agent/planner@stable"},
+                    {"value": "registry://agent/planner@^2"},
+                    {"value": "registry://agent/ghost@1"},
+                ],
+            }
+        ],
+    }
+    pins = {p.range: p for p in plan_lock(raw, resolver, lambda a: {}).registryPins}
+    assert pins[">=0.2"].pinned == "0.10.0"
+    assert pins[">=0.2"].uri.endswith(".yaml") and "/.blobs/" in pins[">=0.2"].uri
+    assert pins["stable"].pinned == "0.2.0"  # tags pin the version they point to
+    assert pins["^2"].error == "no version of agent/planner matches '^2'"
+    assert pins["1"].error == "unknown registry system: agent/ghost"
+    assert pins[">=0.2"].etag != pins["stable"].etag  # same bytes as 0.2.0, different version
+
+    # index refreshes when a version is added; etag revalidation via ResolverCache
+    cache = ResolverCache(tmp_path / "cache.json", ttl=0)
+    plan_lock(raw, resolver, lambda a: {}, cache=cache)
+    plan_lock(raw, resolver, lambda a: {}, cache=cache)
+    assert cache.stats().not_modified == 2
+    save_system(_cfg("0.11.0"), name="planner", version="0.11.0", root=tmp_path)
+    assert resolver(*("agent", "planner", ">=0.2"))["version"] == "0.11.0"
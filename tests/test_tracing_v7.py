@@ -0,0 +1,146 @@
+import asyncio
+from contextlib import contextmanager
+
+import pytest
+
+from agent_compose_kit import compose, tracing
+from agent_compose_kit.tracing import CallbackSink, OpenTelemetrySink, StatsSink, use_sink
+
+
+def _raw():
+    return {
+        "schema_version": "0.1.0",
+        "metadata": {"name": "t"},
+        "defaults": {"model_alias": "chat"},
+        "agents": [
+            {"type": "llm", "name": "a", "instruction": "i", "tools": [{"kind": "mcp", "server": {"ref": {"value": "registry://mcp/s@^1"}}, "tool": "x"}]},
+            {"type": "llm", "name": "b", "instruction": "i", "model": "alias://chat"},
+            {"type": "workflow.sequential", "name": "seq", "sub_agents": ["a", "b"]},
+        ],
+    }
+
+
+def test_disabled_by_default_and_noop_span():
+    assert tracing.get_sink() is None and not tracing.enabled()
+    assert tracing.span("x", k=1) is tracing.span("y")
+    tracing.count("c")  # no sink: ignored
+    assert compose.load_config.__wrapped__.__name__ == "load_config"
+
+
+def test_callback_sink_nests_spans_and_restores(tmp_path):
+    import yaml
+
+    path = tmp_path / "system.yaml"
+    path.write_text(yaml.safe_dump(_raw()))
+    spans, counts = [], []
+    with use_sink(CallbackSink(spans.append, lambda n, v, a: counts.append((n, v, a)))):
+        compose.load_config_file(path)
+        compose.get_quick_fixes(raw_cfg=_raw())
+        compose.lint(_raw())
+        with tracing.span("custom", user="x") as s:
+            s.set_attribute("size", 3)
+    assert tracing.get_sink() is None
+    by_name = {r.name: r for r in spans}
+    assert by_name["compose.load_config"].parent == "compose.load_config_bytes"
+    assert by_name["compose.load_config_bytes"].parent == "compose.load_config_file"
+    assert by_name["compose.load_config_file"].parent is None
+    assert by_name["compose.lint"].parent is None and by_name["compose.analyze"].parent == "compose.lint"
+    assert by_name["custom"].attrs == {"user": "x", "size": 3}
+    fixes = {a["rule"]: v for n, v, a in counts if n == "quickfix.rule.fixes"}
+    assert fixes["llm-model-from-defaults"] == 1 and fixes["sequential-output-key"] == 1
+    assert {a["rule"] for n, v, a in counts if n == "lint.rule.findings"} == {"multi-parent", "parallel-fanout"}
+
+
+def test_stats_sink_records_errors_and_async():
+    stats = StatsSink()
+
+    def reg(kind, key, rng):
+        return {"version": "1.0.0"}
+
+    async def areg(kind, key, rng):
+        return {"version": "1.0.0"}
+
+    with use_sink(stats):
+        with pytest.raises(ValueError):
+            compose.load_config({"schema_version": "x"})
+        compose.plan_lock(_raw(), reg, lambda a: {"model": "m"})
+        asyncio.run(compose.plan_lock_async(_raw(), areg, lambda a: {"model": "m"}))
+    spans = stats.spans()
+    assert spans["compose.load_config"].calls == 1 and spans["compose.load_config"].errors == 1
+    assert spans["compose.plan_lock"].calls == 1 and spans["compose.plan_lock_async"].calls == 1
+    assert stats.counters()[("lock.registry_refs", ())] == 2
+
+
+class _FakeSpan:
+    def __init__(self, name, attributes):
+        self.name, self.attributes, self.events, self.error = name, dict(attributes), [], None
+
+    def set_attribute(self, k, v):
+        self.attributes[k] = v
+
+    def add_event(self, name, attributes=None):
+        self.events.append((name, attributes))
+
+
+class _FakeTracer:
+    def __init__(self):
+        self.finished = []
+
+    @contextmanager
+    def start_as_current_span(self, name, attributes=None):
+        s = _FakeSpan(name, attributes or {})
+        try:
+            yield s
+        except Exception as e:
+            s.error = e
+            raise
+        finally:
+            self.finished.append(s)
+
+
+def test_opentelemetry_adapter():
+    tracer = _FakeTracer()
+    with use_sink(OpenTelemetrySink(tracer)):
+        compose.get_quick_fixes(raw_cfg=_raw())
+        with pytest.raises(ValueError):
+            compose.load_config({"schema_version": "x"})
+    qf, bad = tracer.finished
+    assert qf.name == "compose.get_quick_fixes"
+    assert ("quickfix.rule.fixes", {"value": 1, "rule": "llm-model-from-defaults"}) in qf.events
+    assert bad.name == "compose.load_config" and isinstance(bad.error, ValueError)
+
+
+def test_concurrent_async_spans_keep_their_own_parents():
+    def resolvers(job):
+        async def areg(kind, key, rng):
+            await asyncio.sleep(0.001)
+            with tracing.span(f"resolve{job}"):
+                await asyncio.sleep(0.001)
+            return {"version": "1.0.0"}
+
+        return areg, lambda a: {"model": "m"}
+
+    async def job(i):
+        with tracing.span(f"job{i}"):
+            await asyncio.sleep(0)
+            return await compose.plan_lock_async(_raw(), *resolvers(i))
+
+    async def both():
+        return await asyncio.gather(job(0), job(1))
+
+    spans = []
+    with use_sink(CallbackSink(spans.append)):
+        asyncio.run(both())
+    parents = {}
+    for r in spans:
+        parents.setdefault(r.name, []).append(r.parent)
+    assert parents["job0"] == [None] and parents["job1"] == [None]
+    assert sorted(parents["compose.plan_lock_async"]) == ["job0", "job1"]
+    assert set(parents["resolve0"]) == set(parents["resolve1"]) == {"compose.plan_lock_async"}
+
+    tracer = _FakeTracer()
+    with use_sink(OpenTelemetrySink(tracer)):
+        asyncio.run(both())
+    locks = [s for s in tracer.finished if s.name == "compose.plan_lock_async"]
+    for s in locks:
+        assert [name for name, _ in s.events].count("lock.registry_refs") == 1